@@ -1,7 +1,16 @@
-"""tina - Terminal UI Network Analyzer"""
+"""tina - Terminal UI Network Analyzer
 
+Public exports are resolved lazily so that importing :mod:`tina` (for example
+from the CLI entry point) does not pull in NumPy, scikit-rf or PyVISA until an
+exported name is actually used.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _pkg_version
+from typing import TYPE_CHECKING, Any
 
 try:
     __version__ = _pkg_version("tui-vna")
@@ -9,11 +18,25 @@ except PackageNotFoundError:
     # Running without a uv/pip install (e.g. raw IDE launch without venv)
     __version__ = "0.0.0.dev0"
 
-from .config.settings import AppSettings, SettingsManager
-from .drivers import HPE5071B as VNA
-from .drivers import VNABase, VNAConfig
-from .utils import TouchstoneExporter
-from .worker import LogMessage, MeasurementWorker, MessageType
+if TYPE_CHECKING:
+    from .config.settings import AppSettings, SettingsManager
+    from .drivers import HPE5071B as VNA
+    from .drivers import VNABase, VNAConfig
+    from .utils import TouchstoneExporter
+    from .worker import LogMessage, MeasurementWorker, MessageType
+
+# Export name -> (submodule, attribute) resolved on first access.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "VNA": (".drivers", "HPE5071B"),
+    "VNABase": (".drivers", "VNABase"),
+    "VNAConfig": (".drivers", "VNAConfig"),
+    "TouchstoneExporter": (".utils", "TouchstoneExporter"),
+    "MeasurementWorker": (".worker", "MeasurementWorker"),
+    "MessageType": (".worker", "MessageType"),
+    "LogMessage": (".worker", "LogMessage"),
+    "SettingsManager": (".config.settings", "SettingsManager"),
+    "AppSettings": (".config.settings", "AppSettings"),
+}
 
 __all__ = [
     "VNA",
@@ -26,3 +49,19 @@ __all__ = [
     "SettingsManager",
     "AppSettings",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import and cache package-level exports on first access."""
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Expose lazy exports in interactive introspection."""
+    return sorted(set(globals()) | set(__all__))
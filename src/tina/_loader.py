@@ -69,7 +69,8 @@ def main() -> None:
     skip_bar = any(arg in sys.argv[1:] for arg in ("--help", "-h", "--now", "-n"))
 
     if skip_bar:
-        from .main import main as app_main
+        # Neither flag starts the GUI, so skip importing it altogether
+        from .cli.entry import main as app_main
 
         app_main()
         return
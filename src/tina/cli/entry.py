@@ -0,0 +1,29 @@
+"""Command-line entry point for tina.
+
+Parses the arguments and either runs a CLI measurement or starts the GUI.
+The GUI module (Textual, matplotlib, scikit-rf) is only imported when the
+GUI is actually launched, so ``tina --help`` and ``tina --now`` start fast.
+"""
+
+import sys
+
+from .parser import create_cli_parser
+
+
+def main():
+    """Main entry point."""
+    argv = sys.argv[1:]
+    parser = create_cli_parser(argv)
+    args = parser.parse_args(argv)
+
+    if args.now:
+        # CLI mode - quick measurement
+        from .runner import run_cli_measurement
+
+        return run_cli_measurement(args)
+    else:
+        # GUI mode
+        from ..main import run_gui
+
+        run_gui(test_updates=args.test_updates, dev_mode=args.dev)
+        return 0
@@ -1,15 +1,125 @@
 """Command-line argument parser for tina."""
 
 import argparse
+import dataclasses
+import functools
+from collections.abc import Sequence
 
 from .. import __version__
 from ..config.settings import AppSettings
 
+_DESCRIPTION = "tina - Terminal UI Network Analyzer"
 
-def create_cli_parser() -> argparse.ArgumentParser:
-    """Create command line argument parser."""
+# Arguments that can be handled without building the full parser.
+_QUICK_ARGS = frozenset({"-n", "--now"})
+
+# Defaults of every option the full parser defines besides --now. The quick
+# parser sets these so its namespace is interchangeable with the full one.
+_FULL_PARSER_DEFAULTS: dict[str, object] = {
+    "test_updates": False,
+    "dev": False,
+    "host": None,
+    "port": "inst0",
+    "timeout": None,
+    "start_freq": None,
+    "stop_freq": None,
+    "freq_unit": None,
+    "points": None,
+    "averaging": False,
+    "avg_count": None,
+    "set_freq_range": False,
+    "set_sweep_points": False,
+    "set_avg_count": False,
+    "output_folder": None,
+    "filename_prefix": None,
+    "s11": False,
+    "s21": False,
+    "s12": False,
+    "s22": False,
+    "all_sparams": False,
+    "plot_s11": False,
+    "plot_s21": False,
+    "plot_s12": False,
+    "plot_s22": False,
+    "plot_all": False,
+    "no_plots": False,
+}
+
+
+# (argparse dest, AppSettings field) pairs consumed by apply_cli_settings.
+# --timeout is accepted but not persisted in AppSettings.
+_VALUE_ARGS: tuple[tuple[str, str], ...] = (
+    ("start_freq", "start_freq_mhz"),
+    ("stop_freq", "stop_freq_mhz"),
+    ("points", "sweep_points"),
+    ("avg_count", "averaging_count"),
+)
+_TEXT_ARGS: tuple[tuple[str, str], ...] = (
+    ("host", "last_host"),
+    ("port", "last_port"),
+    ("freq_unit", "freq_unit"),
+    ("output_folder", "output_folder"),
+    ("filename_prefix", "filename_prefix"),
+)
+_FLAG_ARGS: tuple[tuple[str, str], ...] = (
+    ("averaging", "enable_averaging"),
+    ("set_freq_range", "set_freq_range"),
+    ("set_sweep_points", "set_sweep_points"),
+    ("set_avg_count", "set_averaging_count"),
+)
+_EXPORT_ARGS: tuple[tuple[str, str], ...] = (
+    ("s11", "export_s11"),
+    ("s21", "export_s21"),
+    ("s12", "export_s12"),
+    ("s22", "export_s22"),
+)
+_PLOT_ARGS: tuple[tuple[str, str], ...] = (
+    ("plot_s11", "plot_s11"),
+    ("plot_s21", "plot_s21"),
+    ("plot_s12", "plot_s12"),
+    ("plot_s22", "plot_s22"),
+)
+
+
+def _add_now_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the quick measurement flag shared by both parser variants."""
+    parser.add_argument(
+        "--now",
+        "-n",
+        action="store_true",
+        help="Quick measurement: use last settings to connect, measure, and save to s2p + png files",
+    )
+
+
+def create_cli_parser(
+    argv: Sequence[str] | None = None,
+) -> argparse.ArgumentParser:
+    """Create command line argument parser.
+
+    When *argv* is given and holds nothing but ``-n``/``--now``, a minimal
+    parser with the same namespace defaults is returned instead of building
+    every argument group. Otherwise the full parser is returned. Both
+    variants are built once per process and reused on later calls.
+    """
+    if argv is not None and all(arg in _QUICK_ARGS for arg in argv):
+        return _build_quick_parser()
+    return _build_full_parser()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_quick_parser() -> argparse.ArgumentParser:
+    """Build the minimal parser used for a bare ``tina`` / ``tina --now`` call."""
+    parser = argparse.ArgumentParser(description=_DESCRIPTION)
+    _add_now_argument(parser)
+    parser.set_defaults(**_FULL_PARSER_DEFAULTS)
+    return parser
+
+
+@functools.lru_cache(maxsize=1)
+def _build_full_parser() -> argparse.ArgumentParser:
+    """Build the full parser with every argument group."""
     parser = argparse.ArgumentParser(
-        description="tina - Terminal UI Network Analyzer",
+        description=_DESCRIPTION,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -35,12 +145,7 @@ Examples:
     )
 
     # Quick measurement option
-    parser.add_argument(
-        "--now",
-        "-n",
-        action="store_true",
-        help="Quick measurement: use last settings to connect, measure, and save to s2p + png files",
-    )
+    _add_now_argument(parser)
 
     # Developer options
     dev_group = parser.add_argument_group("developer options")
@@ -151,76 +256,36 @@ Examples:
 
 
 def apply_cli_settings(args: argparse.Namespace, settings: AppSettings) -> AppSettings:
-    """Apply CLI arguments to settings object."""
-    # Connection settings
-    if args.host:
-        settings.last_host = args.host
-    if args.port:
-        settings.last_port = args.port
-    if args.timeout:
-        # Convert to VNA config format if needed
-        pass
-
-    # Frequency settings
-    if args.start_freq is not None:
-        settings.start_freq_mhz = args.start_freq
-    if args.stop_freq is not None:
-        settings.stop_freq_mhz = args.stop_freq
-    if args.freq_unit:
-        settings.freq_unit = args.freq_unit
-
-    # Measurement settings
-    if args.points is not None:
-        settings.sweep_points = args.points
-    if args.averaging:
-        settings.enable_averaging = True
-    if args.avg_count is not None:
-        settings.averaging_count = args.avg_count
+    """Return a copy of *settings* with the CLI arguments in *args* applied.
 
-    # Override flags
-    if args.set_freq_range:
-        settings.set_freq_range = True
-    if args.set_sweep_points:
-        settings.set_sweep_points = True
-    if args.set_avg_count:
-        settings.set_averaging_count = True
-
-    # Output settings
-    if args.output_folder:
-        settings.output_folder = args.output_folder
-    if args.filename_prefix:
-        settings.filename_prefix = args.filename_prefix
+    The input settings object is left untouched.
+    """
+    overrides: dict[str, object] = {}
+
+    for arg_name, setting_name in _VALUE_ARGS:
+        value = getattr(args, arg_name, None)
+        if value is not None:
+            overrides[setting_name] = value
+
+    for arg_name, setting_name in _TEXT_ARGS:
+        value = getattr(args, arg_name, None)
+        if value:
+            overrides[setting_name] = value
+
+    for arg_name, setting_name in _FLAG_ARGS:
+        if getattr(args, arg_name, False):
+            overrides[setting_name] = True
 
     # S-parameter selection
-    if args.all_sparams:
-        settings.export_s11 = True
-        settings.export_s21 = True
-        settings.export_s12 = True
-        settings.export_s22 = True
-    else:
-        if args.s11:
-            settings.export_s11 = True
-        if args.s21:
-            settings.export_s21 = True
-        if args.s12:
-            settings.export_s12 = True
-        if args.s22:
-            settings.export_s22 = True
+    export_all = getattr(args, "all_sparams", False)
+    for arg_name, setting_name in _EXPORT_ARGS:
+        if export_all or getattr(args, arg_name, False):
+            overrides[setting_name] = True
 
     # Plot settings
-    if args.plot_all:
-        settings.plot_s11 = True
-        settings.plot_s21 = True
-        settings.plot_s12 = True
-        settings.plot_s22 = True
-    else:
-        if args.plot_s11:
-            settings.plot_s11 = True
-        if args.plot_s21:
-            settings.plot_s21 = True
-        if args.plot_s12:
-            settings.plot_s12 = True
-        if args.plot_s22:
-            settings.plot_s22 = True
-
-    return settings
+    plot_all = getattr(args, "plot_all", False)
+    for arg_name, setting_name in _PLOT_ARGS:
+        if plot_all or getattr(args, arg_name, False):
+            overrides[setting_name] = True
+
+    return dataclasses.replace(settings, **overrides)
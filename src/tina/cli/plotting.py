@@ -1,20 +1,36 @@
-"""CLI plotting utilities for tina."""
+"""CLI plotting utilities for tina.
 
-import os
+NumPy and matplotlib are only imported once a plot is actually exported, so
+importing the CLI package (e.g. for ``tina --help`` or ``--no-plots`` runs)
+does not pay their start-up cost.
+"""
+
+from __future__ import annotations
+
+import functools
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from ..config.settings import AppSettings
 
-import numpy as np
 
-from ..config.settings import AppSettings
-from ..utils.plotting import create_matplotlib_plot, get_plot_colors
+@functools.lru_cache(maxsize=1)
+def _cli_plot_colors() -> dict:
+    """Return the fallback (theme-less) plot colors used for CLI exports."""
+    from ..utils.plotting import get_plot_colors
+
+    return get_plot_colors(None)
 
 
 def export_plots_cli(
     frequencies: np.ndarray,
     s_parameters: dict[str, tuple[np.ndarray, np.ndarray]],
     settings: AppSettings,
-    output_path: str,
+    output_path: str | Path,
     base_filename: str,
 ) -> None:
     """Generate and export plots in CLI mode using same scaling as GUI."""
@@ -32,19 +48,23 @@ def export_plots_cli(
         print("No S-parameters selected for plotting")
         return
 
+    from ..utils import plotting
+
     render_scale = 2
     dpi = 150 * render_scale
-    plot_colors = get_plot_colors(None)
+    plot_colors = _cli_plot_colors()
+
+    output_dir = Path(output_path)
 
-    def _export_one(plot_type: str, file_path: str) -> bool:
+    def _export_one(plot_type: str, file_path: Path) -> bool:
         """Attempt one plot export; print success or stderr warning. Returns True on success."""
         try:
-            create_matplotlib_plot(
+            plotting.create_matplotlib_plot(
                 frequencies,
                 s_parameters,
                 plot_params,
                 plot_type=plot_type,
-                output_path=Path(file_path),
+                output_path=file_path,
                 dpi=dpi,
                 pixel_width=1920,
                 pixel_height=1080,
@@ -61,10 +81,8 @@ def export_plots_cli(
             return False
 
     results = [
-        _export_one(
-            "magnitude", os.path.join(output_path, f"{base_filename}_magnitude.png")
-        ),
-        _export_one("phase", os.path.join(output_path, f"{base_filename}_phase.png")),
+        _export_one("magnitude", output_dir / f"{base_filename}_magnitude.png"),
+        _export_one("phase", output_dir / f"{base_filename}_phase.png"),
     ]
     if not all(results):
         raise RuntimeError("One or more plot exports failed")
@@ -1,8 +1,8 @@
 """CLI measurement runner for tina."""
 
 import argparse
-import os
 import sys
+from pathlib import Path
 
 from ..config.migration import migrate_legacy_config
 from ..config.settings import AppSettings, SettingsManager
@@ -123,15 +123,21 @@ def run_cli_measurement(args: argparse.Namespace) -> int:
         )
         print(f"S2P file saved: {s2p_path}")
 
-        # Generate plots unless disabled
-        if not args.no_plots:
-            base_filename = os.path.splitext(os.path.basename(s2p_path))[0]
+        # Generate plots unless disabled or no trace is selected for plotting;
+        # checking here avoids loading matplotlib when only s2p is wanted.
+        plot_requested = (
+            settings.plot_s11
+            or settings.plot_s21
+            or settings.plot_s12
+            or settings.plot_s22
+        )
+        if not args.no_plots and plot_requested:
             export_plots_cli(
                 frequencies,
                 s_parameters,
                 settings,
-                settings.output_folder,
-                base_filename,
+                Path(settings.output_folder),
+                Path(s2p_path).stem,
             )
 
         print("Measurement complete!")
@@ -88,8 +88,12 @@ DEFAULT_GRID_COLOR = THEME_PANEL
 # SCPI response truncation
 SCPI_RESPONSE_TRUNCATE_LENGTH = 200
 
-# Message poll interval (seconds)
-MESSAGE_POLL_INTERVAL_SEC = 0.05
+# Most worker responses handled per notification, so a burst cannot stall input
+WORKER_RESPONSE_BATCH = 64
+
+# Worker idle wait for commands (seconds); doubles while idle up to the max
+WORKER_IDLE_WAIT_MIN_SEC = 0.1
+WORKER_IDLE_WAIT_MAX_SEC = 1.0
 
 # Worker thread shutdown timeout (seconds)
 WORKER_SHUTDOWN_TIMEOUT_SEC = 5.0
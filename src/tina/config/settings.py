@@ -14,6 +14,7 @@ application settings. UI-specific presentation helpers should live closer to
 the UI layer rather than in this persistence module.
 """
 
+import copy
 import warnings
 from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
@@ -27,6 +28,23 @@ _yaml = YAML()
 _yaml.default_flow_style = False
 _yaml.width = 4096  # prevent unwanted line wrapping
 
+# Parsed settings keyed by config path, tagged with the file's
+# (st_mtime_ns, st_size) so an unchanged file skips the YAML parse.
+_load_cache: dict[Path, tuple[tuple[int, int], "AppSettings"]] = {}
+
+# Round-trip YAML documents (with comments) last read or written per config
+# path, tagged the same way so save() can skip re-reading an unchanged file.
+_document_cache: dict[Path, tuple[tuple[int, int], CommentedMap]] = {}
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Return ``(st_mtime_ns, st_size)`` for *path*, or ``None`` if it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
 
 def _build_commented_map(data: dict) -> CommentedMap:
     """Wrap *data* in a CommentedMap with human-readable section headers."""
@@ -59,7 +77,7 @@ def _build_commented_map(data: dict) -> CommentedMap:
     return cm
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     """Application settings that persist across sessions."""
 
@@ -138,6 +156,7 @@ class SettingsManager:
 
     # Sane port defaults for VISA instruments
     DEFAULT_PORTS = ["inst0", "inst1", "inst2", "inst3", "hislip0", "gpib0,16"]
+    _DEFAULT_PORTS_SET = frozenset(DEFAULT_PORTS)
     MAX_PORT_HISTORY = 10
     MAX_HOST_HISTORY = 10
     MAX_TEMPLATE_HISTORY = 20
@@ -151,17 +170,31 @@ class SettingsManager:
         self._load_failed = False
 
     def load(self) -> AppSettings:
-        """Load settings from disk, returning defaults if the file is absent or corrupt."""
-        if not self.config_file.exists():
+        """Load settings from disk, returning defaults if the file is absent or corrupt.
+
+        Parsed results are cached per config path and reused while the file's
+        modification time and size are unchanged. Each call returns a fresh
+        copy, so callers may mutate the result freely.
+        """
+        signature = _file_signature(self.config_file)
+        if signature is None:
             self.settings.port_history = self.DEFAULT_PORTS.copy()
             return self.settings
 
+        cached = _load_cache.get(self.config_file)
+        if cached is not None and cached[0] == signature:
+            self.settings = copy.deepcopy(cached[1])
+            self._load_failed = False
+            return self.settings
+
         try:
             with open(self.config_file, encoding="utf-8") as f:
                 data = _yaml.load(f)
 
             if not isinstance(data, dict):
                 raise ValueError("Unexpected YAML structure")
+            if isinstance(data, CommentedMap):
+                _document_cache[self.config_file] = (signature, data)
 
             file_version = data.get("config_version")
             if file_version is not None and file_version != self.CONFIG_VERSION:
@@ -227,9 +260,11 @@ class SettingsManager:
                 "folder_template_history",
                 self.settings.folder_template,
             )
+            _load_cache[self.config_file] = (signature, copy.deepcopy(self.settings))
             return self.settings
 
         except Exception:
+            _load_cache.pop(self.config_file, None)
             self._load_failed = True
             self.settings = AppSettings()
             self.settings.port_history = self.DEFAULT_PORTS.copy()
@@ -267,7 +302,11 @@ class SettingsManager:
         data = {"config_version": self.CONFIG_VERSION, **asdict(self.settings)}
 
         existing = None
-        if self.config_file.exists():
+        signature = _file_signature(self.config_file)
+        cached_doc = _document_cache.pop(self.config_file, None)
+        if cached_doc is not None and cached_doc[0] == signature:
+            existing = cached_doc[1]
+        elif signature is not None:
             try:
                 with open(self.config_file, encoding="utf-8") as f:
                     loaded = _yaml.load(f)
@@ -288,6 +327,13 @@ class SettingsManager:
                 )
                 return
 
+        if existing is not None and all(
+            key in existing and existing[key] == value for key, value in data.items()
+        ):
+            # The file already holds these values; leave it untouched
+            _document_cache[self.config_file] = (signature, existing)
+            return
+
         if existing is None:
             existing = _build_commented_map(data)
 
@@ -295,27 +341,42 @@ class SettingsManager:
         for key, value in data.items():
             existing[key] = value
 
+        _load_cache.pop(self.config_file, None)
         with open(self.config_file, "w", encoding="utf-8") as f:
             _yaml.dump(existing, f)
 
+        new_signature = _file_signature(self.config_file)
+        if new_signature is not None:
+            _document_cache[self.config_file] = (new_signature, existing)
+
     def _merge_port_history(self) -> None:
         """Merge default ports with history, ensuring defaults are always present."""
         if not self.settings.port_history:
             self.settings.port_history = self.DEFAULT_PORTS.copy()
             return
 
+        self._ensure_default_ports()
+        self._trim_port_history()
+
+    def _ensure_default_ports(self) -> None:
+        """Append any default port missing from the history."""
+        present = set(self.settings.port_history)
         for default_port in self.DEFAULT_PORTS:
-            if default_port not in self.settings.port_history:
+            if default_port not in present:
                 self.settings.port_history.append(default_port)
 
-        if len(self.settings.port_history) > self.MAX_PORT_HISTORY:
-            custom_ports = [
-                p for p in self.settings.port_history if p not in self.DEFAULT_PORTS
-            ]
-            self.settings.port_history = (
-                self.DEFAULT_PORTS
-                + custom_ports[-(self.MAX_PORT_HISTORY - len(self.DEFAULT_PORTS)) :]
-            )
+    def _trim_port_history(self) -> None:
+        """Cap the history, keeping defaults plus the most recent custom ports."""
+        if len(self.settings.port_history) <= self.MAX_PORT_HISTORY:
+            return
+
+        custom_ports = [
+            p for p in self.settings.port_history if p not in self._DEFAULT_PORTS_SET
+        ]
+        self.settings.port_history = (
+            self.DEFAULT_PORTS
+            + custom_ports[: self.MAX_PORT_HISTORY - len(self.DEFAULT_PORTS)]
+        )
 
     def add_port_to_history(self, port: str) -> None:
         """Add a port to history (recent first, after defaults)."""
@@ -327,19 +388,19 @@ class SettingsManager:
         if port in self.settings.port_history:
             self.settings.port_history.remove(port)
 
-        if port in self.DEFAULT_PORTS:
+        if port in self._DEFAULT_PORTS_SET:
             insert_idx = 0
             for i, p in enumerate(self.settings.port_history):
-                if p in self.DEFAULT_PORTS:
+                if p in self._DEFAULT_PORTS_SET:
                     insert_idx = i + 1
             self.settings.port_history.insert(insert_idx, port)
         else:
             defaults_count = sum(
-                1 for p in self.settings.port_history if p in self.DEFAULT_PORTS
+                1 for p in self.settings.port_history if p in self._DEFAULT_PORTS_SET
             )
             self.settings.port_history.insert(defaults_count, port)
 
-        self._merge_port_history()
+        self._trim_port_history()
 
     def add_host_to_history(self, host: str) -> None:
         """Add a host IP to history (most recent first)."""
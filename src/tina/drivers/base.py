@@ -7,8 +7,12 @@ Each driver registers itself by implementing VNABase and providing
 an IDN pattern matcher.
 """
 
+from __future__ import annotations
+
+import functools
 import importlib
-import inspect
+import pkgutil
+import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -43,7 +47,7 @@ class IDNInfo:
     raw: str = ""
 
     @classmethod
-    def from_idn_string(cls, idn_string: str) -> "IDNInfo":
+    def from_idn_string(cls, idn_string: str) -> IDNInfo:
         """Parse a standard comma-separated SCPI *IDN? string.
 
         Splits the response on commas and strips surrounding whitespace from
@@ -152,6 +156,23 @@ class VNABase(ABC):
     # Subclasses should override this with their IDN detection function
     idn_matcher: Callable[[str], bool] | None = None
     driver_name: str = "Unknown"
+    # Optional compiled IDN pattern. Drivers that set it are matched by this
+    # pattern in detect_vna_driver instead of idn_matcher, so the two must agree.
+    idn_pattern: re.Pattern[str] | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Register concrete drivers defined in this package as they are created.
+
+        Only classes that provide an ``idn_matcher`` and live inside the
+        drivers package are registered, so test doubles and ad-hoc subclasses
+        elsewhere never take part in auto-detection.
+        """
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, "idn_matcher", None) is None:
+            return
+        if not cls.__module__.startswith(f"{__package__}."):
+            return
+        _DRIVER_REGISTRY[getattr(cls, "driver_name", cls.__name__)] = cls
 
     def __init__(self, config: VNAConfig | None = None):
         """
@@ -315,66 +336,76 @@ class VNABase(ABC):
         self.disconnect()
 
 
-# Driver registry - populated automatically by scanning drivers/ directory
+# Driver registry - populated by VNABase.__init_subclass__ as driver modules
+# in this package are imported
 _DRIVER_REGISTRY: dict[str, type[VNABase]] = {}
 
+# Modules in drivers/ that never define a driver
+_NON_DRIVER_MODULES = frozenset({"base", "__init__", "scpi_commands"})
+
+# Set once every driver module has been imported
+_DRIVERS_IMPORTED = False
+
 
 def discover_drivers() -> dict[str, type[VNABase]]:
     """
     Automatically discover and load all VNA drivers from the drivers/ directory.
 
-    Scans all Python files in drivers/, imports them, and finds all VNABase
-    subclasses that have an idn_matcher function defined.
+    Imports every driver module in drivers/ once; each VNABase subclass with
+    an idn_matcher registers itself on import. Later calls return the
+    registry without touching the filesystem.
 
     Returns:
         Dictionary mapping driver names to driver classes
     """
-    global _DRIVER_REGISTRY
+    global _DRIVERS_IMPORTED
 
-    if _DRIVER_REGISTRY:
-        # Already discovered
+    if _DRIVERS_IMPORTED:
         return _DRIVER_REGISTRY
 
-    drivers_dir = Path(__file__).parent
-
-    # Find all Python files except base.py and __init__.py
-    driver_files = [
-        f
-        for f in drivers_dir.glob("*.py")
-        if f.stem not in ("base", "__init__", "scpi_commands")
-    ]
-
-    for driver_file in driver_files:
-        module_name = f".{driver_file.stem}"
+    for module_info in pkgutil.iter_modules([str(Path(__file__).parent)]):
+        if module_info.name in _NON_DRIVER_MODULES:
+            continue
         try:
-            # Import the driver module
-            module = importlib.import_module(module_name, package=__package__)
-
-            # Find all VNABase subclasses in the module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if (
-                    issubclass(obj, VNABase)
-                    and obj is not VNABase
-                    and hasattr(obj, "idn_matcher")
-                    and obj.idn_matcher is not None
-                ):
-                    driver_name = getattr(obj, "driver_name", name)
-                    _DRIVER_REGISTRY[driver_name] = obj
-
+            importlib.import_module(f".{module_info.name}", package=__package__)
         except Exception:
             # Silently skip drivers that fail to load
             # You could add logging here if needed
             pass
 
+    _DRIVERS_IMPORTED = True
     return _DRIVER_REGISTRY
 
 
+@functools.lru_cache(maxsize=4)
+def _combined_idn_pattern(
+    drivers: tuple[type[VNABase], ...],
+) -> re.Pattern[str] | None:
+    """Union the idn_pattern of *drivers* into one case-insensitive regex.
+
+    The union only answers whether *any* pattern matches; it cannot name the
+    winning driver, because its leftmost match need not belong to the
+    earliest registered one.
+    """
+    alternatives = [
+        f"(?:{driver.idn_pattern.pattern})"
+        for driver in drivers
+        if driver.idn_pattern is not None
+    ]
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
 def detect_vna_driver(idn_string: str) -> type[VNABase] | None:
     """
     Detect the appropriate VNA driver from an IDN string.
 
-    Automatically discovers all drivers in the drivers/ folder and tests
-    each one's idn_matcher function to find a match.
+    Automatically discovers all drivers in the drivers/ folder and returns
+    the first one, in registration order, that accepts the IDN. Drivers with
+    an idn_pattern are tested against their pattern, and only when a single
+    pass of the combined regex has shown that some pattern matches; the
+    others are tried through their idn_matcher function.
 
     Args:
         idn_string: Response from *IDN? query
@@ -388,9 +419,17 @@ def detect_vna_driver(idn_string: str) -> type[VNABase] | None:
         >>>     vna = driver_class(config)
         >>>     vna.connect()
     """
-    drivers = discover_drivers()
+    drivers = tuple(discover_drivers().values())
+
+    combined = _combined_idn_pattern(drivers)
+    pattern_hit = combined is not None and combined.search(idn_string) is not None
 
-    for driver_name, driver_class in drivers.items():
+    for driver_class in drivers:
+        pattern = driver_class.idn_pattern
+        if pattern is not None:
+            if pattern_hit and pattern.search(idn_string):
+                return driver_class
+            continue
         try:
             if driver_class.idn_matcher and driver_class.idn_matcher(idn_string):
                 return driver_class
@@ -4,12 +4,17 @@ HP E5071B Vector Network Analyzer driver.
 Implements VNABase interface for HP/Agilent E5071B series VNAs.
 """
 
+from __future__ import annotations
+
+import functools
+import queue
+import re
 import socket
+import threading
 import time
-from typing import Any, Protocol, cast
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
 import numpy as np
-import pyvisa
 
 from ..config.constants import (
     COMMAND_TIMEOUT_MS,
@@ -32,7 +37,8 @@ from .scpi_commands import (
     CMD_INIT,
     CMD_INIT_CONTINUOUS_OFF,
     CMD_OPC,
-    CMD_SET_FORMAT_ASCII,
+    CMD_SET_BYTE_ORDER_SWAPPED,
+    CMD_SET_FORMAT_BINARY,
     CMD_SET_SWEEP_LINEAR,
     CMD_SET_TRIGGER_BUS,
     cmd_define_param,
@@ -45,13 +51,88 @@ from .scpi_commands import (
     cmd_set_param_count,
     cmd_set_sweep_points,
     cmd_set_trigger_source,
+    join_commands,
 )
 
-_VISA_EXC: tuple[type[Exception], ...] = (
-    ValueError,
-    OSError,
-    pyvisa.errors.VisaIOError,
-)
+if TYPE_CHECKING:
+    import pyvisa
+
+# Model field (second *IDN? field) of the whole E5071 series (E5071A/B/C)
+_IDN_PATTERN = re.compile(r"^[^,]*,\s*e5071", re.IGNORECASE)
+
+
+_S_PARAMETER_NAMES = ("S11", "S21", "S12", "S22")
+
+
+def _sdata_to_db_deg(
+    data: np.ndarray,
+    mag_out: np.ndarray | None = None,
+    phase_out: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert interleaved real/imag float64 data to magnitude (dB) and phase.
+
+    The last axis of *data* holds real/imaginary pairs, so a single trace or
+    a stack of traces can be converted in one pass. Every step writes into
+    the output buffers, so passing preallocated *mag_out*/*phase_out* makes
+    the conversion allocation-free.
+
+    Args:
+        data: C-contiguous float64 array with an even-length last axis
+        mag_out: Optional float64 buffer for the magnitude (one value per pair)
+        phase_out: Optional float64 buffer for the phase (one value per pair)
+
+    Returns:
+        Tuple of (magnitude_db, phase_deg) arrays, one value per pair
+    """
+    # Interleaved real/imag float64 pairs reinterpret as complex128 (no copy)
+    comp = data.view(np.complex128)
+
+    mag_db = np.hypot(comp.real, comp.imag, out=mag_out)
+    mag_db += LOG_EPSILON
+    np.log10(mag_db, out=mag_db)
+    mag_db *= 20.0
+
+    phase_deg = np.arctan2(comp.imag, comp.real, out=phase_out)
+    np.degrees(phase_deg, out=phase_deg)
+
+    return mag_db, phase_deg
+
+
+@functools.lru_cache(maxsize=1)
+def _resource_manager() -> pyvisa.ResourceManager:
+    """Return the process-wide VISA resource manager, creating it on first use.
+
+    Backend discovery is comparatively expensive, so reconnects reuse the
+    same manager. The pyvisa-py backend is preferred (faster, no NI-VISA
+    dependency) with the default backend as a fallback.
+    """
+    import pyvisa
+
+    try:
+        return pyvisa.ResourceManager("@py")
+    except Exception:
+        return pyvisa.ResourceManager()
+
+
+def _probe_port(address: str, port: int, timeout: float) -> bool:
+    """Return True if a TCP connection to *address*:*port* succeeds."""
+    try:
+        with socket.create_connection((address, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _visa_exceptions() -> tuple[type[Exception], ...]:
+    """Return the errors a failed status query may raise.
+
+    Built on first use so that importing the driver (e.g. during driver
+    discovery) does not pull in pyvisa.
+    """
+    import pyvisa
+
+    return (ValueError, OSError, pyvisa.errors.VisaIOError)
 
 
 class _VisaResourceProtocol(Protocol):
@@ -75,12 +156,23 @@ class _VisaResourceProtocol(Protocol):
         """Query a list of ASCII float values."""
         ...
 
+    def query_binary_values(
+        self,
+        command: str,
+        datatype: str = "f",
+        is_big_endian: bool = False,
+        container: Any = list,
+    ) -> Any:
+        """Query an IEEE 488.2 binary block of values."""
+        ...
+
 
 class HPE5071B(VNABase):
     """HP E5071B VNA controller."""
 
     # Driver registration - this is how the driver auto-discovery finds us
     driver_name = "HP E5071B"
+    idn_pattern = _IDN_PATTERN
 
     @staticmethod
     def idn_matcher(idn_string: str) -> bool:
@@ -93,17 +185,9 @@ class HPE5071B(VNABase):
         Returns:
             True if this driver supports the instrument
         """
-        idn_lower = idn_string.lower()
-        # Match HP, Agilent, or Keysight E5071 series
-        return any(
-            pattern in idn_lower
-            for pattern in [
-                "e5071",
-                "e5071a",
-                "e5071b",
-                "e5071c",
-            ]
-        )
+        # Match HP, Agilent, or Keysight E5071 series by the model field only,
+        # so a serial number or firmware string containing "E5071" can't match
+        return bool(_IDN_PATTERN.match(idn_string))
 
     def __init__(self, config: VNAConfig | None = None):
         """
@@ -114,6 +198,9 @@ class HPE5071B(VNABase):
         """
         super().__init__(config)
         self.inst: pyvisa.resources.Resource | None = None
+        # Point count of the axis read for the current sweep; traces read
+        # afterwards must have the same length
+        self._sweep_axis_points: int | None = None
 
     def _check_host_reachable(
         self, host: str, timeout: float = SOCKET_TIMEOUT_SEC
@@ -121,7 +208,10 @@ class HPE5071B(VNABase):
         """
         Quick check if host is reachable via TCP.
 
-        Tries VXI-11 portmapper (port 111) and SCPI raw socket (port 5025).
+        Resolves *host* to an IPv4 address once, then probes VXI-11
+        portmapper (port 111) and SCPI raw socket (port 5025) on that address
+        concurrently and returns as soon as either one accepts, so a filtered
+        port costs at most one timeout instead of one per port.
 
         Args:
             host: IP address or hostname
@@ -130,16 +220,34 @@ class HPE5071B(VNABase):
         Returns:
             True if host is reachable on any port
         """
-        for port in [VXI11_PORTMAPPER_PORT, SCPI_RAW_PORT]:
+        try:
+            # IPv4 only, like the Keysight driver: "localhost" or a dual-stack
+            # name could otherwise resolve to an IPv6 address first
+            infos = socket.getaddrinfo(
+                host, None, family=socket.AF_INET, type=socket.SOCK_STREAM
+            )
+        except socket.gaierror:
+            return False
+        address = infos[0][4][0]
+
+        ports = (VXI11_PORTMAPPER_PORT, SCPI_RAW_PORT)
+        results: queue.SimpleQueue[bool] = queue.SimpleQueue()
+
+        def probe(port: int) -> None:
+            """Probe one port and always report a result."""
+            reachable = False
             try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                    sock.settimeout(timeout)
-                    result = sock.connect_ex((host, port))
-                    if result == 0:
-                        return True
-            except OSError:
-                continue
-        return False
+                reachable = _probe_port(address, port, timeout)
+            finally:
+                results.put(reachable)
+
+        # Daemon threads: a probe still blocked on a filtered port ends on its
+        # own once its socket timeout expires and must not hold up exit
+        for port in ports:
+            threading.Thread(
+                target=probe, args=(port,), name=f"probe-{port}", daemon=True
+            ).start()
+        return any(results.get() for _ in ports)
 
     def connect(self, progress_callback=None) -> bool:
         """
@@ -169,12 +277,8 @@ class HPE5071B(VNABase):
             self._connected = False
             raise ConnectionError(f"Host {self.config.host} not reachable")
 
-        # Use pyvisa-py backend only (faster, no NI-VISA dependency)
         report("Initializing VISA...", 25)
-        try:
-            rm = pyvisa.ResourceManager("@py")
-        except Exception:
-            rm = pyvisa.ResourceManager()
+        rm = _resource_manager()
 
         report("Opening connection...", 50)
         try:
@@ -204,6 +308,7 @@ class HPE5071B(VNABase):
 
     def disconnect(self) -> None:
         """Disconnect from HP E5071B VNA."""
+        self._sweep_axis_points = None
         if self.inst:
             try:
                 self.inst.close()
@@ -223,16 +328,34 @@ class HPE5071B(VNABase):
         self._ensure_connected()
         cast(_VisaResourceProtocol, self.inst).write(command)
 
+    def _send_commands(self, commands: list[str]) -> None:
+        """Send several SCPI commands as one chained program message."""
+        self._send_command(join_commands(commands))
+
     def _query(self, command: str) -> str:
         """Send SCPI query and return response."""
         self._ensure_connected()
         return cast(_VisaResourceProtocol, self.inst).query(command)
 
     def _query_ascii_values(self, command: str) -> list[float]:
-        """Query ASCII values."""
+        """Query ASCII values.
+
+        The driver reads its traces as binary blocks, but this stays part of
+        the ScpiDriver primitives that LoggingVNAWrapper patches and logs.
+        """
         self._ensure_connected()
         return cast(_VisaResourceProtocol, self.inst).query_ascii_values(command)
 
+    def _query_binary_values(self, command: str) -> np.ndarray:
+        """Query a little-endian REAL64 binary block as a writable float64 array."""
+        self._ensure_connected()
+        data = cast(_VisaResourceProtocol, self.inst).query_binary_values(
+            command, datatype="d", is_big_endian=False, container=np.ndarray
+        )
+        # pyvisa returns a read-only view of the receive buffer; callers get
+        # an array they own, as they did with ASCII transfers
+        return np.array(data, dtype=np.float64)
+
     def get_current_parameters(self) -> dict[str, Any]:
         """
         Query current VNA settings.
@@ -257,30 +380,30 @@ class HPE5071B(VNABase):
 
         try:
             params["start_freq_hz"] = float(self._query(CMD_GET_FREQ_START).strip())
-        except _VISA_EXC:
+        except _visa_exceptions():
             params["start_freq_hz"] = None
 
         try:
             params["stop_freq_hz"] = float(self._query(CMD_GET_FREQ_STOP).strip())
-        except _VISA_EXC:
+        except _visa_exceptions():
             params["stop_freq_hz"] = None
 
         try:
             params["sweep_points"] = int(self._query(CMD_GET_SWEEP_POINTS).strip())
-        except _VISA_EXC:
+        except _visa_exceptions():
             params["sweep_points"] = None
 
         try:
             avg_state = self._query(CMD_GET_AVERAGING_STATE).strip()
             params["averaging_enabled"] = avg_state in ("1", "ON")
-        except _VISA_EXC:
+        except _visa_exceptions():
             params["averaging_enabled"] = None
 
         try:
             params["averaging_count"] = int(
                 self._query(CMD_GET_AVERAGING_COUNT).strip()
             )
-        except _VISA_EXC:
+        except _visa_exceptions():
             params["averaging_count"] = None
 
         return params
@@ -314,42 +437,42 @@ class HPE5071B(VNABase):
         try:
             raw = self._query(CMD_GET_CORRECTION_STATE).strip()
             status["cal_enabled"] = raw in ("1", "ON")
-        except _VISA_EXC:
+        except _visa_exceptions():
             status["cal_enabled"] = None
 
         try:
             raw = self._query(CMD_GET_CORRECTION_TYPE).strip()
             # Response may contain extra comma-separated fields; take first token only
             status["cal_type"] = raw.split(",")[0].strip()
-        except _VISA_EXC:
+        except _visa_exceptions():
             status["cal_type"] = None
 
         try:
             raw = self._query(CMD_GET_SMOOTHING_STATE).strip()
             status["smoothing_enabled"] = raw in ("1", "ON")
-        except _VISA_EXC:
+        except _visa_exceptions():
             status["smoothing_enabled"] = None
 
         try:
             status["smoothing_aperture"] = float(
                 self._query(CMD_GET_SMOOTHING_APERTURE).strip()
             )
-        except _VISA_EXC:
+        except _visa_exceptions():
             status["smoothing_aperture"] = None
 
         try:
             status["if_bandwidth_hz"] = float(self._query(CMD_GET_IF_BANDWIDTH).strip())
-        except _VISA_EXC:
+        except _visa_exceptions():
             status["if_bandwidth_hz"] = None
 
         try:
             status["port_power_dbm"] = float(self._query(CMD_GET_PORT_POWER).strip())
-        except _VISA_EXC:
+        except _visa_exceptions():
             status["port_power_dbm"] = None
 
         try:
             status["trigger_source"] = self._query(CMD_GET_TRIGGER_SOURCE).strip()
-        except _VISA_EXC:
+        except _visa_exceptions():
             status["trigger_source"] = None
 
         return status
@@ -357,54 +480,66 @@ class HPE5071B(VNABase):
     def configure_frequency(self) -> None:
         """Configure frequency range from config."""
         if self.config.set_freq_range:
-            self._send_command(cmd_set_freq_start(self.config.start_freq_hz))
-            self._send_command(cmd_set_freq_stop(self.config.stop_freq_hz))
-            time.sleep(0.5)
+            self._send_commands(
+                [
+                    cmd_set_freq_start(self.config.start_freq_hz),
+                    cmd_set_freq_stop(self.config.stop_freq_hz),
+                ]
+            )
+            self._sync()
 
     def configure_measurements(self) -> None:
         """Configure measurement settings (does not touch trigger/continuous mode)."""
-        # ASCII data format
-        self._send_command(CMD_SET_FORMAT_ASCII)
-
-        # Linear sweep
-        self._send_command(CMD_SET_SWEEP_LINEAR)
+        commands = [
+            # 64-bit binary data format, little-endian so it maps straight
+            # onto native float64 arrays
+            CMD_SET_FORMAT_BINARY,
+            CMD_SET_BYTE_ORDER_SWAPPED,
+            # Linear sweep
+            CMD_SET_SWEEP_LINEAR,
+        ]
 
         # Sweep points
         if self.config.set_sweep_points:
-            self._send_command(cmd_set_sweep_points(self.config.sweep_points))
+            commands.append(cmd_set_sweep_points(self.config.sweep_points))
 
         # Averaging
-        self._send_command(cmd_set_averaging_state(self.config.enable_averaging))
+        commands.append(cmd_set_averaging_state(self.config.enable_averaging))
 
         # Averaging count (only if override enabled)
         if self.config.set_averaging_count:
-            self._send_command(cmd_set_averaging_count(self.config.averaging_count))
+            commands.append(cmd_set_averaging_count(self.config.averaging_count))
 
-        time.sleep(0.5)
+        self._send_commands(commands)
+        self._sync()
 
     def setup_s_parameters(self) -> None:
         """Setup S-parameter measurements (S11, S21, S12, S22)."""
-        # Set parameter count to 4
-        self._send_command(cmd_set_param_count(4))
-        time.sleep(0.3)
-
-        # Define each S-parameter
-        sparams = ["S11", "S21", "S12", "S22"]
-        for idx, param in enumerate(sparams, start=1):
-            self._send_command(cmd_define_param(idx, param))
-            time.sleep(0.2)
-            self._send_command(cmd_select_param(idx))
-            time.sleep(0.1)
+        # Set parameter count to 4, then define each S-parameter
+        commands = [cmd_set_param_count(len(_S_PARAMETER_NAMES))]
+        for idx, param in enumerate(_S_PARAMETER_NAMES, start=1):
+            commands.append(cmd_define_param(idx, param))
+            commands.append(cmd_select_param(idx))
 
         # Select first parameter as active
-        self._send_command(cmd_select_param(1))
-        time.sleep(0.1)
+        commands.append(cmd_select_param(1))
+
+        self._send_commands(commands)
+        self._sync()
+
+    def _sync(self) -> None:
+        """Block until the instrument has processed every command sent so far.
+
+        Used after a block of configuration commands in place of fixed
+        settling delays.
+        """
+        self._wait_for_operation_complete(OPERATION_TIMEOUT_SEC)
 
     def _wait_for_operation_complete(
         self, timeout_seconds: float = OPERATION_TIMEOUT_SEC
     ) -> None:
         """
-        Wait for VNA operation to complete using *OPC? query.
+        Wait for VNA operation to complete by polling the *OPC? query.
 
         Args:
             timeout_seconds: Maximum time to wait for completion
@@ -441,7 +576,7 @@ class HPE5071B(VNABase):
             source: Trigger source (INT, MAN, EXT, BUS)
         """
         self._send_command(cmd_set_trigger_source(source))
-        time.sleep(0.1)
+        self._sync()
 
     def save_trigger_state(self) -> tuple[str, bool]:
         """
@@ -463,10 +598,10 @@ class HPE5071B(VNABase):
             state: Tuple of (trigger_source, continuous_mode) from save_trigger_state()
         """
         trigger, continuous = state
-        self._send_command(cmd_set_trigger_source(trigger))
-        time.sleep(0.1)
-        self._send_command(cmd_set_init_continuous(continuous))
-        time.sleep(0.1)
+        self._send_commands(
+            [cmd_set_trigger_source(trigger), cmd_set_init_continuous(continuous)]
+        )
+        self._sync()
 
     def trigger_sweep(self) -> None:
         """
@@ -481,21 +616,21 @@ class HPE5071B(VNABase):
         3. Triggers a new sweep
         4. Waits for completion
         """
-        # Abort any ongoing measurement to start fresh
-        self._send_command(CMD_ABORT)
-        time.sleep(0.2)
-
-        # Set to single sweep mode (continuous OFF) with BUS trigger
-        self._send_command(CMD_INIT_CONTINUOUS_OFF)
-        time.sleep(0.1)
-        self._send_command(CMD_SET_TRIGGER_BUS)
-        time.sleep(0.1)
+        self._send_commands(
+            [
+                # Abort any ongoing measurement to start fresh
+                CMD_ABORT,
+                # Set to single sweep mode (continuous OFF) with BUS trigger
+                CMD_INIT_CONTINUOUS_OFF,
+                CMD_SET_TRIGGER_BUS,
+                # Trigger new measurement
+                CMD_INIT,
+                CMD_BUS_TRIGGER,
+            ]
+        )
 
-        # Trigger new measurement
-        self._send_command(CMD_INIT)
-        time.sleep(0.1)
-        self._send_command(CMD_BUS_TRIGGER)
-        time.sleep(0.1)
+        # The axis of a previous sweep says nothing about this one
+        self._sweep_axis_points = None
 
         # Wait for sweep completion
         self._wait_for_operation_complete(timeout_seconds=SWEEP_TIMEOUT_SEC)
@@ -504,59 +639,87 @@ class HPE5071B(VNABase):
         """
         Get frequency axis points.
 
+        The axis is always read back from the instrument, which may have
+        clamped the requested range or point count or be set to a log or
+        segment sweep. Its length is checked against the traces read next.
+
         Returns:
             Numpy array of frequencies in Hz
         """
-        freqs = self._query_ascii_values(CMD_GET_FREQ_DATA)
-        return np.array(freqs, dtype=float)
-
-    def get_sparam_data(self, param_num: int) -> tuple[np.ndarray, np.ndarray]:
-        """
-        Get S-parameter data for a specific parameter.
+        freqs = self._query_binary_values(CMD_GET_FREQ_DATA)
+        self._sweep_axis_points = len(freqs)
+        return freqs
 
-        Args:
-            param_num: Parameter number (1-4 for S11, S21, S12, S22)
+    def _query_sdata(self) -> np.ndarray:
+        """Read the selected trace as interleaved real/imaginary float64 values.
 
-        Returns:
-            Tuple of (magnitude_db, phase_deg) numpy arrays
+        Raises:
+            ValueError: If the response is empty, not made of whole pairs, or
+                not as long as the frequency axis read for this sweep
         """
-        self._send_command(cmd_select_param(param_num))
-        time.sleep(0.1)
-
-        # Query complex data (real/imag pairs)
-        data = self._query_ascii_values(CMD_GET_SDATA)
+        data = np.ascontiguousarray(
+            self._query_binary_values(CMD_GET_SDATA), dtype=np.float64
+        )
 
         # Validate response: must be a non-empty interleaved real/imag pair stream.
-        if not data or len(data) % 2 != 0:
+        if data.size == 0 or data.size % 2 != 0:
             raise ValueError(
                 f"{CMD_GET_SDATA} returned an unexpected number of values "
                 f"({len(data)}); expected a non-empty even count of "
                 "interleaved real/imaginary pairs"
             )
+        if (
+            self._sweep_axis_points is not None
+            and data.size // 2 != self._sweep_axis_points
+        ):
+            raise ValueError(
+                f"{CMD_GET_SDATA} returned {data.size // 2} points but the "
+                f"frequency axis has {self._sweep_axis_points}"
+            )
+        return data
+
+    def get_sparam_data(self, param_num: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get S-parameter data for a specific parameter.
 
-        # Parse real and imaginary parts
-        real = np.array(data[0::2])
-        imag = np.array(data[1::2])
+        Args:
+            param_num: Parameter number (1-4 for S11, S21, S12, S22)
 
-        # Convert to magnitude (dB) and phase (degrees)
-        comp = real + 1j * imag
-        mag_db = 20 * np.log10(np.abs(comp) + LOG_EPSILON)
-        phase_deg = np.angle(comp, deg=True)
+        Returns:
+            Tuple of (magnitude_db, phase_deg) numpy arrays
+        """
+        self._send_command(cmd_select_param(param_num))
 
-        return mag_db, phase_deg
+        return _sdata_to_db_deg(self._query_sdata())
 
     def get_all_sparameters(self) -> dict[str, tuple[np.ndarray, np.ndarray]]:
         """
         Get all S-parameter data.
 
+        All four traces come from the same sweep, so they are read back to
+        back without settling delays and converted in a single vectorized
+        pass. The results share one freshly allocated block per call, because
+        callers hold on to them after the next sweep starts.
+
         Returns:
             Dictionary with keys 'S11', 'S21', 'S12', 'S22'
             and values as (magnitude_db, phase_deg) tuples
         """
-        sparams = {}
-        param_names = ["S11", "S21", "S12", "S22"]
+        traces = []
+        for idx in range(1, len(_S_PARAMETER_NAMES) + 1):
+            self._send_command(cmd_select_param(idx))
+            traces.append(self._query_sdata())
 
-        for idx, name in enumerate(param_names, start=1):
-            sparams[name] = self.get_sparam_data(idx)
+        if len({trace.size for trace in traces}) != 1:
+            raise ValueError(
+                f"{CMD_GET_SDATA} returned traces of different lengths "
+                f"({', '.join(str(trace.size) for trace in traces)})"
+            )
 
-        return sparams
+        data = np.stack(traces)
+        results = np.empty((2, len(traces), data.shape[1] // 2), dtype=np.float64)
+        mag_db, phase_deg = _sdata_to_db_deg(data, results[0], results[1])
+        return {
+            name: (mag_db[row], phase_deg[row])
+            for row, name in enumerate(_S_PARAMETER_NAMES)
+        }
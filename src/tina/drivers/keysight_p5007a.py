@@ -6,12 +6,12 @@ Implements the VNABase interface for the Keysight P5007A 2-port PNA-family VNA.
 from __future__ import annotations
 
 import logging
+import re
 import socket
 import time
-from typing import Any, Protocol, cast
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
 import numpy as np
-import pyvisa
 
 from ..config.constants import (
     COMMAND_TIMEOUT_MS,
@@ -25,6 +25,11 @@ from ..config.constants import (
 from .base import VNABase, VNAConfig
 from .scpi_commands import CMD_BUS_TRIGGER
 
+if TYPE_CHECKING:
+    import pyvisa
+
+_IDN_PATTERN = re.compile(r"p5007a", re.IGNORECASE)
+
 
 class _VisaResourceProtocol(Protocol):
     """Subset of VISA resource methods used by the Keysight driver."""
@@ -43,8 +48,8 @@ class _VisaResourceProtocol(Protocol):
         """Send a SCPI query and return the response."""
         ...
 
-    def query_ascii_values(self, command: str) -> list[float]:
-        """Query a list of ASCII float values."""
+    def query_ascii_values(self, command: str, container: Any = list) -> Any:
+        """Query ASCII float values into *container*."""
         ...
 
 
@@ -53,11 +58,12 @@ class KeysightP5007A(VNABase):
 
     driver_name = "Keysight P5007A"
     _S_PARAMETER_NAMES = ("S11", "S21", "S12", "S22")
+    idn_pattern = _IDN_PATTERN
 
     @staticmethod
     def idn_matcher(idn_string: str) -> bool:
         """Return True when the IDN string identifies a P5007A."""
-        return "p5007a" in idn_string.lower()
+        return _IDN_PATTERN.search(idn_string) is not None
 
     def __init__(self, config: VNAConfig | None = None):
         """Initialize the Keysight P5007A driver."""
@@ -110,6 +116,8 @@ class KeysightP5007A(VNABase):
             raise ConnectionError(f"Host {self.config.host} not reachable")
 
         report("Initializing VISA...", 25)
+        import pyvisa
+
         try:
             resource_manager = pyvisa.ResourceManager("@py")
         except Exception as exc:
@@ -172,10 +180,17 @@ class KeysightP5007A(VNABase):
         self._ensure_connected()
         return cast(_VisaResourceProtocol, self.inst).query(command)
 
-    def _query_ascii_values(self, command: str) -> list[float]:
-        """Query a comma-separated numeric response as floats."""
+    def _query_ascii_values(self, command: str) -> np.ndarray:
+        """Query a comma-separated numeric response as a float64 array.
+
+        pyvisa splits the response on its separator and strips the
+        termination; the values come back in a NumPy array instead of a list.
+        """
         self._ensure_connected()
-        return cast(_VisaResourceProtocol, self.inst).query_ascii_values(command)
+        values = cast(_VisaResourceProtocol, self.inst).query_ascii_values(
+            command, container=np.array
+        )
+        return np.ascontiguousarray(values, dtype=np.float64)
 
     def _query_first_successful(self, *commands: str) -> str:
         """Try several SCPI queries and return the first successful response."""
@@ -347,6 +362,8 @@ class KeysightP5007A(VNABase):
         Sets the VISA timeout to exactly timeout_seconds so the blocking *OPC?
         query respects the advertised deadline without overrunning it.
         """
+        import pyvisa
+
         self._ensure_connected()
         resource = cast(_VisaResourceProtocol, self.inst)
         original_timeout = resource.timeout
@@ -437,9 +454,7 @@ class KeysightP5007A(VNABase):
                 "real/imaginary pairs"
             )
 
-        real = np.array(data[0::2], dtype=float)
-        imag = np.array(data[1::2], dtype=float)
-        complex_data = real + 1j * imag
+        complex_data = data.view(np.complex128)
 
         magnitude_db = 20 * np.log10(np.abs(complex_data) + LOG_EPSILON)
         phase_deg = np.angle(complex_data, deg=True)
@@ -5,6 +5,14 @@ This module centralizes all SCPI commands used to control VNAs,
 making it easier to maintain and adapt for different instruments.
 """
 
+from collections.abc import Iterable
+from functools import lru_cache
+
+# Parameterized builders below are cached: a session only ever uses a handful
+# of argument values, so repeated configure/measure cycles reuse the same
+# command strings instead of formatting new ones.
+_BUILDER_CACHE_SIZE = 64
+
 # Standard SCPI commands (IEEE 488.2)
 CMD_IDN = "*IDN?"
 CMD_OPC = "*OPC?"
@@ -13,9 +21,30 @@ CMD_CLEAR_STATUS = "*CLS"  # Clears error queue and status registers
 CMD_BUS_TRIGGER = "*TRG"
 CMD_GET_SYSTEM_ERROR = "SYST:ERR?"
 
+
+def join_commands(commands: Iterable[str]) -> str:
+    """
+    Chain several SCPI commands into one program message.
+
+    Subsystem commands are prefixed with ``:`` so each one is parsed from the
+    root of the command tree rather than relative to the previous header.
+
+    Args:
+        commands: SCPI commands to send together
+
+    Returns:
+        Single ``;``-separated program message
+    """
+    return ";".join(
+        command if command.startswith((":", "*")) else f":{command}"
+        for command in commands
+    )
+
+
 # Data format commands
 CMD_SET_FORMAT_ASCII = "FORM:DATA ASCII"
-CMD_SET_FORMAT_BINARY = "FORM:DATA REAL"
+CMD_SET_FORMAT_BINARY = "FORM:DATA REAL"  # 64-bit IEEE 754 block transfer
+CMD_SET_BYTE_ORDER_SWAPPED = "FORM:BORD SWAP"  # Little-endian binary blocks
 
 # Sweep control commands
 CMD_GET_INIT_CONTINUOUS = "INIT1:CONT?"
@@ -25,6 +54,7 @@ CMD_ABORT = "ABOR"
 CMD_INIT = "INIT1"
 
 
+@lru_cache(maxsize=_BUILDER_CACHE_SIZE, typed=True)
 def cmd_set_init_continuous(state: bool) -> str:
     """
     Set continuous initiation mode.
@@ -48,11 +78,13 @@ CMD_GET_FREQ_STOP = "SENS1:FREQ:STOP?"
 CMD_GET_FREQ_DATA = "SENS1:FREQ:DATA?"
 
 
+@lru_cache(maxsize=_BUILDER_CACHE_SIZE, typed=True)
 def cmd_set_freq_start(freq_hz: float) -> str:
     """Set start frequency."""
     return f"SENS1:FREQ:STAR {freq_hz}"
 
 
+@lru_cache(maxsize=_BUILDER_CACHE_SIZE, typed=True)
 def cmd_set_freq_stop(freq_hz: float) -> str:
     """Set stop frequency."""
     return f"SENS1:FREQ:STOP {freq_hz}"
@@ -62,6 +94,7 @@ def cmd_set_freq_stop(freq_hz: float) -> str:
 CMD_GET_SWEEP_POINTS = "SENS1:SWE:POIN?"
 
 
+@lru_cache(maxsize=_BUILDER_CACHE_SIZE, typed=True)
 def cmd_set_sweep_points(points: int) -> str:
     """Set number of sweep points."""
     return f"SENS1:SWE:POIN {points}"
@@ -72,28 +105,33 @@ CMD_GET_AVERAGING_STATE = "SENS1:AVER:STAT?"
 CMD_GET_AVERAGING_COUNT = "SENS1:AVER:COUN?"
 
 
+@lru_cache(maxsize=_BUILDER_CACHE_SIZE, typed=True)
 def cmd_set_averaging_state(enabled: bool) -> str:
     """Set averaging on/off."""
     state = "ON" if enabled else "OFF"
     return f"SENS1:AVER:STAT {state}"
 
 
+@lru_cache(maxsize=_BUILDER_CACHE_SIZE, typed=True)
 def cmd_set_averaging_count(count: int) -> str:
     """Set averaging count."""
     return f"SENS1:AVER:COUN {count}"
 
 
 # Parameter configuration commands
+@lru_cache(maxsize=_BUILDER_CACHE_SIZE, typed=True)
 def cmd_set_param_count(count: int) -> str:
     """Set number of measurement parameters."""
     return f"CALC1:PAR:COUN {count}"
 
 
+@lru_cache(maxsize=_BUILDER_CACHE_SIZE, typed=True)
 def cmd_define_param(param_num: int, sparam: str) -> str:
     """Define a measurement parameter (e.g., S11, S21)."""
     return f"CALC1:PAR{param_num}:DEF {sparam}"
 
 
+@lru_cache(maxsize=_BUILDER_CACHE_SIZE, typed=True)
 def cmd_select_param(param_num: int) -> str:
     """Select a parameter as active."""
     return f"CALC1:PAR{param_num}:SEL"
@@ -111,6 +149,7 @@ CMD_SET_TRIGGER_EXTERNAL = "TRIG:SOUR EXT"
 CMD_SET_TRIGGER_BUS = "TRIG:SOUR BUS"
 
 
+@lru_cache(maxsize=_BUILDER_CACHE_SIZE, typed=True)
 def cmd_set_trigger_source(source: str) -> str:
     """
     Set trigger source.
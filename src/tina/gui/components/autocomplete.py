@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Protocol, cast
 
@@ -53,7 +53,7 @@ class HistoryReplaceAutoComplete(AutoComplete):
     def __init__(
         self,
         target: Input | str,
-        get_choices: Callable[[], list[AutocompleteChoice]],
+        get_choices: Callable[[], Sequence[AutocompleteChoice]],
         **kwargs,
     ) -> None:
         """Initialise with a target input and a callable that provides choices."""
@@ -8,6 +8,7 @@ solely to preserve legacy import paths.  All real type declarations live here.
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any, TypedDict
@@ -18,6 +19,9 @@ except ImportError:  # Python < 3.11
     from typing_extensions import NotRequired  # type: ignore[assignment]
 
 import numpy as np
+from PIL import Image
+from rich.style import Style
+from rich.text import Text
 
 from ...config.settings import AppSettings, SettingsManager
 from ...drivers import VNAConfig
@@ -68,6 +72,7 @@ class GUIAppTypingMixin:
     _status_poll_in_flight: bool
     _debug_scpi: bool
     _minimal_export_mode: bool
+    _export_buttons_mode: bool | None
     last_measurement: MeasurementRecord | None
     _measurement_plot_cache: dict[tuple[object, ...], object]
     _measurement_plot_cache_measurement_id: int | None
@@ -81,13 +86,15 @@ class GUIAppTypingMixin:
     _manual_export_jobs_in_flight: int
     measurement_notes: str
     last_output_path: str | None
-    last_plot_path: Path | None
-    log_messages: list[LogEntry]
-    _message_check_timer: Any | None
+    last_plot_image: Image.Image | None
+    log_messages: deque[LogEntry]
+    _pending_log_lines: list[Text]
+    _log_filter_cache: dict[str, bool] | None
     _resize_timer: Any | None
-    _path_update_timer: Any | None
     _plot_refresh_timer: Any | None
     _poll_timer: Any | None
+    _tk_root: Any | None
+    _output_label_state: tuple[int, str] | None
     _filename_template_validation: object | None
     _folder_template_validation: object | None
     _tools_cursor1_hz: float | None
@@ -96,7 +103,6 @@ class GUIAppTypingMixin:
     _tools_cursor1_smoothing: bool
     _tools_cursor2_minima: bool
     _tools_cursor2_smoothing: bool
-    _tools_resize_timer: Any | None
     _tools_input_timer: Any | None
     _tools_plot_generation: int
     _tools_plot_cache_key: tuple[object, ...] | None
@@ -118,7 +124,8 @@ class GUIAppTypingMixin:
     terminal_program: str
     title: str
     sub_title: str
-    _cached_style_map: dict[str, tuple[str, str]] | None
+    _cached_style_map: dict[str, tuple[str, Style]] | None
+    _cached_plot_colors: dict | None
 
     def query_one(self, selector: str, *args: object) -> Any:
         """Return the first widget matching ``selector``, optionally typed by ``args``."""
@@ -2,6 +2,7 @@
 
 from tina.utils.plotting import (  # noqa: F401
     create_matplotlib_plot,
+    get_plot_temp_dir,
     get_terminal_font,
 )
 from tina.utils.signal import calculate_plot_range_with_outlier_filtering, unwrap_phase
@@ -13,6 +14,7 @@ from .colors import (
     SPARAM_FALLBACK_COLORS,
     SPARAM_THEME_KEYS,
     TRACE_COLOR_DEFAULT,
+    get_app_plot_colors,
     get_plot_colors,
     hex_to_rgb,
 )
@@ -29,7 +31,9 @@ __all__ = [
     "calculate_plot_range_with_outlier_filtering",
     "create_matplotlib_plot",
     "create_smith_chart",
+    "get_app_plot_colors",
     "get_plot_colors",
+    "get_plot_temp_dir",
     "get_terminal_font",
     "hex_to_rgb",
     "truncate_path_intelligently",
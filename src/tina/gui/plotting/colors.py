@@ -1,7 +1,8 @@
 """Plot color helpers for the TINA GUI.
 
-All implementations live in :mod:`tina.utils.plotting`; this module
-re-exports them for backward compatibility.
+The GUI-independent helpers live in :mod:`tina.utils.plotting` and are
+re-exported here for backward compatibility; only the app-bound color cache
+is defined in this module.
 """
 
 from tina.utils.plotting import (  # noqa: F401
@@ -14,3 +15,23 @@ from tina.utils.plotting import (  # noqa: F401
     get_plot_colors,
     hex_to_rgb,
 )
+
+
+def get_app_plot_colors(app) -> dict:
+    """
+    Return the plotting color scheme for an app's current theme.
+
+    The scheme is built from ``app.get_css_variables()`` on first use and kept
+    in ``app._cached_plot_colors`` until a theme change resets it to None.
+
+    Parameters:
+        app: The Textual app whose theme variables supply the colors.
+
+    Returns:
+        The dictionary produced by :func:`get_plot_colors`.
+    """
+    colors = getattr(app, "_cached_plot_colors", None)
+    if not isinstance(colors, dict):
+        colors = get_plot_colors(app.get_css_variables())
+        app._cached_plot_colors = colors
+    return colors
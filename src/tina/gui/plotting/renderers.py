@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import weakref
+from dataclasses import dataclass
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
 import skrf as rf
 from matplotlib import rc_context
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.font_manager import FontProperties
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox
+from PIL import Image
 
 from tina.utils.plotting import (
+    _render_lock,
+    _reused_figure,
+    _write_figure,
     create_matplotlib_plot,
     get_plot_colors,
     get_terminal_font,
 )
+from tina.utils.signal import db_deg_to_complex
 
 __all__ = [
     "create_matplotlib_plot",
@@ -22,11 +33,68 @@ __all__ = [
 ]
 
 
+@dataclass(frozen=True)
+class _SmithGrid:
+    """Grid artists drawn by scikit-rf on a pooled axes, and its view state."""
+
+    artists: tuple[Artist, ...]
+    texts: tuple[Text, ...]
+    data_lim: Bbox
+    xlim: tuple[float, float]
+    ylim: tuple[float, float]
+    autoscale: tuple[bool, bool]
+
+
+# Smith grids live on pooled axes; an entry goes away with its figure
+_smith_grids: weakref.WeakKeyDictionary[Axes, _SmithGrid] = weakref.WeakKeyDictionary()
+
+
+def _prepare_smith_grid(ax: Axes) -> _SmithGrid:
+    """Draw the Smith grid on *ax*, or strip a pooled axes back to its grid.
+
+    Building the grid's circles and labels is the same for every render, so
+    a pooled axes keeps them and only the per-render artists are removed.
+    """
+    grid = _smith_grids.get(ax)
+    if grid is None:
+        ax.clear()
+        rf.plotting.smith(
+            ax=ax,
+            chart_type="z",
+            draw_labels=True,
+            ref_imm=50.0,
+            draw_vswr=None,
+        )
+        grid = _SmithGrid(
+            artists=(*ax.lines, *ax.patches, *ax.collections, *ax.texts),
+            texts=tuple(ax.texts),
+            data_lim=ax.dataLim.frozen(),
+            xlim=ax.get_xlim(),
+            ylim=ax.get_ylim(),
+            autoscale=(ax.get_autoscalex_on(), ax.get_autoscaley_on()),
+        )
+        _smith_grids[ax] = grid
+        return grid
+
+    keep = {id(artist) for artist in grid.artists}
+    for artist in (*ax.lines, *ax.patches, *ax.collections, *ax.texts):
+        if id(artist) not in keep:
+            artist.remove()
+    if ax.legend_ is not None:
+        ax.legend_.remove()
+    ax.dataLim.set(grid.data_lim)
+    ax.set_xlim(grid.xlim)
+    ax.set_ylim(grid.ylim)
+    ax.set_autoscalex_on(grid.autoscale[0])
+    ax.set_autoscaley_on(grid.autoscale[1])
+    return grid
+
+
 def create_smith_chart(
     freqs: np.ndarray,
     sparams: dict,
     plot_params: list,
-    output_path: Path,
+    output_path: Path | None,
     dpi: int = 150,
     pixel_width: int | None = None,
     pixel_height: int | None = None,
@@ -36,7 +104,7 @@ def create_smith_chart(
     font_family: str | None = None,
     font_size: float | None = None,
     plot_data: dict | None = None,
-) -> None:
+) -> Image.Image | None:
     """Create a Smith chart using scikit-rf with dark theme matching terminal UI.
 
     Args:
@@ -49,7 +117,8 @@ def create_smith_chart(
             plotting.  Ignored for any parameter whose name appears as a key in
             *plot_data*.
         plot_params: List of S-parameter names to render on the chart.
-        output_path: File path where the chart image will be written (PNG).
+        output_path: File path where the chart image will be written (PNG),
+            or ``None`` to skip the file and return the rendered RGBA image.
         dpi: Dots per inch for the output image (default 150).
         pixel_width: Desired output width in pixels.  Must be provided together
             with *pixel_height*; omit both to use the default 10×10-inch canvas.
@@ -70,6 +139,9 @@ def create_smith_chart(
             magnitude+phase-to-complex conversion from *sparams*) and takes
             precedence over the corresponding *sparams* entry.  Pass ``None``
             (default) to always derive complex values from *sparams*.
+
+    Returns:
+        The rendered RGBA image when *output_path* is ``None``, else ``None``.
     """
     if font_family is None or font_size is None:
         detected_family, detected_size = get_terminal_font()
@@ -103,169 +175,150 @@ def create_smith_chart(
                 f"freqs={len(freqs)}, mag_db={len(mag_db)}, phase_deg={len(phase_deg)}"
             )
 
-    with rc_context({"font.family": font_family}):
+    with _render_lock, rc_context({"font.family": font_family}):
         base_size = (font_size if font_size else 10.0) / render_scale
 
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-        fig.patch.set_alpha(0.0 if transparent else 1.0)
-        if not transparent:
-            fig.patch.set_facecolor(colors["bg"])
-        ax.set_facecolor("none" if transparent else colors["bg"])
-        ax.set_aspect("equal")
-
-        freq_start_mhz = freqs[0] / 1e6
-        freq_end_mhz = freqs[-1] / 1e6
-        label_box_style = {
-            "boxstyle": "round,pad=0.3",
-            "facecolor": colors["bg"],
-            "alpha": 0.8,
-        }
-
-        rf.plotting.smith(
-            ax=ax,
-            chart_type="z",
-            draw_labels=True,
-            ref_imm=50.0,
-            draw_vswr=None,
-        )
-
-        # Capture grid artists before adding any user markers/annotations so the
-        # post-styling loops below only restyle the Smith-chart grid, not traces.
-        grid_collections = list(ax.collections)
-        grid_texts = list(ax.texts)
-
-        ax.scatter(
-            [1.0],
-            [0.0],
-            marker="o",
-            s=50,
-            color=grid_color,
-            edgecolor=fg_color,
-            linewidth=1.5,
-            zorder=10,
-            label="Open",
-        )
-        ax.scatter(
-            [-1.0],
-            [0.0],
-            marker="s",
-            s=50,
-            color=grid_color,
-            edgecolor=fg_color,
-            linewidth=1.5,
-            zorder=10,
-            label="Short",
-        )
-        ax.scatter(
-            [0.0],
-            [0.0],
-            marker="*",
-            s=100,
-            color=colors.get("warning", fg_color),
-            edgecolor=fg_color,
-            linewidth=1.5,
-            zorder=10,
-            label="Match (50Ω)",
-        )
+        with _reused_figure(fig_width, fig_height, kind="smith", clear=False) as (
+            fig,
+            ax,
+        ):
+            grid = _prepare_smith_grid(ax)
+            fig.patch.set_alpha(0.0 if transparent else 1.0)
+            if not transparent:
+                fig.patch.set_facecolor(colors["bg"])
+            ax.set_facecolor("none" if transparent else colors["bg"])
+            ax.set_aspect("equal")
 
-        for param in plot_params:
-            if plot_data is not None and param in plot_data:
-                s_complex = plot_data[param]
-            else:
-                mag_db = sparams[param][0]
-                phase_deg = sparams[param][1]
-                mag_linear = 10 ** (mag_db / 20)
-                phase_rad = np.deg2rad(phase_deg)
-                s_complex = mag_linear * np.exp(1j * phase_rad)
-
-            network = rf.Network(
-                frequency=rf.Frequency.from_f(freqs, unit="Hz"),
-                s=s_complex.reshape(-1, 1, 1),
-                name=param,
-            )
+            freq_start_mhz = freqs[0] / 1e6
+            freq_end_mhz = freqs[-1] / 1e6
+            label_box_style = {
+                "boxstyle": "round,pad=0.3",
+                "facecolor": colors["bg"],
+                "alpha": 0.8,
+            }
 
-            trace_color = colors["traces"].get(param, colors["default_trace"])
-            network.plot_s_smith(
-                m=0,
-                n=0,
-                ax=ax,
-                label=param,
-                color=trace_color,
+            ax.scatter(
+                [1.0],
+                [0.0],
+                marker="o",
+                s=50,
+                color=grid_color,
+                edgecolor=fg_color,
                 linewidth=1.5,
-                draw_labels=False,
-                show_legend=False,
+                zorder=10,
+                label="Open",
             )
-
             ax.scatter(
-                s_complex[0].real,
-                s_complex[0].imag,
-                marker=">",
-                s=80,
-                color=trace_color,
+                [-1.0],
+                [0.0],
+                marker="s",
+                s=50,
+                color=grid_color,
                 edgecolor=fg_color,
-                linewidth=1,
-                zorder=15,
+                linewidth=1.5,
+                zorder=10,
+                label="Short",
             )
             ax.scatter(
-                s_complex[-1].real,
-                s_complex[-1].imag,
-                marker="s",
-                s=60,
-                color=trace_color,
+                [0.0],
+                [0.0],
+                marker="*",
+                s=100,
+                color=colors.get("warning", fg_color),
                 edgecolor=fg_color,
-                linewidth=1,
-                zorder=15,
+                linewidth=1.5,
+                zorder=10,
+                label="Match (50Ω)",
             )
 
-            ax.annotate(
-                f"{freq_start_mhz:.0f} MHz",
-                (s_complex[0].real, s_complex[0].imag),
-                xytext=(10, 10),
-                textcoords="offset points",
-                color=trace_color,
-                fontsize=base_size * 0.7,
-                bbox={**label_box_style, "edgecolor": trace_color},
-            )
-            ax.annotate(
-                f"{freq_end_mhz:.0f} MHz",
-                (s_complex[-1].real, s_complex[-1].imag),
-                xytext=(-10, -10),
-                textcoords="offset points",
-                color=trace_color,
-                fontsize=base_size * 0.7,
-                bbox={**label_box_style, "edgecolor": trace_color},
-            )
+            for param in plot_params:
+                if plot_data is not None and param in plot_data:
+                    s_complex = plot_data[param]
+                else:
+                    s_complex = db_deg_to_complex(*sparams[param])
 
-        ax.set_title("Smith Chart", color=fg_color, fontsize=base_size * 1.2, pad=15)
+                # s_complex already is the 50 ohm reflection coefficient, so
+                # it is drawn straight onto the Smith grid
+                trace_color = colors["traces"].get(param, colors["default_trace"])
+                ax.plot(
+                    s_complex.real,
+                    s_complex.imag,
+                    label=param,
+                    color=trace_color,
+                    linewidth=1.5,
+                )
 
-        for collection in grid_collections:
-            collection.set_edgecolor(grid_color)
-            collection.set_alpha(0.3)
+                ax.scatter(
+                    s_complex[0].real,
+                    s_complex[0].imag,
+                    marker=">",
+                    s=80,
+                    color=trace_color,
+                    edgecolor=fg_color,
+                    linewidth=1,
+                    zorder=15,
+                )
+                ax.scatter(
+                    s_complex[-1].real,
+                    s_complex[-1].imag,
+                    marker="s",
+                    s=60,
+                    color=trace_color,
+                    edgecolor=fg_color,
+                    linewidth=1,
+                    zorder=15,
+                )
 
-        for text in grid_texts:
-            text.set_color(fg_color)
-            text.set_fontsize(base_size * 0.7)
+                ax.annotate(
+                    f"{freq_start_mhz:.0f} MHz",
+                    (s_complex[0].real, s_complex[0].imag),
+                    xytext=(10, 10),
+                    textcoords="offset points",
+                    color=trace_color,
+                    fontsize=base_size * 0.7,
+                    bbox={**label_box_style, "edgecolor": trace_color},
+                )
+                ax.annotate(
+                    f"{freq_end_mhz:.0f} MHz",
+                    (s_complex[-1].real, s_complex[-1].imag),
+                    xytext=(-10, -10),
+                    textcoords="offset points",
+                    color=trace_color,
+                    fontsize=base_size * 0.7,
+                    bbox={**label_box_style, "edgecolor": trace_color},
+                )
 
-        if len(plot_params) > 0:
-            legend = ax.legend(
-                edgecolor=grid_color,
-                labelcolor=fg_color,
-                fontsize=base_size * 0.9,
-                loc="upper right",
+            if plot_params:
+                ax.axis((-1.1, 1.1, -1.1, 1.1))
+
+            # The pooled axes keeps its title artist, so its font is set too
+            ax.set_title(
+                "Smith Chart",
+                color=fg_color,
+                fontsize=base_size * 1.2,
+                fontfamily=font_family,
+                pad=15,
             )
-            legend.get_frame().set_alpha(0.5 if transparent else 1.0)
-            if not transparent:
-                legend.get_frame().set_facecolor(colors["bg"])
-            else:
-                legend.get_frame().set_facecolor("none")
-
-        plt.tight_layout()
-        plt.savefig(
-            output_path,
-            dpi=dpi,
-            facecolor=fig.get_facecolor(),
-            edgecolor="none",
-            bbox_inches="tight",
-            transparent=transparent,
-        )
-        plt.close(fig)
+
+            # Pooled grid labels were created under the rc fonts of the first
+            # render, so their whole font is replaced on every render
+            grid_font = FontProperties(family=font_family, size=base_size * 0.7)
+            for text in grid.texts:
+                text.set_fontproperties(grid_font)
+                text.set_color(fg_color)
+
+            if len(plot_params) > 0:
+                legend = ax.legend(
+                    edgecolor=grid_color,
+                    labelcolor=fg_color,
+                    fontsize=base_size * 0.9,
+                    loc="upper right",
+                )
+                legend.get_frame().set_alpha(0.5 if transparent else 1.0)
+                if not transparent:
+                    legend.get_frame().set_facecolor(colors["bg"])
+                else:
+                    legend.get_frame().set_facecolor("none")
+
+            fig.tight_layout()
+            return _write_figure(fig, output_path, dpi, transparent)
@@ -2,7 +2,11 @@
 
 from . import log_logic, setup_logic, tools_logic
 from .log import compose_log_tab
-from .measurement import compose_measurement_tab
+from .measurement import (
+    PLOT_TYPE_OPTIONS_IMAGE,
+    PLOT_TYPE_OPTIONS_TERMINAL,
+    compose_measurement_tab,
+)
 from .setup import compose_setup_tab
 from .tools import compose_tools_tab
 from .tools_logic import (
@@ -20,6 +24,8 @@ from .tools_logic import (
 )
 
 __all__ = [
+    "PLOT_TYPE_OPTIONS_IMAGE",
+    "PLOT_TYPE_OPTIONS_TERMINAL",
     "apply_tools_render_result",
     "apply_tool_ui",
     "compose_log_tab",
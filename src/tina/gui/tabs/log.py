@@ -6,6 +6,8 @@ from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
 from textual.widgets import Checkbox, RichLog, Static
 
+from .log_logic import MAX_LOG_HISTORY
+
 
 def compose_log_tab() -> ComposeResult:
     """Compose the Log tab UI.
@@ -43,7 +45,13 @@ def compose_log_tab() -> ComposeResult:
                 classes="secondary-filter",
             )
 
-    log_area = RichLog(id="log_content", markup=True, highlight=False, wrap=False)
+    log_area = RichLog(
+        id="log_content",
+        max_lines=MAX_LOG_HISTORY,
+        markup=True,
+        highlight=False,
+        wrap=False,
+    )
     log_area.border_title = (
         "Log  [@click='app.copy_log'][$background on $primary] ⎘ [/][/]"
     )
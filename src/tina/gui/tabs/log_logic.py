@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from collections import deque
 
-from rich.markup import escape as rich_escape
+from rich.style import Style
+from rich.text import Text
 from textual.widgets import Checkbox, RichLog
 
 from tina.config.constants import (
@@ -16,6 +18,11 @@ from tina.config.constants import (
 
 MAX_LOG_HISTORY = 2000
 
+_TIMESTAMP_STYLE = Style(dim=True)
+# (epoch second, "HH:MM:SS") of the last formatted log timestamp
+_last_timestamp: tuple[int, str] = (-1, "")
+_DEFAULT_LOG_STYLE = ("•", Style.null())
+
 LOG_FILTER_IDS: dict[str, str] = {
     "tx": "#check_log_tx",
     "rx": "#check_log_rx",
@@ -28,14 +35,36 @@ LOG_FILTER_IDS: dict[str, str] = {
 }
 
 
-def build_style_map(app) -> dict[str, tuple[str, str]]:
-    """Build the level→(icon, style) map from current Textual theme variables."""
+def new_log_history() -> deque[dict]:
+    """Return an empty log history that drops its oldest entries past the cap."""
+    return deque(maxlen=MAX_LOG_HISTORY)
+
+
+def log_timestamp() -> str:
+    """Return the current local time as ``HH:MM:SS`` for a new log entry.
+
+    Log lines only show whole seconds, so the string is formatted once per
+    second and reused for the rest of a burst.
+    """
+    global _last_timestamp
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _last_timestamp[1]
+
+
+def build_style_map(app) -> dict[str, tuple[str, Style]]:
+    """Build the level→(icon, style) map from current Textual theme variables.
+
+    Styles are parsed here once so that formatting a log line only has to
+    look them up.
+    """
     variables = app.get_css_variables()
     color_tx = variables.get("accent", THEME_ACCENT)
     color_rx = variables.get("secondary", THEME_SECONDARY)
     color_success = variables.get("success", THEME_SUCCESS)
     color_error = variables.get("error", THEME_ERROR)
-    return {
+    styles = {
         "tx": ("↑", color_tx),
         "rx": ("↓", color_rx),
         "tx/poll": ("↑~", f"dim {color_tx}"),
@@ -48,15 +77,27 @@ def build_style_map(app) -> dict[str, tuple[str, str]]:
         "progress": ("⋯", "dim italic"),
         "debug": ("•", "dim"),
     }
+    return {
+        level: (icon, Style.parse(style)) for level, (icon, style) in styles.items()
+    }
+
 
+def format_log_entry(app, entry: dict) -> Text:
+    """Render a stored log entry to a styled Rich ``Text`` line.
 
-def format_log_entry(app, entry: dict) -> str:
-    """Render a stored log entry to Rich markup."""
+    The message is appended as plain text, so markup-like brackets in it are
+    shown verbatim rather than interpreted.
+    """
     if app._cached_style_map is None:
         app._cached_style_map = build_style_map(app)
-    icon, style = app._cached_style_map.get(entry["level"], ("•", "default"))
-    safe_message = rich_escape(entry["message"])
-    return f"[dim]{entry['timestamp']}[/dim] [{style}]{icon}[/] {safe_message}"
+    icon, style = app._cached_style_map.get(entry["level"], _DEFAULT_LOG_STYLE)
+    return Text.assemble(
+        (entry["timestamp"], _TIMESTAMP_STYLE),
+        " ",
+        (icon, style),
+        " ",
+        entry["message"],
+    )
 
 
 def should_show_log(app, level: str) -> bool:
@@ -82,6 +123,44 @@ def should_show_log(app, level: str) -> bool:
         return True
 
 
+def read_log_filters(app) -> dict[str, bool]:
+    """Return the state of each log filter checkbox that can be found."""
+    filters: dict[str, bool] = {}
+    for level, checkbox_id in LOG_FILTER_IDS.items():
+        try:
+            filters[level] = app.query_one(checkbox_id, Checkbox).value
+        except Exception:
+            continue
+    return filters
+
+
+def passes_log_filters(level: str, filters: dict[str, bool]) -> bool:
+    """Return True if *level* passes *filters* as read by ``read_log_filters``.
+
+    Matches ``should_show_log`` without querying the checkboxes again, for
+    filtering many entries at once.
+    """
+    return all(filters.get(part, True) for part in level.split("/", 1))
+
+
+def filter_log_entries(entries, filters: dict[str, bool]) -> list[dict]:
+    """Return the *entries* whose level passes *filters*, keeping their order.
+
+    A history holds only a handful of distinct levels, so each level's
+    verdict is worked out once and then looked up for the remaining entries.
+    """
+    verdicts: dict[str, bool] = {}
+    visible = []
+    for entry in entries:
+        level = entry["level"]
+        shown = verdicts.get(level)
+        if shown is None:
+            shown = verdicts[level] = passes_log_filters(level, filters)
+        if shown:
+            visible.append(entry)
+    return visible
+
+
 def refresh_log_display(app) -> None:
     """Rebuild log display from stored entries using current theme colors and filters."""
     try:
@@ -89,34 +168,74 @@ def refresh_log_display(app) -> None:
     except Exception:
         return
     log_content.clear()
-    for entry in app.log_messages:
-        if should_show_log(app, entry["level"]):
-            log_content.write(format_log_entry(app, entry))
-    log_content.scroll_end(animate=False)
+    # Queued lines are part of the history written below
+    pending = getattr(app, "_pending_log_lines", None)
+    if pending:
+        pending.clear()
+    filters = read_log_filters(app)
+    # Reused by log_message until a filter checkbox changes again
+    app._log_filter_cache = filters
+    lines = [
+        format_log_entry(app, entry)
+        for entry in filter_log_entries(app.log_messages, filters)
+    ]
+    # One write renders and scrolls once for the whole history
+    if lines:
+        log_content.write(Text("\n").join(lines))
 
 
 def log_message(app, message: str, level: str = "info") -> None:
     """Add a message to the stored log and visible log widget if enabled."""
     log_entry = {
-        "timestamp": datetime.now().strftime("%H:%M:%S"),
+        "timestamp": log_timestamp(),
         "level": level,
         "message": message,
     }
+    # The history from new_log_history() drops its oldest entry once full
     app.log_messages.append(log_entry)
-    if len(app.log_messages) > MAX_LOG_HISTORY:
-        del app.log_messages[: len(app.log_messages) - MAX_LOG_HISTORY]
 
-    if should_show_log(app, level):
+    # An unbuilt Log tab replays the history when it is first opened
+    if not getattr(app, "_log_tab_built", True):
+        return
+    filters = getattr(app, "_log_filter_cache", None)
+    if filters is not None:
+        visible = passes_log_filters(level, filters)
+    else:
+        visible = should_show_log(app, level)
+    if not visible:
+        return
+
+    pending = getattr(app, "_pending_log_lines", None)
+    if pending is None:
         try:
             log_content = app.query_one("#log_content", RichLog)
         except Exception:
             return
+        # RichLog appends the line and scrolls to it (auto_scroll)
         log_content.write(format_log_entry(app, log_entry))
-        log_content.scroll_end(animate=False)
+        return
+
+    # Lines logged while handling the same burst share one RichLog write
+    pending.append(format_log_entry(app, log_entry))
+    if len(pending) == 1:
+        app.call_later(flush_pending_log, app)
+
+
+def flush_pending_log(app) -> None:
+    """Write the lines queued by ``log_message`` to the RichLog at once."""
+    lines = list(app._pending_log_lines)
+    app._pending_log_lines.clear()
+    if not lines:
+        return
+    try:
+        log_content = app.query_one("#log_content", RichLog)
+    except Exception:
+        return
+    log_content.write(Text("\n").join(lines))
 
 
 def handle_log_filter_change(app) -> None:
-    """Refresh the visible log when any log filter checkbox changes."""
+    """Refresh the visible log and its cached filters when a checkbox changes."""
     refresh_log_display(app)
 
 
@@ -125,10 +244,10 @@ def copy_log(app) -> None:
     if not app._cached_style_map:
         app._cached_style_map = build_style_map(app)
     style_map = app._cached_style_map
+    filters = read_log_filters(app)
     lines = [
         f"{entry['timestamp']} {style_map.get(entry['level'], ('•', ''))[0]} {entry['message']}"
-        for entry in app.log_messages
-        if should_show_log(app, entry["level"])
+        for entry in filter_log_entries(app.log_messages, filters)
     ]
     app.copy_to_clipboard("\n".join(lines))
     app.notify("Log copied to clipboard", timeout=2)
@@ -21,6 +21,17 @@ from textual.widgets import (
 if TYPE_CHECKING:
     from tina.main import VNAApp
 
+# Plot type choices as (label, value); the Smith chart needs an image backend
+PLOT_TYPE_OPTIONS_TERMINAL: tuple[tuple[str, str], ...] = (
+    ("Magnitude", "magnitude"),
+    ("Phase", "phase"),
+    ("Phase Raw", "phase_raw"),
+)
+PLOT_TYPE_OPTIONS_IMAGE: tuple[tuple[str, str], ...] = (
+    *PLOT_TYPE_OPTIONS_TERMINAL,
+    ("Smith Chart", "smith"),
+)
+
 
 def compose_measurement_tab(app: VNAApp) -> ComposeResult:
     """Compose the Measurement tab UI.
@@ -110,11 +121,7 @@ def compose_measurement_tab(app: VNAApp) -> ComposeResult:
                 with Horizontal(classes="plot-controls"):
                     yield Label("Type:")
                     yield Select(
-                        options=[
-                            ("Magnitude", "magnitude"),
-                            ("Phase", "phase"),
-                            ("Phase Raw", "phase_raw"),
-                        ],
+                        options=PLOT_TYPE_OPTIONS_TERMINAL,
                         value=(
                             app.settings.plot_type
                             if app.settings.plot_type
@@ -11,6 +11,73 @@ from textual.widgets import Checkbox, Input, Label, Select, Static
 if TYPE_CHECKING:
     from tina.main import VNAApp
 
+# Select choices as (label, value)
+_POLL_INTERVAL_OPTIONS: tuple[tuple[str, int], ...] = (
+    ("Off", 0),
+    ("1s", 1),
+    ("2s", 2),
+    ("5s", 5),
+    ("10s", 10),
+    ("30s", 30),
+)
+_FREQ_UNIT_OPTIONS: tuple[tuple[str, str], ...] = tuple(
+    (unit, unit) for unit in ("Hz", "kHz", "MHz", "GHz")
+)
+
+# Output panel rows as (label, settings key, placeholder); the key names both
+# the ``input_<key>``/``preview_<key>`` widgets and the settings attribute
+_TEMPLATE_ROWS: tuple[tuple[str, str, str], ...] = (
+    ("Filename:", "filename_template", "measurement_{date}_{time}"),
+    ("Folder:", "folder_template", "measurement"),
+)
+
+# Export checkboxes as (label, key) for ``#check_export_<key>`` and the
+# ``export_<key>`` setting
+_TRACE_EXPORTS: tuple[tuple[str, str], ...] = (
+    ("S11", "s11"),
+    ("S21", "s21"),
+    ("S12", "s12"),
+    ("S22", "s22"),
+)
+_BUNDLE_EXPORTS: tuple[tuple[str, str], ...] = (
+    ("SxP", "bundle_s2p"),
+    ("CSV", "bundle_csv"),
+    ("PNG", "bundle_png"),
+    ("SVG", "bundle_svg"),
+)
+
+
+def _template_row(app: VNAApp, label: str, key: str, placeholder: str) -> Horizontal:
+    """Build a template input row with its live preview."""
+    return Horizontal(
+        Label(label, classes="col-label"),
+        Input(
+            value=getattr(app.settings, key),
+            placeholder=placeholder,
+            id=f"input_{key}",
+            classes="col-input",
+        ),
+        Static("", id=f"preview_{key}", classes="template-preview"),
+        classes="param-row",
+    )
+
+
+def _export_group(
+    app: VNAApp, exports: tuple[tuple[str, str], ...], classes: str
+) -> Horizontal:
+    """Build one half of the export row from a table of checkboxes."""
+    return Horizontal(
+        *(
+            Checkbox(
+                label,
+                id=f"check_export_{key}",
+                value=getattr(app.settings, f"export_{key}"),
+            )
+            for label, key in exports
+        ),
+        classes=classes,
+    )
+
 
 def compose_setup_tab(app: VNAApp) -> ComposeResult:
     """Compose the Setup tab contents.
@@ -58,14 +125,7 @@ def compose_setup_tab(app: VNAApp) -> ComposeResult:
                 )
                 yield Label("🗘", classes="conn-symbol")
                 yield Select(
-                    options=[
-                        ("Off", 0),
-                        ("1s", 1),
-                        ("2s", 2),
-                        ("5s", 5),
-                        ("10s", 10),
-                        ("30s", 30),
-                    ],
+                    options=_POLL_INTERVAL_OPTIONS,
                     value=app.settings.status_poll_interval,
                     id="sb_poll_interval",
                     classes="conn-poll",
@@ -77,12 +137,7 @@ def compose_setup_tab(app: VNAApp) -> ComposeResult:
             with Horizontal(classes="param-row"):
                 yield Label("Unit:", classes="col-label")
                 yield Select(
-                    options=[
-                        ("Hz", "Hz"),
-                        ("kHz", "kHz"),
-                        ("MHz", "MHz"),
-                        ("GHz", "GHz"),
-                    ],
+                    options=_FREQ_UNIT_OPTIONS,
                     value=app.settings.freq_unit,
                     id="select_freq_unit",
                     classes="col-input",
@@ -157,75 +212,10 @@ def compose_setup_tab(app: VNAApp) -> ComposeResult:
                 "[@click='app.show_output_help'][$background on $primary] ? [/][/]"
             )
 
-            with Horizontal(classes="param-row"):
-                yield Label("Filename:", classes="col-label")
-                yield Input(
-                    value=app.settings.filename_template,
-                    placeholder="measurement_{date}_{time}",
-                    id="input_filename_template",
-                    classes="col-input",
-                )
-                yield Static(
-                    "",
-                    id="preview_filename_template",
-                    classes="template-preview",
-                )
-
-            with Horizontal(classes="param-row"):
-                yield Label("Folder:", classes="col-label")
-                yield Input(
-                    value=app.settings.folder_template,
-                    placeholder="measurement",
-                    id="input_folder_template",
-                    classes="col-input",
-                )
-                yield Static(
-                    "",
-                    id="preview_folder_template",
-                    classes="template-preview",
-                )
+            for label, key, placeholder in _TEMPLATE_ROWS:
+                yield _template_row(app, label, key, placeholder)
 
             with Horizontal(classes="param-row output-export-row"):
                 yield Label("Export:", classes="col-label")
-                with Horizontal(classes="output-export-half"):
-                    yield Checkbox(
-                        "S11",
-                        id="check_export_s11",
-                        value=app.settings.export_s11,
-                    )
-                    yield Checkbox(
-                        "S21",
-                        id="check_export_s21",
-                        value=app.settings.export_s21,
-                    )
-                    yield Checkbox(
-                        "S12",
-                        id="check_export_s12",
-                        value=app.settings.export_s12,
-                    )
-                    yield Checkbox(
-                        "S22",
-                        id="check_export_s22",
-                        value=app.settings.export_s22,
-                    )
-                with Horizontal(classes="output-export-half --right"):
-                    yield Checkbox(
-                        "SxP",
-                        id="check_export_bundle_s2p",
-                        value=app.settings.export_bundle_s2p,
-                    )
-                    yield Checkbox(
-                        "CSV",
-                        id="check_export_bundle_csv",
-                        value=app.settings.export_bundle_csv,
-                    )
-                    yield Checkbox(
-                        "PNG",
-                        id="check_export_bundle_png",
-                        value=app.settings.export_bundle_png,
-                    )
-                    yield Checkbox(
-                        "SVG",
-                        id="check_export_bundle_svg",
-                        value=app.settings.export_bundle_svg,
-                    )
+                yield _export_group(app, _TRACE_EXPORTS, "output-export-half")
+                yield _export_group(app, _BUNDLE_EXPORTS, "output-export-half --right")
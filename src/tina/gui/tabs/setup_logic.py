@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 
 from rich.markup import escape as rich_escape
@@ -21,8 +22,8 @@ from ..components import (
 )
 
 
-def _parse_float_preview_value(raw_value: str, fallback: float) -> float:
-    """Parse a float-like setup input for previews, falling back on invalid edits."""
+def parse_float_input(raw_value: str, fallback: float) -> float:
+    """Parse a float-like setup input, falling back on empty or invalid edits."""
     try:
         candidate = raw_value.strip()
         if not candidate:
@@ -32,8 +33,8 @@ def _parse_float_preview_value(raw_value: str, fallback: float) -> float:
         return fallback
 
 
-def _parse_int_preview_value(raw_value: str, fallback: int) -> int:
-    """Parse an integer-like setup input for previews, falling back on invalid edits."""
+def parse_int_input(raw_value: str, fallback: int) -> int:
+    """Parse an integer-like setup input, falling back on empty or invalid edits."""
     try:
         candidate = raw_value.strip()
         if not candidate:
@@ -45,19 +46,19 @@ def _parse_int_preview_value(raw_value: str, fallback: int) -> int:
 
 def build_export_template_context_for_app(app) -> dict[str, object]:
     """Build export-template context from the current setup state."""
-    start_freq = _parse_float_preview_value(
+    start_freq = parse_float_input(
         app.query_one("#input_start_freq", Input).value,
         app.settings.start_freq_mhz,
     )
-    stop_freq = _parse_float_preview_value(
+    stop_freq = parse_float_input(
         app.query_one("#input_stop_freq", Input).value,
         app.settings.stop_freq_mhz,
     )
-    sweep_points = _parse_int_preview_value(
+    sweep_points = parse_int_input(
         app.query_one("#input_points", Input).value,
         app.settings.sweep_points,
     )
-    averaging_count = _parse_int_preview_value(
+    averaging_count = parse_int_input(
         app.query_one("#input_avg_count", Input).value,
         app.settings.averaging_count,
     )
@@ -153,32 +154,29 @@ def update_template_preview(
     preview.set_class(True, "preview-border-round")
 
 
-def get_host_autocomplete_choices(app) -> list[AutocompleteChoice]:
-    """Build host autocomplete choices from persisted host history."""
-    return [
+@functools.lru_cache(maxsize=8)
+def _history_choices(history: tuple[str, ...]) -> tuple[AutocompleteChoice, ...]:
+    """Build history autocomplete choices for an MRU snapshot, memoized per snapshot."""
+    return tuple(
         AutocompleteChoice(
-            value=host,
+            value=item,
             kind="history",
-            label=host,
+            label=item,
             prefix="↺ ",
         )
-        for host in app.settings.host_history
-        if host
-    ]
+        for item in history
+        if item
+    )
+
+
+def get_host_autocomplete_choices(app) -> tuple[AutocompleteChoice, ...]:
+    """Build host autocomplete choices from persisted host history."""
+    return _history_choices(tuple(app.settings.host_history))
 
 
-def get_port_autocomplete_choices(app) -> list[AutocompleteChoice]:
+def get_port_autocomplete_choices(app) -> tuple[AutocompleteChoice, ...]:
     """Build port autocomplete choices from persisted port history."""
-    return [
-        AutocompleteChoice(
-            value=port,
-            kind="history",
-            label=port,
-            prefix="↺ ",
-        )
-        for port in app.settings.port_history
-        if port
-    ]
+    return _history_choices(tuple(app.settings.port_history))
 
 
 def get_template_tag_choices() -> list[AutocompleteChoice]:
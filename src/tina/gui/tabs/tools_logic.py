@@ -10,11 +10,12 @@ import numpy as np
 from textual.containers import Horizontal
 from textual.widgets import Button, Checkbox, Input, Select, Static
 
+from ...config.constants import FREQ_UNIT_CONVERSIONS
 from ...gui.components.frequency_entry import FrequencyEntry
 from ...gui.modals.help import TEXTUAL_IMAGE_AVAILABLE, ImageWidget
 from ...gui.plotting import (
     calculate_plot_range_with_outlier_filtering,
-    get_plot_colors,
+    get_app_plot_colors,
     get_terminal_font,
     unwrap_phase,
 )
@@ -710,8 +711,7 @@ def handle_frequency_extrema_navigate(
     setattr(app, f"_tools_cursor{cursor_index}_hz", sel_hz)
 
     freq_unit = app.last_measurement.get("freq_unit", "MHz")
-    unit_multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
-    mult = unit_multipliers.get(freq_unit, 1e6)
+    mult = FREQ_UNIT_CONVERSIONS.get(freq_unit, 1e6)
     display_val = f"{sel_hz / mult:.6f}".rstrip("0").rstrip(".")
 
     try:
@@ -783,7 +783,7 @@ def get_tools_plot_cache_key(app) -> tuple[object, ...] | None:
     plot_type = (
         str(plot_type_value) if isinstance(plot_type_value, str) else "magnitude"
     )
-    colors = get_plot_colors(app.get_css_variables())
+    colors = get_app_plot_colors(app)
     distortion_components = tuple(app._get_distortion_comp_enabled())
 
     return (
@@ -917,8 +917,7 @@ async def refresh_tools_plot(app, *, tool_result: dict | None = None) -> None:
     freqs = app.last_measurement["freqs"]
     sparams = app.last_measurement["sparams"]
     freq_unit = app.last_measurement.get("freq_unit", "MHz")
-    unit_multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
-    multiplier = unit_multipliers.get(freq_unit, 1e6)
+    multiplier = FREQ_UNIT_CONVERSIONS.get(freq_unit, 1e6)
 
     trace = get_tools_trace(app)
 
@@ -945,7 +944,7 @@ async def refresh_tools_plot(app, *, tool_result: dict | None = None) -> None:
         data, outlier_percentile=1.0, safety_margin=0.05
     )
     freq_axis = freqs / multiplier
-    plot_colors = get_plot_colors(app.get_css_variables())
+    plot_colors = get_app_plot_colors(app)
     trace_color_rgb = plot_colors["traces_rgb"].get(trace, (255, 255, 255))
     cursor1_hz = app._tools_cursor1_hz
     cursor2_hz = app._tools_cursor2_hz
@@ -1065,8 +1064,7 @@ def run_tools_computation(app) -> None:
     freqs = app.last_measurement["freqs"]
     sparams = app.last_measurement["sparams"]
     freq_unit = app.last_measurement.get("freq_unit", "MHz")
-    unit_multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
-    multiplier = unit_multipliers.get(freq_unit, 1e6)
+    multiplier = FREQ_UNIT_CONVERSIONS.get(freq_unit, 1e6)
 
     trace = get_tools_trace(app)
     try:
@@ -1087,7 +1085,7 @@ def run_tools_computation(app) -> None:
             display.update("[dim]Enter cursor frequencies above.[/dim]")
             return
 
-        plot_colors = get_plot_colors(app.get_css_variables())
+        plot_colors = get_app_plot_colors(app)
         display.update(
             _render_tool_result_markup(
                 result,
@@ -1111,7 +1109,7 @@ def run_tools_computation(app) -> None:
             app._tools_cursor1_hz,
             app._tools_cursor2_hz,
         )
-        plot_colors = get_plot_colors(app.get_css_variables())
+        plot_colors = get_app_plot_colors(app)
         display.update(
             _render_tool_result_markup(
                 result,
@@ -1145,9 +1143,8 @@ def render_tools_computation_result(app, result: ToolResult | dict | None) -> No
     freq_unit = (
         app.last_measurement.get("freq_unit", "MHz") if app.last_measurement else "MHz"
     )
-    unit_multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
-    multiplier = unit_multipliers.get(freq_unit, 1e6)
-    plot_colors = get_plot_colors(app.get_css_variables())
+    multiplier = FREQ_UNIT_CONVERSIONS.get(freq_unit, 1e6)
+    plot_colors = get_app_plot_colors(app)
     display.update(
         _render_tool_result_markup(
             result,
@@ -1177,8 +1174,7 @@ def handle_tools_cursor_change(app) -> None:
         return
 
     freq_unit = app.last_measurement.get("freq_unit", "MHz")
-    unit_multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
-    multiplier = unit_multipliers.get(freq_unit, 1e6)
+    multiplier = FREQ_UNIT_CONVERSIONS.get(freq_unit, 1e6)
 
     def _parse(widget_id: str) -> float | None:
         try:
@@ -10,16 +10,24 @@ import queue
 import subprocess
 import sys
 import tkinter as tk
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
 from pathlib import Path
 from tkinter import filedialog
+from typing import Any, ClassVar, TypeVar, cast
 
 import matplotlib
 import numpy as np
+from PIL import Image
+from rich.style import Style
+from rich.text import Text
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.events import Key
+from textual.message import Message
+from textual.widget import Widget
 from textual.widgets import (
     Button,
     Checkbox,
@@ -43,6 +51,8 @@ matplotlib.use("Agg")
 from tina.tools import DistortionTool, MeasureTool
 
 from . import __version__
+from .cli.entry import main
+from .config.constants import FREQ_UNIT_CONVERSIONS, WORKER_RESPONSE_BATCH
 from .config.settings import SettingsManager
 from .drivers import VNAConfig
 from .export import (
@@ -67,7 +77,8 @@ from .gui.plotting import (
     calculate_plot_range_with_outlier_filtering,
     create_matplotlib_plot,
     create_smith_chart,
-    get_plot_colors,
+    get_app_plot_colors,
+    get_plot_temp_dir,
     get_terminal_font,
     truncate_path_intelligently,
     unwrap_phase,
@@ -79,6 +90,8 @@ from .gui.providers import (
     StatusPollProvider,
 )
 from .gui.tabs import (
+    PLOT_TYPE_OPTIONS_IMAGE,
+    PLOT_TYPE_OPTIONS_TERMINAL,
     apply_tool_ui,
     apply_tools_render_result,
     compose_log_tab,
@@ -120,13 +133,43 @@ from .worker import (
     _write_touchstone_save_back,
 )
 
+WidgetT = TypeVar("WidgetT", bound=Widget)
+
+# Traces in the order of the S-parameter checkboxes
+_SPARAM_NAMES = ("S11", "S21", "S12", "S22")
+
+
+@dataclass(frozen=True)
+class _MeasurementExport:
+    """Export plan for a completed measurement, resolved from the UI state."""
+
+    freqs: np.ndarray
+    sparams: dict[str, tuple[np.ndarray, np.ndarray]]
+    export_params: dict[str, tuple[np.ndarray, np.ndarray]]
+    freq_unit: str
+    output_folder: str
+    filename: str
+
+
+def _progress_key(msg) -> tuple[MessageType, int | None] | None:
+    """Return what a worker progress update overwrites, or None otherwise."""
+    if msg.type in (MessageType.PROGRESS, MessageType.IMPORT_PROGRESS) and isinstance(
+        msg.data, ProgressUpdate
+    ):
+        return msg.type, msg.data.job_id
+    return None
+
+
+class WorkerResponsesQueued(Message):
+    """Posted from the worker thread when it has queued new responses."""
+
 
 def _render_plot_image_snapshot(
     freqs: np.ndarray,
     sparams: dict[str, tuple[np.ndarray, np.ndarray]],
     plot_params: tuple[str, ...],
     plot_type: str,
-    output_path: Path,
+    output_path: Path | None,
     dpi: int,
     pixel_width: int,
     pixel_height: int,
@@ -135,10 +178,10 @@ def _render_plot_image_snapshot(
     y_min: float | None,
     y_max: float | None,
     plot_data: dict[str, np.ndarray] | None = None,
-) -> None:
+) -> Image.Image | None:
     """Render a plot image from UI-thread snapshots in a worker thread."""
     if plot_type == "smith":
-        create_smith_chart(
+        return create_smith_chart(
             freqs,
             sparams,
             list(plot_params),
@@ -151,7 +194,7 @@ def _render_plot_image_snapshot(
             colors=colors,
         )
     else:
-        create_matplotlib_plot(
+        return create_matplotlib_plot(
             freqs,
             sparams,
             list(plot_params),
@@ -250,23 +293,32 @@ class VNAApp(App):
         self._manual_export_jobs_in_flight = 0
         self.measurement_notes = ""  # Store raw markdown notes for current measurement
         self.last_output_path = None  # Store last output file path
-        self.last_plot_path = None  # Store last plot image path
-        self.log_messages = []  # Store all log messages for filtering
-        self._message_check_timer = None  # Timer for checking worker messages
+        self.last_plot_image = None  # Last rendered Results plot image
+        self.log_messages = log_logic.new_log_history()  # Kept for filtering
+        # Visible log lines waiting for the next batched RichLog write
+        self._pending_log_lines: list[Text] = []
+        # Log filter checkbox states, read when the Log tab is (re)drawn
+        self._log_filter_cache: dict[str, bool] | None = None
         self._resize_timer = None  # Timer for debouncing resize events
-        self._path_update_timer = None  # Timer for updating path label on resize
         self._plot_refresh_timer = None  # Timer for debouncing plot control changes
         self._poll_timer = None  # Timer for status bar polling
+        # (available width, path) the output file label was last drawn for
+        self._output_label_state: tuple[int, str] | None = None
+        self._tk_root: tk.Tk | None = None  # Hidden parent for file dialogs
         self._status_poll_in_flight = False  # True while a STATUS_POLL is outstanding
         self._debug_scpi = self.settings.debug_scpi
         self._filename_template_validation = None
         self._folder_template_validation = None
         self._minimal_export_mode = False
+        # Minimal-export mode the export buttons were last styled for
+        self._export_buttons_mode: bool | None = None
+        self._log_tab_built = False
+        # Static widgets looked up on the hot paths, keyed by selector
+        self._widget_cache: dict[str, Widget] = {}
 
         # Tools tab state
         self._tools_cursor1_hz: float | None = None
         self._tools_cursor2_hz: float | None = None
-        self._tools_resize_timer = None
         self._tools_input_timer = None  # Timer for debouncing cursor input changes
         self._tools_plot_generation = 0
         self._tools_plot_cache_key = None
@@ -279,9 +331,8 @@ class VNAApp(App):
         self._tools_distortion_cache_last_data_key = None
         self._template_input_timer = None
 
-        # Create temporary directory for plot images
-        self.plot_temp_dir = Path("/tmp/tui-vna-plots")
-        self.plot_temp_dir.mkdir(parents=True, exist_ok=True)
+        # Temporary directory for plot images, created once per process
+        self.plot_temp_dir = get_plot_temp_dir()
 
         # Detect terminal and font once at boot
         self.terminal_font, self.terminal_font_size = get_terminal_font()
@@ -301,8 +352,8 @@ class VNAApp(App):
             with TabPane("Tools", id="tab_tools"):
                 yield from compose_tools_tab(self)
 
-            with TabPane("Log", id="tab_log"):
-                yield from compose_log_tab()
+            # Filled in by _build_log_tab the first time the tab is opened
+            yield TabPane("Log", id="tab_log")
 
         yield Static("", id="footer_separator")
 
@@ -360,9 +411,9 @@ class VNAApp(App):
 
         Performs startup initialization: updates window title and footer
         debug state, initializes progress bar and plot-type options, applies
-        tool UI state, starts the measurement worker and its message
-        polling, and schedules a background update check once the UI is
-        ready.
+        tool UI state, starts the measurement worker with a callback that
+        wakes the UI for its responses, and schedules a background update
+        check once the UI is ready.
         """
         self._update_title()
         self.query_one(StatusFooter).set_debug_mode(self._debug_scpi, connected=False)
@@ -378,13 +429,23 @@ class VNAApp(App):
         self._update_plot_type_options()
         # Apply active tool UI state at startup
         self._apply_tool_ui()
-        # Start worker thread
-        self.worker.start()
-        # Start message polling
-        self._start_message_polling()
+        # Start worker thread; it wakes the UI whenever it queues a response
+        self.worker.start(on_response=self._notify_worker_responses)
         # Check for updates in background (after UI is ready)
         self.call_after_refresh(self._check_for_updates)
 
+    def _cached_query(self, selector: str, expect_type: type[WidgetT]) -> WidgetT:
+        """Return the widget matching *selector*, querying the DOM only once.
+
+        Only use this for widgets that live as long as the app; widgets that
+        get removed or rebuilt must go through ``query_one`` every time.
+        """
+        widget = self._widget_cache.get(selector)
+        if widget is None:
+            widget = self.query_one(selector, expect_type)
+            self._widget_cache[selector] = widget
+        return cast(WidgetT, widget)
+
     def _log_startup(self) -> None:
         """Log startup message after UI is ready."""
         self.log_message(f"TINA v{__version__} ready. Connect to start.", "info")
@@ -448,31 +509,19 @@ class VNAApp(App):
     def _update_plot_type_options(self) -> None:
         """Update plot type dropdown options based on selected backend."""
         plot_backend = self.settings.plot_backend
-        plot_type_select = self.query_one("#select_plot_type", Select)
+        plot_type_select = self._cached_query("#select_plot_type", Select)
         current_type = plot_type_select.value
 
         if plot_backend == "terminal":
-            # Text-based backend: magnitude, phase, phase_raw
-            new_options = [
-                ("Magnitude", "magnitude"),
-                ("Phase", "phase"),
-                ("Phase Raw", "phase_raw"),
-            ]
-        else:  # image backend
-            # Image-based backend: magnitude, phase, phase_raw, smith
-            new_options = [
-                ("Magnitude", "magnitude"),
-                ("Phase", "phase"),
-                ("Phase Raw", "phase_raw"),
-                ("Smith Chart", "smith"),
-            ]
+            new_options = PLOT_TYPE_OPTIONS_TERMINAL
+        else:  # image backend also offers the Smith chart
+            new_options = PLOT_TYPE_OPTIONS_IMAGE
 
         # Update options
         plot_type_select.set_options(new_options)
 
         # Try to preserve the current selection if it's still valid
-        valid_values = [opt[1] for opt in new_options]
-        if current_type in valid_values:
+        if any(value == current_type for _, value in new_options):
             plot_type_select.value = current_type
         else:
             # Default to magnitude if current type not available
@@ -483,11 +532,12 @@ class VNAApp(App):
         Handle theme change by clearing cached styles and updating UI
         components.
 
-        Clears the cached style map, re-renders the log using the updated
-        theme colors, and — if a measurement is loaded — schedules refreshed
-        tools and results plots to run after the next render cycle.
+        Clears the cached log styles and plot colors, re-renders the log using
+        the updated theme colors, and — if a measurement is loaded — schedules
+        refreshed tools and results plots to run after the next render cycle.
         """
         self._cached_style_map = None
+        self._cached_plot_colors = None
         log_logic.refresh_log_display(self)
         if self.last_measurement is not None:
             self.call_after_refresh(self._refresh_tools_plot)
@@ -512,6 +562,13 @@ class VNAApp(App):
                 plt.close(tools_plot_fig)
         except Exception:
             pass
+        tk_root = getattr(self, "_tk_root", None)
+        if tk_root is not None:
+            try:
+                tk_root.destroy()
+            except tk.TclError:
+                pass
+            self._tk_root = None
         # Stop worker thread gracefully
         if self.worker:
             self.worker.stop(timeout=5.0)
@@ -520,73 +577,81 @@ class VNAApp(App):
         """Save current UI state to settings."""
         try:
             # Connection settings
-            self.settings.last_host = self.query_one("#input_host", Input).value.strip()
+            self.settings.last_host = self._cached_query(
+                "#input_host", Input
+            ).value.strip()
             self.settings.last_port = (
-                self.query_one("#input_port", Input).value.strip() or "inst0"
+                self._cached_query("#input_port", Input).value.strip() or "inst0"
             )
 
             # Measurement parameters
-            freq_unit_value = self.query_one("#select_freq_unit", Select).value
+            freq_unit_value = self._cached_query("#select_freq_unit", Select).value
             if isinstance(freq_unit_value, str):
                 self.settings.freq_unit = freq_unit_value
-            self.settings.start_freq_mhz = float(
-                self.query_one("#input_start_freq", Input).value or "1.0"
+            # A half-typed number keeps the last good value instead of
+            # aborting the whole save
+            self.settings.start_freq_mhz = setup_logic.parse_float_input(
+                self._cached_query("#input_start_freq", Input).value,
+                self.settings.start_freq_mhz,
             )
-            self.settings.stop_freq_mhz = float(
-                self.query_one("#input_stop_freq", Input).value or "1100.0"
+            self.settings.stop_freq_mhz = setup_logic.parse_float_input(
+                self._cached_query("#input_stop_freq", Input).value,
+                self.settings.stop_freq_mhz,
             )
-            self.settings.sweep_points = int(
-                self.query_one("#input_points", Input).value or "601"
+            self.settings.sweep_points = setup_logic.parse_int_input(
+                self._cached_query("#input_points", Input).value,
+                self.settings.sweep_points,
             )
-            self.settings.averaging_count = int(
-                self.query_one("#input_avg_count", Input).value or "16"
+            self.settings.averaging_count = setup_logic.parse_int_input(
+                self._cached_query("#input_avg_count", Input).value,
+                self.settings.averaging_count,
             )
 
             # Override flags
-            self.settings.set_freq_range = self.query_one(
+            self.settings.set_freq_range = self._cached_query(
                 "#check_set_freq", Checkbox
             ).value
-            self.settings.set_sweep_points = self.query_one(
+            self.settings.set_sweep_points = self._cached_query(
                 "#check_set_points", Checkbox
             ).value
-            self.settings.enable_averaging = self.query_one(
+            self.settings.enable_averaging = self._cached_query(
                 "#check_averaging", Checkbox
             ).value
-            self.settings.set_averaging_count = self.query_one(
+            self.settings.set_averaging_count = self._cached_query(
                 "#check_set_avg_count", Checkbox
             ).value
 
             # Output settings
-            self.settings.output_folder = self.query_one(
+            self.settings.output_folder = self._cached_query(
                 "#input_folder_template", Input
             ).value
             self.settings.folder_template = self.settings.output_folder
-            self.settings.filename_prefix = self.query_one(
+            self.settings.filename_prefix = self._cached_query(
                 "#input_filename_template", Input
             ).value
             self.settings.filename_template = self.settings.filename_prefix
-            self.settings.export_s11 = self.query_one(
+            self.settings.export_s11 = self._cached_query(
                 "#check_export_s11", Checkbox
             ).value
-            self.settings.export_s21 = self.query_one(
+            self.settings.export_s21 = self._cached_query(
                 "#check_export_s21", Checkbox
             ).value
-            self.settings.export_s12 = self.query_one(
+            self.settings.export_s12 = self._cached_query(
                 "#check_export_s12", Checkbox
             ).value
-            self.settings.export_s22 = self.query_one(
+            self.settings.export_s22 = self._cached_query(
                 "#check_export_s22", Checkbox
             ).value
-            self.settings.export_bundle_s2p = self.query_one(
+            self.settings.export_bundle_s2p = self._cached_query(
                 "#check_export_bundle_s2p", Checkbox
             ).value
-            self.settings.export_bundle_csv = self.query_one(
+            self.settings.export_bundle_csv = self._cached_query(
                 "#check_export_bundle_csv", Checkbox
             ).value
-            self.settings.export_bundle_png = self.query_one(
+            self.settings.export_bundle_png = self._cached_query(
                 "#check_export_bundle_png", Checkbox
             ).value
-            self.settings.export_bundle_svg = self.query_one(
+            self.settings.export_bundle_svg = self._cached_query(
                 "#check_export_bundle_svg", Checkbox
             ).value
             self.settings_manager.touch_template_history(
@@ -599,18 +664,26 @@ class VNAApp(App):
             )
 
             # Plot settings
-            self.settings.plot_s11 = self.query_one("#check_plot_s11", Checkbox).value
-            self.settings.plot_s21 = self.query_one("#check_plot_s21", Checkbox).value
-            self.settings.plot_s12 = self.query_one("#check_plot_s12", Checkbox).value
-            self.settings.plot_s22 = self.query_one("#check_plot_s22", Checkbox).value
-            plot_type_value = self.query_one("#select_plot_type", Select).value
+            self.settings.plot_s11 = self._cached_query(
+                "#check_plot_s11", Checkbox
+            ).value
+            self.settings.plot_s21 = self._cached_query(
+                "#check_plot_s21", Checkbox
+            ).value
+            self.settings.plot_s12 = self._cached_query(
+                "#check_plot_s12", Checkbox
+            ).value
+            self.settings.plot_s22 = self._cached_query(
+                "#check_plot_s22", Checkbox
+            ).value
+            plot_type_value = self._cached_query("#select_plot_type", Select).value
             if isinstance(plot_type_value, str):
                 self.settings.plot_type = plot_type_value
 
             # Tools tab settings
             self.settings.tools_trace = self._get_tools_trace()
             try:
-                tools_plot_type_value = self.query_one(
+                tools_plot_type_value = self._cached_query(
                     "#select_tools_plot_type", Select
                 ).value
                 if isinstance(tools_plot_type_value, str):
@@ -876,7 +949,7 @@ class VNAApp(App):
                 plot_params,
                 Path(file_path),
                 dpi=dpi,
-                colors=get_plot_colors(self.get_css_variables()),
+                colors=get_app_plot_colors(self),
             )
         else:
             create_matplotlib_plot(
@@ -886,7 +959,7 @@ class VNAApp(App):
                 str(plot_type),
                 Path(file_path),
                 dpi=dpi,
-                colors=get_plot_colors(self.get_css_variables()),
+                colors=get_app_plot_colors(self),
             )
 
         if minimal_export:
@@ -963,7 +1036,7 @@ class VNAApp(App):
                         name: [values[0].tolist(), values[1].tolist()]
                         for name, values in self.last_measurement["sparams"].items()
                     },
-                    "colors": get_plot_colors(self.get_css_variables()),
+                    "colors": get_app_plot_colors(self),
                     "freq_unit": self.last_measurement.get("freq_unit", "MHz"),
                 },
             )
@@ -1078,7 +1151,7 @@ class VNAApp(App):
         sparams: dict[str, tuple[np.ndarray, np.ndarray]],
         plot_params: list[str],
         plot_type: str,
-        output_path: Path,
+        output_path: Path | None,
         dpi: int,
         pixel_width: int,
         pixel_height: int,
@@ -1096,14 +1169,15 @@ class VNAApp(App):
             payload={
                 "kind": "Results plot",
                 "export_kind": "results_plot",
-                "freqs": freqs.tolist(),
+                # The worker is a thread in this process, so the snapshot
+                # arrays are handed over as-is instead of as float lists
+                "freqs": freqs,
                 "sparams": {
-                    name: [values[0].tolist(), values[1].tolist()]
-                    for name, values in sparams.items()
+                    name: [values[0], values[1]] for name, values in sparams.items()
                 },
                 "plot_params": plot_params,
                 "plot_type": plot_type,
-                "output_path": str(output_path),
+                "output_path": (str(output_path) if output_path is not None else None),
                 "dpi": dpi,
                 "pixel_width": pixel_width,
                 "pixel_height": pixel_height,
@@ -1111,14 +1185,7 @@ class VNAApp(App):
                 "colors": colors,
                 "y_min": y_min,
                 "y_max": y_max,
-                "plot_data": (
-                    {
-                        name: values.tolist()
-                        for name, values in (plot_data or {}).items()
-                    }
-                    if plot_data is not None
-                    else None
-                ),
+                "plot_data": dict(plot_data) if plot_data is not None else None,
             },
         )
         return dict(result)
@@ -1175,6 +1242,7 @@ class VNAApp(App):
             and self._latest_tools_compute_cache_key == render_cache_key
             else None
         )
+        plot_colors = get_app_plot_colors(self)
         result = await self._run_background_worker_job(
             msg_type=MessageType.TOOLS_RENDER,
             operation="Tools render",
@@ -1192,16 +1260,12 @@ class VNAApp(App):
                 "active_tool": self.settings.tools_active_tool,
                 "marker_symbol": self.settings.cursor_marker_style,
                 "colors": {
-                    "fg": get_plot_colors(self.get_css_variables())["fg"],
-                    "grid": get_plot_colors(self.get_css_variables())["grid"],
-                    "trace": get_plot_colors(self.get_css_variables())["traces"].get(
-                        trace, TRACE_COLOR_DEFAULT
-                    ),
-                    "cursor1": get_plot_colors(self.get_css_variables())["cursor1"],
-                    "cursor2": get_plot_colors(self.get_css_variables())["cursor2"],
-                    "distortion_overlays": get_plot_colors(self.get_css_variables())[
-                        "distortion_overlays"
-                    ],
+                    "fg": plot_colors["fg"],
+                    "grid": plot_colors["grid"],
+                    "trace": plot_colors["traces"].get(trace, TRACE_COLOR_DEFAULT),
+                    "cursor1": plot_colors["cursor1"],
+                    "cursor2": plot_colors["cursor2"],
+                    "distortion_overlays": plot_colors["distortion_overlays"],
                 },
                 "distortion_components": self._get_distortion_comp_enabled(),
                 "render_cache_key": render_cache_key,
@@ -1397,41 +1461,61 @@ class VNAApp(App):
         """Switch the UI to the Measurement tab."""
         self.query_one(TabbedContent).active = "tab_results"
 
+    def _dialog_root(self) -> tk.Tk:
+        """Return the hidden Tk root that parents the native file dialogs.
+
+        Starting a Tcl interpreter is slow, so one withdrawn root is created
+        on first use and kept for later dialogs until the app unmounts.
+        """
+        root = getattr(self, "_tk_root", None)
+        if root is not None:
+            try:
+                if root.winfo_exists():
+                    return root
+            except tk.TclError:
+                pass
+        root = tk.Tk()
+        root.withdraw()
+        root.attributes("-topmost", True)
+        self._tk_root = root
+        return root
+
     def _import_measurement_output(
         self,
         *,
         restore_measurement: bool,
     ) -> None:
         """Import metadata from a measurement output, optionally restoring measurement state."""
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes("-topmost", True)
-
-        try:
-            file_path = filedialog.askopenfilename(
-                title="Select Measurement Output",
-                filetypes=[
-                    ("Measurement Outputs", "*.s2p *.png *.svg"),
-                    ("Touchstone Files", "*.s2p"),
-                    ("PNG Images", "*.png"),
-                    ("SVG Images", "*.svg"),
-                    ("All Files", "*.*"),
-                ],
-                initialdir=(
-                    self.settings.output_folder if self.settings.output_folder else "."
-                ),
-            )
-        finally:
-            root.destroy()
+        root = VNAApp._dialog_root(self)
+        file_path = filedialog.askopenfilename(
+            parent=root,
+            title="Select Measurement Output",
+            filetypes=[
+                ("Measurement Outputs", "*.s2p *.png *.svg"),
+                ("Touchstone Files", "*.s2p"),
+                ("PNG Images", "*.png"),
+                ("SVG Images", "*.svg"),
+                ("All Files", "*.*"),
+            ],
+            initialdir=(
+                self.settings.output_folder if self.settings.output_folder else "."
+            ),
+        )
 
         if not file_path:
             self.notify("Import cancelled", severity="warning", timeout=3)
             return
         VNAApp._start_measurement_import(self, file_path, restore_measurement)
 
-    def _start_message_polling(self):
-        """Start polling worker thread for messages."""
-        self._message_check_timer = self.set_interval(0.05, self._check_worker_messages)
+    def _notify_worker_responses(self) -> None:
+        """Wake the UI thread to drain worker responses (called by the worker)."""
+        self.post_message(WorkerResponsesQueued())
+
+    @on(WorkerResponsesQueued)
+    def on_worker_responses_queued(self, event: WorkerResponsesQueued) -> None:
+        """Drain the worker responses that triggered this notification."""
+        del event
+        self._check_worker_messages()
 
     def _start_status_polling(self, interval_s: int) -> None:
         """Start (or restart) periodic VNA status polling."""
@@ -1465,125 +1549,179 @@ class VNAApp(App):
             self.worker.send_command(MessageType.STATUS_POLL)
 
     def _check_worker_messages(self):
-        """Check for messages from worker thread (called periodically)."""
-        try:
-            while True:
-                msg = self.worker.get_response(timeout=0.001)
+        """Handle the messages the worker thread has queued so far.
+
+        At most ``WORKER_RESPONSE_BATCH`` are handled per call. Every queued
+        response posts its own notification, so any left over are picked up
+        by the next one, after Textual has had a chance to process input.
+        A progress update that a later one in the same batch overwrites is
+        skipped, so a burst redraws the progress bar once.
+        """
+        batch = []
+        for _ in range(WORKER_RESPONSE_BATCH):
+            try:
+                batch.append(self.worker.get_response_nowait())
+            except queue.Empty:
+                break
+
+        latest_progress = {}
+        for index, msg in enumerate(batch):
+            key = _progress_key(msg)
+            if key is not None:
+                latest_progress[key] = index
+        for index, msg in enumerate(batch):
+            key = _progress_key(msg)
+            if key is None or latest_progress[key] == index:
                 self._handle_worker_message(msg)
-        except queue.Empty:
-            pass
 
     def _handle_worker_message(self, msg):
         """Handle message from worker thread."""
-        if msg.type == MessageType.LOG:
-            log_msg: LogMessage = msg.data
-            self.log_message(log_msg.message, log_msg.level)
-
-        elif msg.type == MessageType.PROGRESS:
-            if isinstance(msg.data, BackgroundJob):
-                self._complete_background_job(msg.data.job_id)
-                self._handle_background_job_complete(msg.data)
+        handler = VNAApp._WORKER_MESSAGE_HANDLERS.get(msg.type)
+        if handler is not None:
+            handler(self, msg)
+
+    def _on_worker_log(self, msg) -> None:
+        """Write a worker log line to the log."""
+        log_msg: LogMessage = msg.data
+        self.log_message(log_msg.message, log_msg.level)
+
+    def _on_worker_progress(self, msg) -> None:
+        """Show worker progress, or finish a background job."""
+        if isinstance(msg.data, BackgroundJob):
+            self._complete_background_job(msg.data.job_id)
+            self._handle_background_job_complete(msg.data)
+        else:
+            update: ProgressUpdate = msg.data
+            if update.job_id is not None:
+                self._update_background_job_progress(
+                    update.job_id,
+                    update.message,
+                    update.progress_pct,
+                )
             else:
-                update: ProgressUpdate = msg.data
-                if update.job_id is not None:
-                    self._update_background_job_progress(
-                        update.job_id,
-                        update.message,
-                        update.progress_pct,
-                    )
-                else:
-                    self.set_progress(update.message, update.progress_pct)
+                self.set_progress(update.message, update.progress_pct)
 
-        elif msg.type == MessageType.IMPORT_PROGRESS:
-            update: ProgressUpdate = msg.data
-            self.set_progress(update.message, update.progress_pct)
+    def _on_worker_import_progress(self, msg) -> None:
+        """Show measurement import progress."""
+        update: ProgressUpdate = msg.data
+        self.set_progress(update.message, update.progress_pct)
 
-        elif msg.type == MessageType.IMPORT_COMPLETE:
-            import_result: ImportResult = msg.data
-            try:
-                self._apply_import_result(import_result)
-            except Exception as e:
-                self.log_message(f"Import failed: {e}", "error")
-            finally:
-                self.enable_buttons_for_state()
-                self.reset_progress()
-                self._import_in_flight = False
-
-        elif msg.type == MessageType.CONNECTED:
-            display_name = msg.data
-            self.connected = True
-            self.sub_title = display_name
-            self._update_title()
-            self.log_message(f"Connected: {display_name}", "success")
-            self.update_connect_button()
+    def _on_worker_import_complete(self, msg) -> None:
+        """Apply an imported measurement and restore the idle UI."""
+        import_result: ImportResult = msg.data
+        try:
+            self._apply_import_result(import_result)
+        except Exception as e:
+            self.log_message(f"Import failed: {e}", "error")
+        finally:
             self.enable_buttons_for_state()
             self.reset_progress()
-            self._start_status_polling(self.settings.status_poll_interval)
-            if self._debug_scpi:
-                self.worker.send_command(MessageType.SET_DEBUG_SCPI, data=True)
-            # Immediate first poll without waiting for the interval
-            self._status_poll_in_flight = True
-            self.worker.send_command(MessageType.STATUS_POLL)
+            self._import_in_flight = False
 
-        elif msg.type == MessageType.DISCONNECTED:
+    def _on_worker_connected(self, msg) -> None:
+        """Switch the UI to the connected state and start status polling."""
+        display_name = msg.data
+        self.connected = True
+        self.sub_title = display_name
+        self._update_title()
+        self.log_message(f"Connected: {display_name}", "success")
+        self.update_connect_button()
+        self.enable_buttons_for_state()
+        self.reset_progress()
+        self._start_status_polling(self.settings.status_poll_interval)
+        if self._debug_scpi:
+            self.worker.send_command(MessageType.SET_DEBUG_SCPI, data=True)
+        # Immediate first poll without waiting for the interval
+        self._status_poll_in_flight = True
+        self.worker.send_command(MessageType.STATUS_POLL)
+
+    def _on_worker_disconnected(self, msg) -> None:
+        """Switch the UI to the disconnected state and stop status polling."""
+        del msg
+        self.connected = False
+        self._status_poll_in_flight = False
+        self.sub_title = ""
+        self._update_title()
+        self.log_message("Disconnected from VNA", "success")
+        self.update_connect_button()
+        self.enable_buttons_for_state()
+        self.reset_progress()
+        self._stop_status_polling()
+
+    def _on_worker_params_read(self, msg) -> None:
+        """Show the parameters read back from the instrument."""
+        params_result: ParamsResult = msg.data
+        self._update_params_ui(params_result)
+        self.log_message("Parameters retrieved successfully", "success")
+        self.enable_buttons_for_state()
+        self.reset_progress()
+
+    def _on_worker_measurement_complete(self, msg) -> None:
+        """Store a finished sweep and schedule its export."""
+        measurement_result: MeasurementResult = msg.data
+        self.log_message(
+            f"Received measurement complete with {len(measurement_result.frequencies)} points",
+            "debug",
+        )
+        # Resolve the export inline; only the export itself needs a task
+        export = self._prepare_measurement_export(measurement_result)
+        if export is not None:
+            asyncio.create_task(self._export_measurement(export))
+
+    def _on_worker_status_update(self, msg) -> None:
+        """Show a status poll result in the footer."""
+        self._status_poll_in_flight = False
+        status_result: StatusResult = msg.data
+        self._cached_query("StatusFooter", StatusFooter).update_status(status_result)
+
+    def _on_worker_scpi_error_update(self, msg) -> None:
+        """Show the last SCPI error in the footer when SCPI debugging is on."""
+        if self._debug_scpi:
+            self._cached_query("StatusFooter", StatusFooter).update_last_error(
+                msg.data["command"], msg.data["error"]
+            )
+
+    def _on_worker_error(self, msg) -> None:
+        """Log a worker error, fail its background job and reset the UI."""
+        self.log_message(msg.error, "error")
+        if isinstance(msg.data, dict):
+            job_id = msg.data.get("job_id")
+            if isinstance(job_id, int):
+                tracked_job = self._background_jobs.get(job_id)
+                if tracked_job is not None:
+                    future = tracked_job.get("future")
+                    if isinstance(future, asyncio.Future) and not future.done():
+                        future.set_exception(RuntimeError(msg.error))
+                self._complete_background_job(job_id)
+        if "Connection failed" in msg.error or "Disconnect failed" in msg.error:
             self.connected = False
-            self._status_poll_in_flight = False
             self.sub_title = ""
             self._update_title()
-            self.log_message("Disconnected from VNA", "success")
             self.update_connect_button()
-            self.enable_buttons_for_state()
-            self.reset_progress()
             self._stop_status_polling()
+        self.enable_buttons_for_state()
+        self.reset_progress()
+        self.measuring = False
+        self._import_in_flight = False
 
-        elif msg.type == MessageType.PARAMS_READ:
-            params_result: ParamsResult = msg.data
-            self._update_params_ui(params_result)
-            self.log_message("Parameters retrieved successfully", "success")
-            self.enable_buttons_for_state()
-            self.reset_progress()
-
-        elif msg.type == MessageType.MEASUREMENT_COMPLETE:
-            measurement_result: MeasurementResult = msg.data
-            self.log_message(
-                f"Received measurement complete with {len(measurement_result.frequencies)} points",
-                "debug",
-            )
-            # Schedule the async handler
-            asyncio.create_task(self._handle_measurement_complete(measurement_result))
-
-        elif msg.type == MessageType.STATUS_UPDATE:
-            self._status_poll_in_flight = False
-            status_result: StatusResult = msg.data
-            self.query_one(StatusFooter).update_status(status_result)
-
-        elif msg.type == MessageType.SCPI_ERROR_UPDATE:
-            if self._debug_scpi:
-                self.query_one(StatusFooter).update_last_error(
-                    msg.data["command"], msg.data["error"]
-                )
-
-        elif msg.type == MessageType.ERROR:
-            self.log_message(msg.error, "error")
-            if isinstance(msg.data, dict):
-                job_id = msg.data.get("job_id")
-                if isinstance(job_id, int):
-                    tracked_job = self._background_jobs.get(job_id)
-                    if tracked_job is not None:
-                        future = tracked_job.get("future")
-                        if isinstance(future, asyncio.Future) and not future.done():
-                            future.set_exception(RuntimeError(msg.error))
-                    self._complete_background_job(job_id)
-            if "Connection failed" in msg.error or "Disconnect failed" in msg.error:
-                self.connected = False
-                self.sub_title = ""
-                self._update_title()
-                self.update_connect_button()
-                self._stop_status_polling()
-            self.enable_buttons_for_state()
-            self.reset_progress()
-            self.measuring = False
-            self._import_in_flight = False
+    # Worker response handlers by message type, looked up once per message.
+    # The handlers are called unbound so helpers that borrow
+    # _handle_worker_message keep working.
+    _WORKER_MESSAGE_HANDLERS: ClassVar[
+        dict[MessageType, Callable[[Any, Any], None]]
+    ] = {
+        MessageType.LOG: _on_worker_log,
+        MessageType.PROGRESS: _on_worker_progress,
+        MessageType.IMPORT_PROGRESS: _on_worker_import_progress,
+        MessageType.IMPORT_COMPLETE: _on_worker_import_complete,
+        MessageType.CONNECTED: _on_worker_connected,
+        MessageType.DISCONNECTED: _on_worker_disconnected,
+        MessageType.PARAMS_READ: _on_worker_params_read,
+        MessageType.MEASUREMENT_COMPLETE: _on_worker_measurement_complete,
+        MessageType.STATUS_UPDATE: _on_worker_status_update,
+        MessageType.SCPI_ERROR_UPDATE: _on_worker_scpi_error_update,
+        MessageType.ERROR: _on_worker_error,
+    }
 
     def _handle_background_job_complete(self, job: BackgroundJob) -> None:
         """Handle completion of a worker-managed background job."""
@@ -1639,21 +1777,24 @@ class VNAApp(App):
         self._refresh_export_button_labels()
 
     @on(TabbedContent.TabActivated)
-    def on_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+    async def on_tab_activated(self, event: TabbedContent.TabActivated) -> None:
         """
         Handle tab activation events by updating the UI: scroll the log when
         the Log tab is opened and schedule plot redraws when Results or
         Tools tabs are opened.
 
-        When the Log tab is activated, scroll the log widget to the end. When
-        the Results or Tools tab is activated, schedule an after-refresh check
-        of the corresponding plot if a measurement is available.
+        When the Log tab is activated, build its widgets on first use and
+        scroll the log widget to the end. When the Results or Tools tab is
+        activated, schedule an after-refresh check of the corresponding plot
+        if a measurement is available.
 
         Parameters:
             event (TabbedContent.TabActivated): The tab activation event
                 containing the activated pane (used to check pane.id).
         """
         if event.pane.id == "tab_log":
+            if not self._log_tab_built:
+                await self._build_log_tab(event.pane)
             # Scroll log to bottom when opening log tab
             log_content = self.query_one("#log_content", RichLog)
             log_content.scroll_end(animate=False)
@@ -1666,6 +1807,17 @@ class VNAApp(App):
             if self.last_measurement is not None:
                 self.call_after_refresh(self._delayed_redraw_tools_plot)
 
+    async def _build_log_tab(self, pane: TabPane) -> None:
+        """
+        Mount the Log tab widgets into *pane* and replay the stored log.
+
+        The Log tab is left empty at startup; messages logged before it is
+        first opened are kept in ``log_messages`` and written out here.
+        """
+        self._log_tab_built = True
+        await pane.mount_compose(compose_log_tab())
+        log_logic.refresh_log_display(self)
+
     @on(
         Checkbox.Changed,
         (
@@ -1678,9 +1830,11 @@ class VNAApp(App):
         del event
         log_logic.handle_log_filter_change(self)
 
-    # Cached level→(icon, Rich style) map; None means rebuild on next use.
+    # Cached level→(icon, parsed Rich style) map; None means rebuild on next use.
     # Invalidated by on_app_theme_changed so colors always match the active theme.
-    _cached_style_map: dict[str, tuple[str, str]] | None = None
+    _cached_style_map: dict[str, tuple[str, Style]] | None = None
+    # Plot color scheme from the active theme, kept by get_app_plot_colors
+    _cached_plot_colors: dict | None = None
 
     def log_message(self, message: str, level: str = "info"):
         """Add message to log."""
@@ -1846,30 +2000,32 @@ class VNAApp(App):
 
     def set_progress(self, label: str, progress: float = 0):
         """Update progress bar and label. Progress is 0-100."""
-        self.query_one("#progress_label", Label).update(f"{label} ({progress:.0f}%)")
-        progress_bar = self.query_one("#progress_bar", ProgressBar)
+        self._cached_query("#progress_label", Label).update(
+            f"{label} ({progress:.0f}%)"
+        )
+        progress_bar = self._cached_query("#progress_bar", ProgressBar)
         progress_bar.update(total=100, progress=progress)
 
     def reset_progress(self):
         """Reset progress bar based on connection state."""
         if self.connected:
-            self.query_one("#progress_label", Label).update("Ready")
+            self._cached_query("#progress_label", Label).update("Ready")
         else:
-            self.query_one("#progress_label", Label).update("Disconnected")
-        progress_bar = self.query_one("#progress_bar", ProgressBar)
+            self._cached_query("#progress_label", Label).update("Disconnected")
+        progress_bar = self._cached_query("#progress_bar", ProgressBar)
         progress_bar.update(total=100, progress=0)
 
     def disable_all_buttons(self):
         """Disable all action buttons during operations."""
-        self.query_one("#btn_connect", Button).disabled = True
-        self.query_one("#btn_read_params", Button).disabled = True
-        self.query_one("#btn_measure", Button).disabled = True
+        self._cached_query("#btn_connect", Button).disabled = True
+        self._cached_query("#btn_read_params", Button).disabled = True
+        self._cached_query("#btn_measure", Button).disabled = True
 
     def enable_buttons_for_state(self):
         """Enable buttons based on connection state."""
-        self.query_one("#btn_connect", Button).disabled = False
-        self.query_one("#btn_read_params", Button).disabled = not self.connected
-        self.query_one("#btn_measure", Button).disabled = not self.connected
+        self._cached_query("#btn_connect", Button).disabled = False
+        self._cached_query("#btn_read_params", Button).disabled = not self.connected
+        self._cached_query("#btn_measure", Button).disabled = not self.connected
         self._refresh_export_button_labels()
         self._sync_measurement_action_buttons()
 
@@ -1880,7 +2036,7 @@ class VNAApp(App):
         When connected, sets the button label to "🔌\nDisconnect" and its variant to "error".
         When disconnected, sets the button label to "📡\nConnect" and its variant to "primary".
         """
-        btn = self.query_one("#btn_connect", Button)
+        btn = self._cached_query("#btn_connect", Button)
         if self.connected:
             btn.label = "🔌\nDisconnect"
             btn.variant = "error"
@@ -1889,9 +2045,16 @@ class VNAApp(App):
             btn.variant = "primary"
 
     def _refresh_export_button_labels(self) -> None:
-        """Update Measurement-tab export controls to reflect minimal export mode."""
-        toggle_button = self.query_one("#btn_minimal_export", Button)
+        """Update Measurement-tab export controls to reflect minimal export mode.
+
+        The buttons only depend on the mode, so nothing is touched when they
+        are already styled for it.
+        """
         minimal_export = self._minimal_export_mode
+        if getattr(self, "_export_buttons_mode", None) == minimal_export:
+            return
+
+        toggle_button = self.query_one("#btn_minimal_export", Button)
         variant = "warning" if minimal_export else "success"
 
         toggle_button.variant = "warning" if minimal_export else "default"
@@ -1911,6 +2074,7 @@ class VNAApp(App):
             button = self.query_one(selector, Button)
             button.variant = variant
             button.set_class(minimal_export, "-minimal-export")
+        self._export_buttons_mode = minimal_export
 
     def _show_help_document(self, filename: str, title: str) -> None:
         """Load a markdown help document from package resources and show it."""
@@ -1976,8 +2140,7 @@ class VNAApp(App):
         freqs = self.last_measurement["freqs"]
         sparams = self.last_measurement["sparams"]
         freq_unit = self.last_measurement.get("freq_unit", "MHz")
-        unit_multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
-        multiplier = unit_multipliers.get(freq_unit, 1e6)
+        multiplier = FREQ_UNIT_CONVERSIONS.get(freq_unit, 1e6)
 
         trace = self._get_tools_trace()
         try:
@@ -2173,19 +2336,22 @@ class VNAApp(App):
 
     def _update_params_ui(self, result: ParamsResult) -> None:
         """Update UI with parameters read from VNA."""
-        freq_unit_value = self.query_one("#select_freq_unit", Select).value
+        freq_unit_value = self._cached_query("#select_freq_unit", Select).value
         freq_unit = freq_unit_value if isinstance(freq_unit_value, str) else "MHz"
-        unit_multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
-        multiplier = unit_multipliers.get(freq_unit, 1e6)
+        multiplier = FREQ_UNIT_CONVERSIONS.get(freq_unit, 1e6)
 
         start_val = result.start_freq / multiplier
         stop_val = result.stop_freq / multiplier
 
-        self.query_one("#input_start_freq", Input).value = f"{start_val:.2f}"
-        self.query_one("#input_stop_freq", Input).value = f"{stop_val:.2f}"
-        self.query_one("#input_points", Input).value = str(result.points)
-        self.query_one("#check_averaging", Checkbox).value = result.averaging_enabled
-        self.query_one("#input_avg_count", Input).value = str(result.averaging_count)
+        self._cached_query("#input_start_freq", Input).value = f"{start_val:.2f}"
+        self._cached_query("#input_stop_freq", Input).value = f"{stop_val:.2f}"
+        self._cached_query("#input_points", Input).value = str(result.points)
+        self._cached_query("#check_averaging", Checkbox).value = (
+            result.averaging_enabled
+        )
+        self._cached_query("#input_avg_count", Input).value = str(
+            result.averaging_count
+        )
 
     @on(Button.Pressed, "#btn_measure")
     def handle_measure(self) -> None:
@@ -2198,37 +2364,20 @@ class VNAApp(App):
 
         try:
             # Get frequency unit and convert to Hz
-            freq_unit_value = self.query_one("#select_freq_unit", Select).value
+            freq_unit_value = self._cached_query("#select_freq_unit", Select).value
             freq_unit = freq_unit_value if isinstance(freq_unit_value, str) else "MHz"
-            unit_multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
-            multiplier = unit_multipliers.get(freq_unit, 1e6)
+            multiplier = FREQ_UNIT_CONVERSIONS.get(freq_unit, 1e6)
 
-            # Update config from inputs
-            self.config.start_freq_hz = (
-                float(self.query_one("#input_start_freq", Input).value) * multiplier
+            # Parse every input before touching the config, so a bad value
+            # leaves the previous sweep settings intact
+            start_freq_hz = (
+                float(self._cached_query("#input_start_freq", Input).value) * multiplier
             )
-            self.config.stop_freq_hz = (
-                float(self.query_one("#input_stop_freq", Input).value) * multiplier
+            stop_freq_hz = (
+                float(self._cached_query("#input_stop_freq", Input).value) * multiplier
             )
-            self.config.sweep_points = int(self.query_one("#input_points", Input).value)
-            self.config.averaging_count = int(
-                self.query_one("#input_avg_count", Input).value
-            )
-
-            # Update config toggles
-            self.config.set_freq_range = self.query_one(
-                "#check_set_freq", Checkbox
-            ).value
-            self.config.set_sweep_points = self.query_one(
-                "#check_set_points", Checkbox
-            ).value
-            self.config.enable_averaging = self.query_one(
-                "#check_averaging", Checkbox
-            ).value
-            self.config.set_averaging_count = self.query_one(
-                "#check_set_avg_count", Checkbox
-            ).value
-
+            sweep_points = int(self._cached_query("#input_points", Input).value)
+            averaging_count = int(self._cached_query("#input_avg_count", Input).value)
         except (ValueError, TypeError) as e:
             self.log_message(f"Invalid configuration: {e}", "error")
             self.notify(f"Invalid configuration: {e}", severity="error")
@@ -2237,6 +2386,25 @@ class VNAApp(App):
             self.reset_progress()
             return
 
+        self.config.start_freq_hz = start_freq_hz
+        self.config.stop_freq_hz = stop_freq_hz
+        self.config.sweep_points = sweep_points
+        self.config.averaging_count = averaging_count
+
+        # Update config toggles
+        self.config.set_freq_range = self._cached_query(
+            "#check_set_freq", Checkbox
+        ).value
+        self.config.set_sweep_points = self._cached_query(
+            "#check_set_points", Checkbox
+        ).value
+        self.config.enable_averaging = self._cached_query(
+            "#check_averaging", Checkbox
+        ).value
+        self.config.set_averaging_count = self._cached_query(
+            "#check_set_avg_count", Checkbox
+        ).value
+
         # Save settings before measurement
         self._save_current_settings()
 
@@ -2251,22 +2419,35 @@ class VNAApp(App):
         Process a completed measurement: export selected S-parameters, cache
         the measurement, and update the UI and plots.
 
+        Runs :meth:`_prepare_measurement_export` and, when it returns a plan,
+        awaits :meth:`_export_measurement`. The worker message handler calls
+        the two halves itself so that only the export needs a task.
+
         Parameters:
             result (MeasurementResult): Measurement outcome containing
                 frequency array and S-parameter data.
+        """
+        export = VNAApp._prepare_measurement_export(self, result)
+        if export is not None:
+            await VNAApp._export_measurement(self, export)
 
-        Behavior:
-            - Exports the S-parameters selected in the UI to a Touchstone
-              file.
-            - Updates `self.last_measurement` and `self.last_output_path`
-              with the saved file and raw measurement data.
-            - Synchronizes plot selection checkboxes to match export
-              selections.
-            - Triggers redraw of the main results plot and the Tools plot,
-              then runs tool computations.
-            - Updates progress indicators, logs success or errors, and sets
-              the app subtitle to reflect completion or failure.
+    def _prepare_measurement_export(
+        self, result: MeasurementResult
+    ) -> _MeasurementExport | None:
         """
+        Resolve what and where to export for a completed measurement.
+
+        Reads the export selection and output templates from the UI,
+        validates and renders the templates, and records them in the
+        template history. Returns ``None`` when there is nothing to export,
+        the templates are invalid, or an error occurs; processing is then
+        finished here and the action buttons are re-enabled.
+
+        Parameters:
+            result (MeasurementResult): Measurement outcome containing
+                frequency array and S-parameter data.
+        """
+        export = None
         try:
             self.log_message("Processing measurement result...", "debug")
             freqs = result.frequencies
@@ -2283,15 +2464,10 @@ class VNAApp(App):
 
             # Filter S-parameters based on export checkboxes
             self.log_message("Filtering S-parameters for export...", "debug")
-            export_params = {}
-            if self.query_one("#check_export_s11", Checkbox).value:
-                export_params["S11"] = sparams["S11"]
-            if self.query_one("#check_export_s21", Checkbox).value:
-                export_params["S21"] = sparams["S21"]
-            if self.query_one("#check_export_s12", Checkbox).value:
-                export_params["S12"] = sparams["S12"]
-            if self.query_one("#check_export_s22", Checkbox).value:
-                export_params["S22"] = sparams["S22"]
+            export_params = {
+                param: sparams[param]
+                for param in VNAApp._checked_sparams(self, "export")
+            }
 
             self.log_message(
                 f"Exporting {len(export_params)} S-parameters: {', '.join(export_params.keys())}",
@@ -2301,7 +2477,7 @@ class VNAApp(App):
             if not export_params:
                 self.log_message("No S-parameters selected for export", "error")
                 self.sub_title = "Connected"
-                return
+                return None
 
             # Export to touchstone
             self.set_progress("Exporting...", 80)
@@ -2359,7 +2535,7 @@ class VNAApp(App):
                     "error",
                 )
                 self.sub_title = "Connected"
-                return
+                return None
 
             export_context = setup_logic.build_export_template_context_for_app(self)
             rendered_filename = render_template(
@@ -2400,8 +2576,52 @@ class VNAApp(App):
             )
             self.settings_manager.save(self.settings)
 
-            export_folder: str = output_folder
-            export_filename: str = filename
+            export = _MeasurementExport(
+                freqs=freqs,
+                sparams=sparams,
+                export_params=export_params,
+                freq_unit=freq_unit,
+                output_folder=output_folder,
+                filename=filename,
+            )
+            return export
+
+        except Exception as e:
+            self.log_message(f"Post-measurement processing failed: {str(e)}", "error")
+            self.sub_title = f"Error: {str(e)}"
+            return None
+
+        finally:
+            if export is None:
+                VNAApp._finish_measurement_processing(self)
+
+    async def _export_measurement(self, export: _MeasurementExport) -> None:
+        """
+        Export a prepared measurement, cache it, and update the UI and plots.
+
+        Behavior:
+            - Exports the selected S-parameters to a Touchstone file, plus
+              the CSV/PNG/SVG bundle files enabled in the UI.
+            - Updates `self.last_measurement` and `self.last_output_path`
+              with the saved file and raw measurement data.
+            - Synchronizes plot selection checkboxes to match export
+              selections.
+            - Triggers redraw of the main results plot and the Tools plot,
+              then runs tool computations.
+            - Updates progress indicators, logs success or errors, and sets
+              the app subtitle to reflect completion or failure.
+
+        Parameters:
+            export (_MeasurementExport): Plan built by
+                :meth:`_prepare_measurement_export`.
+        """
+        freqs = export.freqs
+        sparams = export.sparams
+        export_params = export.export_params
+        freq_unit = export.freq_unit
+        try:
+            export_folder: str = export.output_folder
+            export_filename: str = export.filename
             export_name: str = "measurement"
             exported_trace_names = list(export_params.keys())
             minimal_export = self._is_minimal_export_enabled()
@@ -2512,18 +2732,11 @@ class VNAApp(App):
                 )
 
             # Set plot checkboxes to match export parameters
-            self.query_one("#check_plot_s11", Checkbox).value = self.query_one(
-                "#check_export_s11", Checkbox
-            ).value
-            self.query_one("#check_plot_s21", Checkbox).value = self.query_one(
-                "#check_export_s21", Checkbox
-            ).value
-            self.query_one("#check_plot_s12", Checkbox).value = self.query_one(
-                "#check_export_s12", Checkbox
-            ).value
-            self.query_one("#check_plot_s22", Checkbox).value = self.query_one(
-                "#check_export_s22", Checkbox
-            ).value
+            for param in _SPARAM_NAMES:
+                name = param.lower()
+                self.query_one(f"#check_plot_{name}", Checkbox).value = self.query_one(
+                    f"#check_export_{name}", Checkbox
+                ).value
 
             # Generate plot and update results
             self.set_progress("Updating results...", 90)
@@ -2544,9 +2757,13 @@ class VNAApp(App):
             self.sub_title = f"Error: {str(e)}"
 
         finally:
-            self.measuring = False
-            self.enable_buttons_for_state()
-            self.reset_progress()
+            VNAApp._finish_measurement_processing(self)
+
+    def _finish_measurement_processing(self) -> None:
+        """Leave the measuring state once a completed measurement is handled."""
+        self.measuring = False
+        self.enable_buttons_for_state()
+        self.reset_progress()
 
     @on(Button.Pressed, "#btn_import_results")
     def handle_import_results(self) -> None:
@@ -2587,18 +2804,30 @@ class VNAApp(App):
             return {}
 
         sparams = self.last_measurement["sparams"]
-        export_params: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        return {
+            param: sparams[param]
+            for param in VNAApp._checked_sparams(self, "export", sparams)
+        }
 
-        if self.query_one("#check_export_s11", Checkbox).value and "S11" in sparams:
-            export_params["S11"] = sparams["S11"]
-        if self.query_one("#check_export_s21", Checkbox).value and "S21" in sparams:
-            export_params["S21"] = sparams["S21"]
-        if self.query_one("#check_export_s12", Checkbox).value and "S12" in sparams:
-            export_params["S12"] = sparams["S12"]
-        if self.query_one("#check_export_s22", Checkbox).value and "S22" in sparams:
-            export_params["S22"] = sparams["S22"]
+    def _checked_sparams(
+        self, group: str, available: Collection[str] | None = None
+    ) -> list[str]:
+        """
+        Return the S-parameters whose checkbox in *group* is ticked.
+
+        Parameters:
+            group: Checkbox group, ``"export"`` or ``"plot"`` (``#check_{group}_s11``).
+            available: When given, parameters not contained in it are skipped.
 
-        return export_params
+        Returns:
+            The ticked parameter names in S11, S21, S12, S22 order.
+        """
+        return [
+            param
+            for param in _SPARAM_NAMES
+            if (available is None or param in available)
+            and self._cached_query(f"#check_{group}_{param.lower()}", Checkbox).value
+        ]
 
     def _choose_measurement_export_path(
         self,
@@ -2610,27 +2839,23 @@ class VNAApp(App):
         fallback_name: str,
     ) -> str:
         """Open a save dialog for a measurement export and return the chosen path."""
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes("-topmost", True)
+        root = VNAApp._dialog_root(self)
 
         if default_source:
             default_name = Path(str(default_source)).stem + extension
         else:
             default_name = fallback_name
 
-        try:
-            return filedialog.asksaveasfilename(
-                title=title,
-                defaultextension=extension,
-                filetypes=filetypes,
-                initialdir=(
-                    self.settings.output_folder if self.settings.output_folder else "."
-                ),
-                initialfile=default_name,
-            )
-        finally:
-            root.destroy()
+        return filedialog.asksaveasfilename(
+            parent=root,
+            title=title,
+            defaultextension=extension,
+            filetypes=filetypes,
+            initialdir=(
+                self.settings.output_folder if self.settings.output_folder else "."
+            ),
+            initialfile=default_name,
+        )
 
     @on(Button.Pressed, "#btn_export_touchstone")
     def handle_export_touchstone(self, event: Button.Pressed | None = None) -> None:
@@ -2782,9 +3007,7 @@ class VNAApp(App):
 
         try:
             # Use tkinter file dialog
-            root = tk.Tk()
-            root.withdraw()
-            root.attributes("-topmost", True)
+            root = VNAApp._dialog_root(self)
 
             # Use s2p filename as default if available
             if self.last_output_path:
@@ -2793,6 +3016,7 @@ class VNAApp(App):
                 default_name = "plot.png"
 
             file_path = filedialog.asksaveasfilename(
+                parent=root,
                 title="Export Plot as PNG",
                 defaultextension=".png",
                 filetypes=[("PNG Image", "*.png"), ("All Files", "*.*")],
@@ -2801,22 +3025,13 @@ class VNAApp(App):
                 ),
                 initialfile=default_name,
             )
-            root.destroy()
 
             if not file_path:
                 return  # User cancelled
 
             # Get current plot settings
             plot_type = self.query_one("#select_plot_type", Select).value
-            plot_params = []
-            if self.query_one("#check_plot_s11", Checkbox).value:
-                plot_params.append("S11")
-            if self.query_one("#check_plot_s21", Checkbox).value:
-                plot_params.append("S21")
-            if self.query_one("#check_plot_s12", Checkbox).value:
-                plot_params.append("S12")
-            if self.query_one("#check_plot_s22", Checkbox).value:
-                plot_params.append("S22")
+            plot_params = VNAApp._checked_sparams(self, "plot")
 
             minimal_export = self._is_minimal_export_enabled()
 
@@ -2855,9 +3070,7 @@ class VNAApp(App):
 
         try:
             # Use tkinter file dialog
-            root = tk.Tk()
-            root.withdraw()
-            root.attributes("-topmost", True)
+            root = VNAApp._dialog_root(self)
 
             # Use s2p filename as default if available
             if self.last_output_path:
@@ -2866,6 +3079,7 @@ class VNAApp(App):
                 default_name = "plot.svg"
 
             file_path = filedialog.asksaveasfilename(
+                parent=root,
                 title="Export Plot as SVG",
                 defaultextension=".svg",
                 filetypes=[("SVG Vector Image", "*.svg"), ("All Files", "*.*")],
@@ -2874,22 +3088,13 @@ class VNAApp(App):
                 ),
                 initialfile=default_name,
             )
-            root.destroy()
 
             if not file_path:
                 return  # User cancelled
 
             # Get current plot settings
             plot_type = self.query_one("#select_plot_type", Select).value
-            plot_params = []
-            if self.query_one("#check_plot_s11", Checkbox).value:
-                plot_params.append("S11")
-            if self.query_one("#check_plot_s21", Checkbox).value:
-                plot_params.append("S21")
-            if self.query_one("#check_plot_s12", Checkbox).value:
-                plot_params.append("S12")
-            if self.query_one("#check_plot_s22", Checkbox).value:
-                plot_params.append("S22")
+            plot_params = VNAApp._checked_sparams(self, "plot")
 
             minimal_export = self._is_minimal_export_enabled()
 
@@ -3008,39 +3213,38 @@ class VNAApp(App):
 
     def on_resize(self, event) -> None:
         """
-        Handle window resize events and schedule debounced UI updates.
+        Handle window resize events and schedule one debounced UI update.
 
-        If a measurement is loaded, cancels any pending main-plot timer and
-        schedules a debounced redraw of the results plot after 150
-        milliseconds. If the Tools tab is active and a measurement exists,
-        cancels any pending tools-plot timer and schedules a debounced
-        tools-plot refresh after 150 milliseconds. If an output path is set,
-        cancels any pending path-update timer and schedules a debounced
-        update of the displayed output-file label after 300 milliseconds.
+        Every resize restarts a single 150 millisecond timer, so a burst of
+        resize events ends in one call to `_apply_resize` once the terminal
+        size settles.
 
         Parameters:
             event: The resize event object provided by the Textual framework.
         """
-        if self.last_measurement is not None:
-            # Cancel any pending resize timer
-            if self._resize_timer is not None:
-                self._resize_timer.stop()
-            # Debounce: redraw only after resize activity settles briefly.
-            self._resize_timer = self.set_timer(0.15, self._redraw_plot)
-
-        # Debounce tools plot redraw — only when Tools tab is visible
-        if self.last_measurement is not None and self._is_tools_tab_active():
-            if self._tools_resize_timer is not None:
-                self._tools_resize_timer.stop()
-            self._tools_resize_timer = self.set_timer(0.15, self._delayed_tools_refresh)
-
-        # Update output file path label
+        del event
+        if self.last_measurement is None and self.last_output_path is None:
+            return
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(0.15, self._apply_resize)
+
+    async def _apply_resize(self) -> None:
+        """
+        Reflow size-dependent widgets after a burst of resize events.
+
+        Updates the output-file path label, then redraws the results plot and,
+        when the Tools tab is visible, the tools plot.
+        """
+        self._resize_timer = None
         if self.last_output_path is not None:
-            if self._path_update_timer is not None:
-                self._path_update_timer.stop()
-            self._path_update_timer = self.set_timer(
-                0.3, self._update_output_path_label
-            )
+            self._update_output_path_label()
+        if self.last_measurement is None:
+            return
+        if self._is_tools_tab_active():
+            await asyncio.gather(self._redraw_plot(), self._delayed_tools_refresh())
+        else:
+            await self._redraw_plot()
 
     async def _delayed_redraw_plot(self) -> None:
         """Delayed plot redraw to ensure proper container sizing."""
@@ -3103,7 +3307,7 @@ class VNAApp(App):
     def _get_results_plot_display_key(self) -> tuple[int, int]:
         """Return the current Results container size used for display decisions."""
         try:
-            container = self.query_one("#results_container", Container)
+            container = self._cached_query("#results_container", Container)
             return (
                 int(container.content_size.width or 0),
                 int(container.content_size.height or 0),
@@ -3117,23 +3321,16 @@ class VNAApp(App):
         sparams: dict[str, tuple[np.ndarray, np.ndarray]],
     ) -> tuple[object, ...]:
         """Return a cache key describing the current Results plot inputs."""
-        plot_type_value = self.query_one("#select_plot_type", Select).value
+        plot_type_value = self._cached_query("#select_plot_type", Select).value
         plot_type = (
             str(plot_type_value) if isinstance(plot_type_value, str) else "magnitude"
         )
-        selected_traces = tuple(
-            param
-            for param in ("S11", "S21", "S12", "S22")
-            if param in sparams
-            and self.query_one(f"#check_plot_{param.lower()}", Checkbox).value
-        )
-        freq_min = self.query_one("#input_plot_freq_min", Input).value.strip()
-        freq_max = self.query_one("#input_plot_freq_max", Input).value.strip()
-        y_min = self.query_one("#input_plot_y_min", Input).value.strip()
-        y_max = self.query_one("#input_plot_y_max", Input).value.strip()
-        colors_signature = tools_logic._freeze_cache_value(
-            get_plot_colors(self.get_css_variables())
-        )
+        selected_traces = tuple(VNAApp._checked_sparams(self, "plot", sparams))
+        freq_min = self._cached_query("#input_plot_freq_min", Input).value.strip()
+        freq_max = self._cached_query("#input_plot_freq_max", Input).value.strip()
+        y_min = self._cached_query("#input_plot_y_min", Input).value.strip()
+        y_max = self._cached_query("#input_plot_y_max", Input).value.strip()
+        colors_signature = tools_logic._freeze_cache_value(get_app_plot_colors(self))
         data_signature = (
             id(freqs),
             tuple(
@@ -3155,11 +3352,8 @@ class VNAApp(App):
 
     async def _apply_cached_results_plot_display(self) -> bool:
         """Reuse the already-rendered Results image when only layout changed."""
-        if self.settings.plot_backend != "image" or not self.last_plot_path:
-            return False
-
-        plot_file = Path(self.last_plot_path)
-        if not plot_file.exists():
+        plot_image = self.last_plot_image
+        if self.settings.plot_backend != "image" or plot_image is None:
             return False
 
         try:
@@ -3198,8 +3392,8 @@ class VNAApp(App):
                 pixel_size = (1920, 1920) if plot_type == "smith" else (1920, 1080)
             px_w, px_h = pixel_size
 
-            img_widget, _ = await ensure_results_widget(ImageWidget, str(plot_file))
-            img_widget.image = str(plot_file)
+            img_widget, _ = await ensure_results_widget(ImageWidget, plot_image)
+            img_widget.image = plot_image
             container_w = results_container.content_size.width
 
             if container_w and container_w > 10 and px_w and px_h:
@@ -3557,22 +3751,23 @@ class VNAApp(App):
         #btn_export_png, #btn_export_svg), computes the remaining width, and
         uses `truncate_path_intelligently` to produce a shortened path
         prefixed with "📁 ". If the computed available width is too small
-        (<= 10) the label is not updated. The method ignores exceptions
+        (<= 10) the label is not updated, and it is left alone when it already
+        shows the same path for the same width. The method ignores exceptions
         raised while querying widgets (e.g., widgets not yet mounted).
         """
         if self.last_output_path is None:
             return
 
         try:
-            output_file_label = self.query_one("#output_file_label", Static)
-            container = self.query_one("#output_file_container")
+            output_file_label = self._cached_query("#output_file_label", Static)
+            container = self._cached_query("#output_file_container", Widget)
 
             # Calculate actual button widths
-            btn_show = self.query_one("#btn_open_output", Button)
-            btn_touchstone = self.query_one("#btn_export_touchstone", Button)
-            btn_csv = self.query_one("#btn_export_csv", Button)
-            btn_png = self.query_one("#btn_export_png", Button)
-            btn_svg = self.query_one("#btn_export_svg", Button)
+            btn_show = self._cached_query("#btn_open_output", Button)
+            btn_touchstone = self._cached_query("#btn_export_touchstone", Button)
+            btn_csv = self._cached_query("#btn_export_csv", Button)
+            btn_png = self._cached_query("#btn_export_png", Button)
+            btn_svg = self._cached_query("#btn_export_svg", Button)
 
             # Sum of button widths + margins (each button has margin-left: 1)
             buttons_width = (
@@ -3587,11 +3782,17 @@ class VNAApp(App):
             # Available width for path = container width - buttons - buffer
             available_width = container.size.width - buttons_width - 4
 
+            # The label already shows this path truncated to this width
+            label_state = (available_width, str(self.last_output_path))
+            if label_state == getattr(self, "_output_label_state", None):
+                return
+
             if available_width > 10:
                 truncated_path = truncate_path_intelligently(
                     str(self.last_output_path), available_width
                 )
                 output_file_label.update(f"📁 {truncated_path}")
+                self._output_label_state = label_state
         except Exception:
             # If query fails (widget not yet mounted), ignore
             pass
@@ -3900,8 +4101,7 @@ class VNAApp(App):
         freq_unit = (
             measurement_freq_unit if isinstance(measurement_freq_unit, str) else "MHz"
         )
-        unit_multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
-        multiplier = unit_multipliers.get(freq_unit, 1e6)
+        multiplier = FREQ_UNIT_CONVERSIONS.get(freq_unit, 1e6)
 
         # Update input placeholders with original values and unit
         freq_min_orig = freqs[0] / multiplier
@@ -3957,33 +4157,13 @@ class VNAApp(App):
 
         # Calculate min, max, avg for all S-parameters (using filtered data)
         stats = {}
-        for param in ["S11", "S21", "S12", "S22"]:
+        for param in _SPARAM_NAMES:
             if param in filtered_sparams:
                 mag = filtered_sparams[param][0]
                 stats[param] = {"min": mag.min(), "max": mag.max(), "avg": mag.mean()}
 
         # Get selected parameters for plot from checkboxes
-        plot_params = []
-        if (
-            self.query_one("#check_plot_s11", Checkbox).value
-            and "S11" in filtered_sparams
-        ):
-            plot_params.append("S11")
-        if (
-            self.query_one("#check_plot_s21", Checkbox).value
-            and "S21" in filtered_sparams
-        ):
-            plot_params.append("S21")
-        if (
-            self.query_one("#check_plot_s12", Checkbox).value
-            and "S12" in filtered_sparams
-        ):
-            plot_params.append("S12")
-        if (
-            self.query_one("#check_plot_s22", Checkbox).value
-            and "S22" in filtered_sparams
-        ):
-            plot_params.append("S22")
+        plot_params = VNAApp._checked_sparams(self, "plot", filtered_sparams)
 
         # Reuse the existing results widget when the widget type stays the same.
         # This avoids unnecessary unmount/mount churn and reduces visual flicker.
@@ -4146,7 +4326,7 @@ class VNAApp(App):
 
                 # Plot data as line with braille markers (use filtered data)
                 freq_mhz = filtered_freqs / 1e6
-                plot_colors = get_plot_colors(self.get_css_variables())
+                plot_colors = get_app_plot_colors(self)
 
                 # Calculate Y limits first (before plotting)
                 if all_y_data and auto_y_min is not None and auto_y_max is not None:
@@ -4200,11 +4380,9 @@ class VNAApp(App):
                 plot_generation = self._plot_render_generation
 
                 # Generate matplotlib plot at fixed high resolution
-                # This avoids regenerating on resize and ensures quality
-                plot_file = self.plot_temp_dir / f"current_plot_{plot_generation}.png"
-
-                # Log for debugging
-                self.log_message(f"Generating plot at: {plot_file}", "debug")
+                # This avoids regenerating on resize and ensures quality.
+                # The image stays in memory; only exports are written to disk.
+                self.log_message("Generating plot image", "debug")
 
                 # Fixed high-resolution dimensions for quality
                 # Target: 1080p (1920x1080) at high DPI
@@ -4227,7 +4405,7 @@ class VNAApp(App):
 
                 plot_colors_snapshot = {
                     key: dict(value) if isinstance(value, dict) else value
-                    for key, value in get_plot_colors(self.get_css_variables()).items()
+                    for key, value in get_app_plot_colors(self).items()
                 }
                 freqs_snapshot = np.array(filtered_freqs, copy=True)
                 plot_data_snapshot = None
@@ -4246,13 +4424,14 @@ class VNAApp(App):
                 y_min_for_render = user_y_min if user_y_min is not None else auto_y_min
                 y_max_for_render = user_y_max if user_y_max is not None else auto_y_max
 
+                plot_image: Image.Image | None = None
                 try:
-                    await self._run_results_plot_render_job(
+                    render_result = await self._run_results_plot_render_job(
                         freqs=freqs_snapshot,
                         sparams=sparams_snapshot,
                         plot_params=plot_params,
                         plot_type=str(plot_type),
-                        output_path=plot_file,
+                        output_path=None,
                         dpi=dpi,
                         pixel_width=px_w,
                         pixel_height=px_h,
@@ -4262,6 +4441,9 @@ class VNAApp(App):
                         y_max=y_max_for_render,
                         plot_data=plot_data_snapshot,
                     )
+                    rendered = render_result.get("image")
+                    if isinstance(rendered, Image.Image):
+                        plot_image = rendered
                 except Exception as e:
                     if plot_generation != self._plot_render_generation:
                         self.log_message(
@@ -4278,7 +4460,6 @@ class VNAApp(App):
                     plot_widget.update(
                         f"[red]Failed to generate plot image[/red]\n[dim]Error: {e}[/dim]"
                     )
-                    plot_file = None
 
                 if plot_generation != self._plot_render_generation:
                     self.log_message(
@@ -4287,14 +4468,11 @@ class VNAApp(App):
                     )
                     return
 
-                # Store plot path for export
-                self.last_plot_path = plot_file
+                # Keep the image for redisplay after layout-only changes
+                self.last_plot_image = plot_image
 
-                # Verify file was created
-                if plot_file is None or not plot_file.exists():
-                    self.log_message(
-                        f"Error: Plot file not created at {plot_file}", "error"
-                    )
+                if plot_image is None:
+                    self.log_message("Error: Plot image was not rendered", "error")
                     self._results_plot_cache_key = None
                     self._results_plot_display_key = None
                     self._results_plot_pixel_size = None
@@ -4306,7 +4484,8 @@ class VNAApp(App):
                     plot_widget.update("[red]Failed to generate plot image[/red]")
                 else:
                     self.log_message(
-                        f"Plot file created: {plot_file.stat().st_size} bytes", "debug"
+                        f"Plot image rendered: {plot_image.width}x{plot_image.height}",
+                        "debug",
                     )
 
                     # Display image using textual-image widget
@@ -4341,15 +4520,13 @@ class VNAApp(App):
                             self.log_message("Forcing Kitty graphics protocol", "debug")
 
                         # Create image widget - accepts Path or str
-                        self.log_message(
-                            f"Creating image widget for: {plot_file}", "debug"
-                        )
+                        self.log_message("Creating image widget", "debug")
 
                         img_widget, _ = await ensure_results_widget(
                             ImageWidget,
-                            str(plot_file),
+                            plot_image,
                         )
-                        img_widget.image = str(plot_file)
+                        img_widget.image = plot_image
 
                         # Calculate display size based on available container width
                         # and preserve the actual aspect ratio of the generated plot
@@ -4406,17 +4583,14 @@ class VNAApp(App):
                         self.log_message("Image widget ready", "debug")
                     except Exception as e:
                         self.log_message(f"Failed to display image: {e}", "error")
-                        # Fallback: show file location
                         plot_widget, _ = await ensure_results_widget(
                             Static,
                             f"[yellow]Plot generated but display failed[/yellow]\n"
-                            f"[cyan]File: {plot_file}[/cyan]\n"
                             f"[dim]Error: {e}[/dim]",
                             markup=True,
                         )
                         plot_widget.update(
                             f"[yellow]Plot generated but display failed[/yellow]\n"
-                            f"[cyan]File: {plot_file}[/cyan]\n"
                             f"[dim]Error: {e}[/dim]"
                         )
                     mark_results_rendered(
@@ -4464,8 +4638,23 @@ class VNAApp(App):
         self._refresh_export_button_labels()
 
 
+def _import_uvloop():
+    """Return the optional uvloop module, or None when it cannot be used."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop
+
+
 def run_gui(test_updates: bool = False, dev_mode: bool = False):
-    """Run GUI mode with proper imports."""
+    """Run GUI mode with proper imports.
+
+    The app runs on a uvloop event loop when the optional ``uvloop`` package
+    is installed, and on the default asyncio loop otherwise.
+    """
     from .config.migration import migrate_legacy_config
 
     migration_message = migrate_legacy_config()
@@ -4474,23 +4663,11 @@ def run_gui(test_updates: bool = False, dev_mode: bool = False):
         dev_mode=dev_mode,
         migration_message=migration_message,
     )
-    app.run()
-
-
-def main():
-    """Main entry point."""
-    from .cli import create_cli_parser, run_cli_measurement
-
-    parser = create_cli_parser()
-    args = parser.parse_args()
-
-    if args.now:
-        # CLI mode - quick measurement
-        return run_cli_measurement(args)
+    uvloop = _import_uvloop()
+    if uvloop is None:
+        app.run()
     else:
-        # GUI mode
-        run_gui(test_updates=args.test_updates, dev_mode=args.dev)
-        return 0
+        uvloop.run(app.run_async())
 
 
 if __name__ == "__main__":
@@ -23,11 +23,27 @@ def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
 
     Returns:
         RGB tuple with values 0-255
+
+    Raises:
+        ValueError: If the string is not 3 or 6 hex digits
     """
     h = hex_color.lstrip("#")
-    if len(h) == 3:
+    original_len = len(h)
+    if original_len == 3:
         h = "".join(c * 2 for c in h)
-    return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
+    # isalnum() rejects the sign, whitespace and underscore forms int() allows
+    if len(h) != 6 or not h.isalnum():
+        raise ValueError(
+            f"Invalid hex color {hex_color!r}: expected 3 or 6 hex digits, got {original_len}"
+        )
+    v = int(h, 16)
+    return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+
+
+# Parsed once; get_plot_colors only converts theme colors that differ
+SPARAM_FALLBACK_COLORS_RGB: dict[str, tuple[int, int, int]] = {
+    param: hex_to_rgb(hex_val) for param, hex_val in SPARAM_FALLBACK_COLORS.items()
+}
 
 
 def get_plot_colors(theme_vars: dict[str, str] | None = None) -> dict:
@@ -65,8 +81,10 @@ def get_plot_colors(theme_vars: dict[str, str] | None = None) -> dict:
         grid = DEFAULT_GRID_COLOR
 
     # Build RGB tuples for plotext (which doesn't support hex strings)
-    traces_rgb = {}
+    traces_rgb = dict(SPARAM_FALLBACK_COLORS_RGB)
     for param, hex_val in traces.items():
+        if hex_val == SPARAM_FALLBACK_COLORS[param]:
+            continue
         try:
             traces_rgb[param] = hex_to_rgb(hex_val)
         except (ValueError, IndexError):
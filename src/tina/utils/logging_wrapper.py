@@ -31,7 +31,8 @@ class LoggingVNAWrapper:
     """Wraps a VNA driver to log every SCPI command sent and response received.
 
     The driver's low-level communication methods (_send_command, _query,
-    _query_ascii_values) are monkey-patched in-place so that higher-level
+    _query_ascii_values and, when the driver has it, _query_binary_values)
+    are monkey-patched in-place so that higher-level
     driver methods (get_status, configure_frequency, etc.) automatically
     produce log entries without any changes to the driver itself.
 
@@ -72,7 +73,7 @@ class LoggingVNAWrapper:
         self._wrap_scpi_methods()
 
     def _wrap_scpi_methods(self) -> None:
-        """Monkey-patch the driver's three SCPI primitives with logging versions.
+        """Monkey-patch the driver's SCPI primitives with logging versions.
 
         Originals are captured before patching and invoked inside each wrapper.
         ``_raw_query`` is stored separately so the ``SYST:ERR?`` debug check
@@ -81,6 +82,8 @@ class LoggingVNAWrapper:
         original_send = self._vna._send_command
         original_query = self._vna._query
         original_query_ascii = self._vna._query_ascii_values
+        # Optional primitive: only drivers using binary block transfers have it
+        original_query_binary = getattr(self._vna, "_query_binary_values", None)
         for name, fn in (
             ("_send_command", original_send),
             ("_query", original_query),
@@ -139,11 +142,8 @@ class LoggingVNAWrapper:
             _check_error(command)
             return response
 
-        def logged_query_ascii(command: str):
-            """Log TX, execute ASCII query, log RX summary, then error-check."""
-            send_tag, recv_tag = _tx_rx()
-            self._log(command, send_tag)
-            result = original_query_ascii(command)
+        def _log_values(result, recv_tag: str) -> None:
+            """Log a numeric array response, summarised when it is long."""
             if len(result) > 10:
                 self._log(
                     f"[{len(result)} values: {result[0]:.3e},{result[1]:.3e},{result[2]:.3e}...]",
@@ -151,12 +151,30 @@ class LoggingVNAWrapper:
                 )
             else:
                 self._log(str(result), recv_tag)
+
+        def logged_query_ascii(command: str):
+            """Log TX, execute ASCII query, log RX summary, then error-check."""
+            send_tag, recv_tag = _tx_rx()
+            self._log(command, send_tag)
+            result = original_query_ascii(command)
+            _log_values(result, recv_tag)
+            _check_error(command)
+            return result
+
+        def logged_query_binary(command: str):
+            """Log TX, execute binary block query, log RX summary, then error-check."""
+            send_tag, recv_tag = _tx_rx()
+            self._log(command, send_tag)
+            result = original_query_binary(command)
+            _log_values(result, recv_tag)
             _check_error(command)
             return result
 
         setattr(self._vna, "_send_command", logged_send_command)
         setattr(self._vna, "_query", logged_query)
         setattr(self._vna, "_query_ascii_values", logged_query_ascii)
+        if callable(original_query_binary):
+            setattr(self._vna, "_query_binary_values", logged_query_binary)
 
     def __getattr__(self, name):
         """Delegate all attribute lookups not found on the wrapper to the driver."""
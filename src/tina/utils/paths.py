@@ -47,11 +47,18 @@ def truncate_path_intelligently(path_str: str, max_width: int) -> str:
             return filename[: effective_width - 3] + "..."
         return filename[:effective_width]
 
-    # Strategy 2: Progressively drop folders from the left
-    for i in range(1, len(parts) - 1):
-        truncated = ".../" + "/".join(parts[i:])
-        if len(truncated) <= effective_width:
-            return truncated
+    # Strategy 2: Progressively drop folders from the left. Walk in from the
+    # right summing part lengths so only the final string gets built.
+    budget = effective_width - len(".../")
+    start = len(parts)
+    suffix_len = -1  # no separator in front of the first kept part
+    for i in range(len(parts) - 1, 0, -1):
+        suffix_len += len(parts[i]) + 1
+        if suffix_len > budget:
+            break
+        start = i
+    if start < len(parts) - 1:
+        return ".../" + "/".join(parts[start:])
 
     # Strategy 3: First letter of remaining folders + full filename
     if len(parts) > 1:
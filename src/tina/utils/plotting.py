@@ -1,36 +1,46 @@
 """Pure matplotlib rendering helpers and color utilities, with no GUI dependencies.
 
-Provides :func:`create_matplotlib_plot`, :func:`get_terminal_font`, and
-:func:`get_plot_colors` for use by both the CLI and the GUI layers without
-introducing an upward dependency on the ``tina.gui`` package.
+Provides :func:`create_matplotlib_plot`, :func:`get_terminal_font` (from
+:mod:`tina.utils.terminal`), and :func:`get_plot_colors` for use by both the
+CLI and the GUI layers without introducing an upward dependency on the
+``tina.gui`` package.
 """
 
 from __future__ import annotations
 
+import functools
 import logging
-import os
-import platform
-import re
-import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from io import BytesIO
 from pathlib import Path
 
-import matplotlib.font_manager as fm
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 import numpy as np
 from matplotlib import rc_context
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
 
 from tina.config.constants import (
     DEFAULT_BACKGROUND_COLOR,
     DEFAULT_FOREGROUND_COLOR,
     DEFAULT_GRID_COLOR,
     DISTORTION_OVERLAY_COLORS,
+    PLOT_TEMP_DIR_NAME,
     SPARAM_FALLBACK_COLORS,
     SPARAM_THEME_KEYS,
     THEME_PRIMARY,
     THEME_WARNING,
     TRACE_COLOR_DEFAULT,
 )
+from tina.utils.colors import SPARAM_FALLBACK_COLORS_RGB, hex_to_rgb
 from tina.utils.signal import calculate_plot_range_with_outlier_filtering, unwrap_phase
+from tina.utils.terminal import get_terminal_font
 
 _log = logging.getLogger(__name__)
 
@@ -59,29 +69,8 @@ DISTORTION_OVERLAY_LABELS: list[str] = [
 # Color helpers
 # ---------------------------------------------------------------------------
 
-
-def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-    """
-    Convert a hex color string into an (R, G, B) tuple of integers.
-
-    Accepts strings in the forms "#RRGGBB", "RRGGBB", "#RGB", or "RGB".
-    A leading "#" is optional; 3-digit shorthand is expanded to 6-digit form.
-
-    Parameters:
-        hex_color: Hex color string to convert.
-
-    Returns:
-        RGB components as integers (red, green, blue).
-    """
-    h = hex_color.lstrip("#")
-    original_len = len(h)
-    if original_len == 3:
-        h = "".join(c * 2 for c in h)
-    if len(h) != 6:
-        raise ValueError(
-            f"Invalid hex color {hex_color!r}: expected 3 or 6 hex digits, got {original_len}"
-        )
-    return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
+# Parsed once, like SPARAM_FALLBACK_COLORS_RGB in tina.utils.colors
+_DISTORTION_OVERLAY_COLORS_RGB = tuple(hex_to_rgb(h) for h in DISTORTION_OVERLAY_COLORS)
 
 
 def get_plot_colors(theme_vars: dict[str, str] | None = None) -> dict:
@@ -115,8 +104,10 @@ def get_plot_colors(theme_vars: dict[str, str] | None = None) -> dict:
         surface = bg
         grid = DEFAULT_GRID_COLOR
 
-    traces_rgb = {}
+    traces_rgb = dict(SPARAM_FALLBACK_COLORS_RGB)
     for param, hex_val in traces.items():
+        if hex_val == SPARAM_FALLBACK_COLORS[param]:
+            continue
         try:
             traces_rgb[param] = hex_to_rgb(hex_val)
         except (ValueError, IndexError):
@@ -136,7 +127,7 @@ def get_plot_colors(theme_vars: dict[str, str] | None = None) -> dict:
         return fallback, hex_to_rgb(fallback)
 
     distortion_overlays = list(DISTORTION_OVERLAY_COLORS)
-    distortion_overlays_rgb = [hex_to_rgb(h) for h in DISTORTION_OVERLAY_COLORS]
+    distortion_overlays_rgb = list(_DISTORTION_OVERLAY_COLORS_RGB)
 
     warning_hex, warning_rgb = _resolve_color(
         theme_vars.get("warning") if theme_vars else None, THEME_WARNING
@@ -166,194 +157,118 @@ def get_plot_colors(theme_vars: dict[str, str] | None = None) -> dict:
 
 
 # ---------------------------------------------------------------------------
-# Terminal font detection
+# Temporary plot files
 # ---------------------------------------------------------------------------
 
 
-def get_terminal_font() -> tuple[str, float | None]:
-    """Detect the terminal's font family and size by parsing its config file.
-
-    Uses TERM_PROGRAM to identify the terminal emulator, then reads its
-    configuration file to extract the font family and size.
-    Falls back to ('monospace', None).
+@functools.lru_cache(maxsize=1)
+def get_plot_temp_dir() -> Path:
+    """Return the directory for temporary plot images, creating it once.
 
-    Supported terminals: Ghostty, Kitty, Alacritty, WezTerm, iTerm2,
-    Windows Terminal.
+    The directory lives under the platform temp dir, so it also works on
+    Windows. Later calls return the cached path without touching the disk.
     """
-    import json
-
-    available_fonts = {f.name for f in fm.fontManager.ttflist}
-    term = os.environ.get("TERM_PROGRAM", "").lower()
-    home = Path.home()
-    font_name = None
-    font_size = None
-
-    def _parse_ghostty_config() -> None:
-        """Read font-family and font-size from the Ghostty config file if present."""
-        nonlocal font_name, font_size
-        cfg = home / ".config" / "ghostty" / "config"
-        if cfg.exists():
-            for line in cfg.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if line.startswith("#"):
-                    continue
-                if line.startswith("font-family") and not font_name:
-                    font_name = line.split("=", 1)[1].strip().strip("\"'")
-                elif line.startswith("font-size") and not font_size:
-                    try:
-                        font_size = float(line.split("=", 1)[1].strip().strip("\"'"))
-                    except ValueError:
-                        pass
-            if not font_size:
-                font_size = 13.0
-
-    try:
-        if "ghostty" in term:
-            _parse_ghostty_config()
-
-        elif "kitty" in term:
-            cfg = home / ".config" / "kitty" / "kitty.conf"
-            if cfg.exists():
-                for line in cfg.read_text(encoding="utf-8").splitlines():
-                    line = line.strip()
-                    if line.startswith("font_family") and not font_name:
-                        font_name = line.split(None, 1)[1].strip().strip("\"'")
-                    elif line.startswith("font_size") and not font_size:
-                        try:
-                            font_size = float(line.split(None, 1)[1].strip())
-                        except (ValueError, IndexError):
-                            pass
-
-        elif "alacritty" in term:
-            for name in ("alacritty.toml", "alacritty.yml"):
-                cfg = home / ".config" / "alacritty" / name
-                if cfg.exists():
-                    text = cfg.read_text(encoding="utf-8")
-                    if name.endswith(".toml"):
-                        m = re.search(
-                            r'\[font\.normal\]\s*\n\s*family\s*=\s*["\']([^"\']+)',
-                            text,
-                        )
-                        if m:
-                            font_name = m.group(1)
-                        m = re.search(
-                            r"\[font\]\s*\n(?:.*\n)*?\s*size\s*=\s*([\d.]+)", text
-                        )
-                        if m:
-                            font_size = float(m.group(1))
-                    else:
-                        m = re.search(
-                            r'font:\s*\n\s*normal:\s*\n\s*family:\s*["\']?([^\n"\']+)',
-                            text,
-                        )
-                        if m:
-                            font_name = m.group(1).strip()
-                        m = re.search(r"font:\s*\n(?:.*\n)*?\s*size:\s*([\d.]+)", text)
-                        if m:
-                            font_size = float(m.group(1))
-                    if font_name:
-                        break
-
-        elif "wezterm" in term:
-            for cfg in (
-                home / ".config" / "wezterm" / "wezterm.lua",
-                home / ".wezterm.lua",
-            ):
-                if cfg.exists():
-                    text = cfg.read_text(encoding="utf-8")
-                    m = re.search(
-                        r'font\s*=\s*wezterm\.font\s*\(\s*["\']([^"\']+)', text
-                    )
-                    if m:
-                        font_name = m.group(1)
-                    m = re.search(r"font_size\s*=\s*([\d.]+)", text)
-                    if m:
-                        font_size = float(m.group(1))
-                    if font_name:
-                        break
-
-        elif "iterm" in term:
-            if platform.system() == "Darwin":
-                result = subprocess.run(
-                    ["defaults", "read", "com.googlecode.iterm2", "Normal Font"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
-                if result.returncode == 0:
-                    raw = result.stdout.strip()
-                    parts = raw.rsplit(" ", 1)
-                    if parts[0].strip():
-                        font_name = parts[0].replace("-Regular", "")
-                        if len(parts) == 2:
-                            try:
-                                font_size = float(parts[1])
-                            except ValueError:
-                                pass
-
-        elif platform.system() == "Windows":
-            local_app = os.environ.get("LOCALAPPDATA", "")
-            if local_app:
-                wt_dir = Path(local_app) / "Packages"
-                if wt_dir.exists():
-                    for pkg in wt_dir.iterdir():
-                        if "WindowsTerminal" in pkg.name:
-                            settings = pkg / "LocalState" / "settings.json"
-                            if settings.exists():
-                                data = json.loads(settings.read_text(encoding="utf-8"))
-                                profiles = data.get("profiles", {})
-                                defaults = profiles.get("defaults", {})
-                                font_cfg = defaults.get("font", {})
-                                face = font_cfg.get("face")
-                                if face:
-                                    font_name = face
-                                size = font_cfg.get("size")
-                                if size:
-                                    font_size = float(size)
-                                break
-
-    except Exception as exc:
-        if isinstance(
-            exc, (FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError)
-        ):
-            _log.debug("Terminal font detection failed: %s", exc, exc_info=True)
-        else:
-            _log.warning("Terminal font detection failed: %s", exc, exc_info=True)
-
-    resolved_name = "monospace"
-    if font_name:
-        if font_name in available_fonts:
-            resolved_name = font_name
-        else:
-            lower_name = font_name.lower()
-            for available_font in available_fonts:
-                if available_font.lower() == lower_name:
-                    resolved_name = available_font
-                    break
-            else:
-                candidates = [
-                    available_font
-                    for available_font in available_fonts
-                    if lower_name in available_font.lower()
-                    or available_font.lower() in lower_name
-                ]
-                if candidates:
-                    resolved_name = min(candidates, key=len)
-
-    return resolved_name, font_size
+    path = Path(tempfile.gettempdir()) / PLOT_TEMP_DIR_NAME
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 # ---------------------------------------------------------------------------
 # Matplotlib plot creation
 # ---------------------------------------------------------------------------
 
+# Idle figures kept for reuse, keyed by figure size in inches and chart kind
+_FIGURE_POOL_SIZE = 4
+_figure_pool: OrderedDict[tuple[float, float, str], tuple[Figure, Axes]] = OrderedDict()
+_figure_pool_lock = threading.Lock()
+_SUBPLOT_PARAMS = ("left", "right", "bottom", "top", "wspace", "hspace")
+
+# Held for a whole render. rc_context swaps the process-wide rcParams, so two
+# renders overlapping on different threads could leak or mix font settings;
+# Agg rasterizes with the GIL held, so running them in parallel gains nothing.
+_render_lock = threading.Lock()
+
+
+@contextmanager
+def _reused_figure(
+    fig_width: float, fig_height: float, kind: str = "plot", clear: bool = True
+) -> Iterator[tuple[Figure, Axes]]:
+    """Lend a cleared single-axes Agg figure of the given size.
+
+    Repeat renders at the same size skip Figure/Axes construction. A figure is
+    taken out of the pool while in use, so concurrent renders never share
+    one, and is only returned if the render finished without raising.
+
+    Figures are pooled separately per *kind*. With ``clear=False`` a pooled
+    axes is lent with its artists intact, for callers that keep static
+    artists across renders and reset the rest themselves.
+    """
+    key = (fig_width, fig_height, kind)
+    with _figure_pool_lock:
+        entry = _figure_pool.pop(key, None)
+
+    if entry is None:
+        # Render straight to an Agg canvas; pyplot's figure manager isn't
+        # needed for a figure that is only written to disk
+        fig = Figure(figsize=(fig_width, fig_height))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+    else:
+        fig, ax = entry
+        if clear:
+            ax.clear()
+        # tight_layout and the aspect adjustment of the last render moved the
+        # axes; start from the default subplot box so the layout matches a
+        # fresh figure
+        fig.subplots_adjust(
+            **{name: mpl.rcParams[f"figure.subplot.{name}"] for name in _SUBPLOT_PARAMS}
+        )
+
+    yield fig, ax
+
+    with _figure_pool_lock:
+        _figure_pool[key] = (fig, ax)
+        while len(_figure_pool) > _FIGURE_POOL_SIZE:
+            _figure_pool.popitem(last=False)
+
+
+def _write_figure(
+    fig: Figure, output_path: Path | None, dpi: int, transparent: bool
+) -> Image.Image | None:
+    """Save *fig* to *output_path*, or rasterize it in memory when it is None.
+
+    The in-memory path copies Agg's ``buffer_rgba()`` into an RGBA image,
+    skipping the PNG encode and the disk round trip, for callers that only
+    display the result.
+    """
+    save_kwargs = {
+        "dpi": dpi,
+        "facecolor": fig.get_facecolor(),
+        "edgecolor": "none",
+        "transparent": transparent,
+    }
+    if output_path is not None:
+        fig.savefig(output_path, **save_kwargs)
+        return None
+
+    buffer = BytesIO()
+    fig.savefig(buffer, format="rgba", **save_kwargs)
+
+    # Read the buffer size at the save dpi, then restore the figure's own dpi
+    # so a pooled figure lays out the same way on its next render
+    original_dpi = fig.dpi
+    fig.set_dpi(dpi)
+    size = fig.canvas.get_width_height(physical=True)
+    fig.set_dpi(original_dpi)
+    return Image.frombuffer("RGBA", size, buffer.getbuffer(), "raw", "RGBA", 0, 1)
+
 
 def create_matplotlib_plot(
     freqs: np.ndarray,
     sparams: dict,
     plot_params: list,
     plot_type: str,
-    output_path: Path,
+    output_path: Path | None,
     dpi: int = 150,
     pixel_width: int | None = None,
     pixel_height: int | None = None,
@@ -365,8 +280,12 @@ def create_matplotlib_plot(
     font_family: str | None = None,
     font_size: float | None = None,
     plot_data: dict[str, np.ndarray] | None = None,
-) -> None:
-    """Create a plot using matplotlib with dark theme matching terminal UI."""
+) -> Image.Image | None:
+    """Create a plot using matplotlib with dark theme matching terminal UI.
+
+    The plot is written to *output_path* as a PNG. When *output_path* is
+    ``None`` nothing is written and the rendered RGBA image is returned instead.
+    """
     if font_family is None or font_size is None:
         detected_family, detected_size = get_terminal_font()
         font_family = font_family or detected_family
@@ -384,11 +303,10 @@ def create_matplotlib_plot(
         fig_width = 10
         fig_height = 5
 
-    with rc_context({"font.family": font_family}):
+    with _render_lock, rc_context({"font.family": font_family}):
         base_size = (font_size if font_size else 10.0) / render_scale
 
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-        try:
+        with _reused_figure(fig_width, fig_height) as (fig, ax):
             fig.patch.set_alpha(0.0 if transparent else 1.0)
             if not transparent:
                 fig.patch.set_facecolor(colors["bg"])
@@ -406,8 +324,14 @@ def create_matplotlib_plot(
                 ylabel = "Phase (degrees)"
                 title = "S-Parameter Phase (Raw)"
 
-            all_y_data = []
-            for param in plot_params:
+            # Traces are copied into one preallocated buffer for the
+            # auto-range, which is only needed when a limit is missing
+            n_points = len(freqs)
+            combined_data = None
+            if plot_params and (y_min is None or y_max is None):
+                combined_data = np.empty(n_points * len(plot_params), dtype=np.float64)
+
+            for i, param in enumerate(plot_params):
                 if plot_data is not None and param in plot_data:
                     data = plot_data[param]
                 elif plot_type == "magnitude":
@@ -417,7 +341,8 @@ def create_matplotlib_plot(
                 else:
                     data = sparams[param][1]
 
-                all_y_data.append(data)
+                if combined_data is not None:
+                    combined_data[i * n_points : (i + 1) * n_points] = data
                 ax.plot(
                     freq_mhz,
                     data,
@@ -426,20 +351,15 @@ def create_matplotlib_plot(
                     linewidth=1.5,
                 )
 
-            if all_y_data:
-                combined_data = np.concatenate(all_y_data)
-                if y_min is None or y_max is None:
-                    auto_y_min, auto_y_max = (
-                        calculate_plot_range_with_outlier_filtering(
-                            combined_data, outlier_percentile=1.0, safety_margin=0.05
-                        )
-                    )
-                    final_y_min = y_min if y_min is not None else auto_y_min
-                    final_y_max = y_max if y_max is not None else auto_y_max
-                else:
-                    final_y_min = y_min
-                    final_y_max = y_max
+            if combined_data is not None:
+                auto_y_min, auto_y_max = calculate_plot_range_with_outlier_filtering(
+                    combined_data, outlier_percentile=1.0, safety_margin=0.05
+                )
+                final_y_min = y_min if y_min is not None else auto_y_min
+                final_y_max = y_max if y_max is not None else auto_y_max
                 ax.set_ylim(final_y_min, final_y_max)
+            elif plot_params:
+                ax.set_ylim(y_min, y_max)
 
             ax.set_xlabel("Frequency (MHz)", color=fg_color, fontsize=base_size)
             ax.set_ylabel(ylabel, color=fg_color, fontsize=base_size)
@@ -462,14 +382,5 @@ def create_matplotlib_plot(
                 spine.set_edgecolor(grid_color)
                 spine.set_linewidth(1)
 
-            plt.tight_layout()
-            plt.savefig(
-                output_path,
-                dpi=dpi,
-                facecolor=fig.get_facecolor(),
-                edgecolor="none",
-                bbox_inches="tight",
-                transparent=transparent,
-            )
-        finally:
-            plt.close(fig)
+            fig.tight_layout()
+            return _write_figure(fig, output_path, dpi, transparent)
@@ -13,11 +13,42 @@ def unwrap_phase(phase_deg: np.ndarray) -> np.ndarray:
         phase_deg: Phase data in degrees
 
     Returns:
-        Unwrapped phase in degrees
+        Unwrapped phase in degrees, always a new array, so callers may edit
+        it without touching *phase_deg*.
     """
-    phase_rad = np.deg2rad(phase_deg)
-    unwrapped_rad = np.unwrap(phase_rad)
-    return np.rad2deg(unwrapped_rad)
+    phase = np.asarray(phase_deg, dtype=np.float64)
+    if phase.ndim == 0 or phase.shape[-1] < 2:
+        return phase.copy()
+    # Slow sweeps rarely wrap; skip the unwrap pass when nothing would change
+    if np.abs(np.diff(phase)).max() < 180.0:
+        return phase.copy()
+    # Unwrapping with a 360 degree period skips the deg -> rad -> deg round trip
+    return np.unwrap(phase, period=360.0)
+
+
+def db_deg_to_complex(mag_db: np.ndarray, phase_deg: np.ndarray) -> np.ndarray:
+    """Convert magnitude (dB) and phase (degrees) into complex values.
+
+    The cosine and sine are written straight into the real and imaginary
+    parts of the result, which is then scaled by the linear magnitude, so no
+    intermediate complex arrays are allocated.
+
+    Args:
+        mag_db: Magnitude data in dB
+        phase_deg: Phase data in degrees, same shape as *mag_db*
+
+    Returns:
+        Complex128 array of ``10 ** (mag_db / 20) * exp(1j * phase)``
+    """
+    phase_rad = np.deg2rad(phase_deg, dtype=np.float64)
+    values = np.empty(phase_rad.shape, dtype=np.complex128)
+    np.cos(phase_rad, out=values.real)
+    np.sin(phase_rad, out=values.imag)
+
+    mag_linear = np.multiply(mag_db, 1.0 / 20.0, dtype=np.float64)
+    np.power(10.0, mag_linear, out=mag_linear)
+    values *= mag_linear
+    return values
 
 
 def calculate_plot_range_with_outlier_filtering(
@@ -64,8 +95,11 @@ def calculate_plot_range_with_outlier_filtering(
     lower_percentile = outlier_percentile
     upper_percentile = 100.0 - outlier_percentile
 
-    min_val = np.percentile(finite_data, lower_percentile)
-    max_val = np.percentile(finite_data, upper_percentile)
+    # Both bounds come from one partition pass; finite_data is already a
+    # private copy, so np.percentile may reorder it instead of copying again
+    min_val, max_val = np.percentile(
+        finite_data, [lower_percentile, upper_percentile], overwrite_input=True
+    )
 
     if not (np.isfinite(min_val) and np.isfinite(max_val)):
         return (0.0, 1.0)
@@ -5,14 +5,57 @@ Provides functions to detect terminal emulator capabilities,
 including font family and size detection.
 """
 
+import functools
 import json
+import logging
 import os
 import platform
+import plistlib
 import re
-import subprocess
 from pathlib import Path
 
-
+_log = logging.getLogger(__name__)
+
+# Font settings in terminal config files, compiled once at import
+_ALACRITTY_TOML_FAMILY_RE = re.compile(
+    r'\[font\.normal\]\s*\n\s*family\s*=\s*["\']([^"\']+)'
+)
+_ALACRITTY_TOML_SIZE_RE = re.compile(r"\[font\]\s*\n(?:.*\n)*?\s*size\s*=\s*([\d.]+)")
+_ALACRITTY_YAML_FAMILY_RE = re.compile(
+    r'font:\s*\n\s*normal:\s*\n\s*family:\s*["\']?([^\n"\']+)'
+)
+_ALACRITTY_YAML_SIZE_RE = re.compile(r"font:\s*\n(?:.*\n)*?\s*size:\s*([\d.]+)")
+_WEZTERM_FONT_RE = re.compile(r'font\s*=\s*wezterm\.font\s*\(\s*["\']([^"\']+)')
+_WEZTERM_SIZE_RE = re.compile(r"font_size\s*=\s*([\d.]+)")
+_GHOSTTY_FONT_RE = re.compile(
+    r"^[ \t]*(font-family|font-size)[ \t]*=[ \t]*(.+?)[ \t]*$", re.MULTILINE
+)
+_KITTY_FONT_RE = re.compile(
+    r"^[ \t]*(font_family|font_size)[ \t]+(.+?)[ \t]*$", re.MULTILINE
+)
+
+
+def _read_iterm2_normal_font(home: Path) -> str | None:
+    """Return iTerm2's "Normal Font" setting, e.g. ``"HackNF-Regular 13"``.
+
+    Reads the preferences plist directly instead of running ``defaults read``.
+    A top-level key wins; otherwise the default profile's font is used.
+    """
+    plist = home / "Library" / "Preferences" / "com.googlecode.iterm2.plist"
+    if not plist.exists():
+        return None
+    data = plistlib.loads(plist.read_bytes())
+    font = data.get("Normal Font")
+    if font is None:
+        default_guid = data.get("Default Bookmark Guid")
+        for profile in data.get("New Bookmarks", []):
+            if isinstance(profile, dict) and profile.get("Guid") == default_guid:
+                font = profile.get("Normal Font")
+                break
+    return font if isinstance(font, str) else None
+
+
+@functools.lru_cache(maxsize=1)
 def get_terminal_font() -> tuple[str, float | None]:
     """
     Detect the terminal's font family and size by parsing its config file.
@@ -24,6 +67,9 @@ def get_terminal_font() -> tuple[str, float | None]:
     Supported terminals: Ghostty, Kitty, Alacritty, WezTerm, iTerm2,
     Windows Terminal.
 
+    The result is computed once per process; call
+    ``get_terminal_font.cache_clear()`` to detect again.
+
     Returns:
         Tuple of (font_family, font_size_pt)
     """
@@ -44,15 +90,14 @@ def get_terminal_font() -> tuple[str, float | None]:
         nonlocal font_name, font_size
         cfg = home / ".config" / "ghostty" / "config"
         if cfg.exists():
-            for line in cfg.read_text().splitlines():
-                line = line.strip()
-                if line.startswith("#"):
-                    continue
-                if line.startswith("font-family") and not font_name:
-                    font_name = line.split("=", 1)[1].strip().strip("\"'")
-                elif line.startswith("font-size") and not font_size:
+            # Comment lines start with "#" and never match
+            for m in _GHOSTTY_FONT_RE.finditer(cfg.read_text(encoding="utf-8")):
+                key, value = m.group(1), m.group(2).strip().strip("\"'")
+                if key == "font-family" and not font_name:
+                    font_name = value
+                elif key == "font-size" and not font_size:
                     try:
-                        font_size = float(line.split("=", 1)[1].strip().strip("\"'"))
+                        font_size = float(value)
                     except ValueError:
                         pass
             # Ghostty default font-size is 13
@@ -69,14 +114,14 @@ def get_terminal_font() -> tuple[str, float | None]:
             #   font_size 12.0
             cfg = home / ".config" / "kitty" / "kitty.conf"
             if cfg.exists():
-                for line in cfg.read_text().splitlines():
-                    line = line.strip()
-                    if line.startswith("font_family") and not font_name:
-                        font_name = line.split(None, 1)[1].strip().strip("\"'")
-                    elif line.startswith("font_size") and not font_size:
+                for m in _KITTY_FONT_RE.finditer(cfg.read_text(encoding="utf-8")):
+                    key, value = m.group(1), m.group(2).strip()
+                    if key == "font_family" and not font_name:
+                        font_name = value.strip("\"'")
+                    elif key == "font_size" and not font_size:
                         try:
-                            font_size = float(line.split(None, 1)[1].strip())
-                        except (ValueError, IndexError):
+                            font_size = float(value)
+                        except ValueError:
                             pass
 
         elif "alacritty" in term:
@@ -84,27 +129,19 @@ def get_terminal_font() -> tuple[str, float | None]:
             for name in ("alacritty.toml", "alacritty.yml"):
                 cfg = home / ".config" / "alacritty" / name
                 if cfg.exists():
-                    text = cfg.read_text()
+                    text = cfg.read_text(encoding="utf-8")
                     if name.endswith(".toml"):
-                        m = re.search(
-                            r'\[font\.normal\]\s*\n\s*family\s*=\s*["\']([^"\']+)',
-                            text,
-                        )
+                        m = _ALACRITTY_TOML_FAMILY_RE.search(text)
                         if m:
                             font_name = m.group(1)
-                        m = re.search(
-                            r"\[font\]\s*\n(?:.*\n)*?\s*size\s*=\s*([\d.]+)", text
-                        )
+                        m = _ALACRITTY_TOML_SIZE_RE.search(text)
                         if m:
                             font_size = float(m.group(1))
                     else:
-                        m = re.search(
-                            r'font:\s*\n\s*normal:\s*\n\s*family:\s*["\']?([^\n"\']+)',
-                            text,
-                        )
+                        m = _ALACRITTY_YAML_FAMILY_RE.search(text)
                         if m:
                             font_name = m.group(1).strip()
-                        m = re.search(r"font:\s*\n(?:.*\n)*?\s*size:\s*([\d.]+)", text)
+                        m = _ALACRITTY_YAML_SIZE_RE.search(text)
                         if m:
                             font_size = float(m.group(1))
                     if font_name:
@@ -119,37 +156,30 @@ def get_terminal_font() -> tuple[str, float | None]:
                 home / ".wezterm.lua",
             ):
                 if cfg.exists():
-                    text = cfg.read_text()
-                    m = re.search(
-                        r'font\s*=\s*wezterm\.font\s*\(\s*["\']([^"\']+)', text
-                    )
+                    text = cfg.read_text(encoding="utf-8")
+                    m = _WEZTERM_FONT_RE.search(text)
                     if m:
                         font_name = m.group(1)
-                    m = re.search(r"font_size\s*=\s*([\d.]+)", text)
+                    m = _WEZTERM_SIZE_RE.search(text)
                     if m:
                         font_size = float(m.group(1))
                     if font_name:
                         break
 
         elif "iterm" in term:
-            # macOS: defaults read com.googlecode.iterm2
+            # macOS: ~/Library/Preferences/com.googlecode.iterm2.plist
             if platform.system() == "Darwin":
-                result = subprocess.run(
-                    ["defaults", "read", "com.googlecode.iterm2", "Normal Font"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
-                if result.returncode == 0:
-                    # Output like: "HackNF-Regular 13"
-                    raw = result.stdout.strip()
-                    parts = raw.rsplit(" ", 1)
-                    font_name = parts[0].replace("-Regular", "")
-                    if len(parts) == 2:
-                        try:
-                            font_size = float(parts[1])
-                        except ValueError:
-                            pass
+                raw = _read_iterm2_normal_font(home)
+                if raw:
+                    # Value like: "HackNF-Regular 13"
+                    parts = raw.strip().rsplit(" ", 1)
+                    if parts[0].strip():
+                        font_name = parts[0].replace("-Regular", "")
+                        if len(parts) == 2:
+                            try:
+                                font_size = float(parts[1])
+                            except ValueError:
+                                pass
 
         elif platform.system() == "Windows":
             # Windows Terminal: settings.json
@@ -161,7 +191,7 @@ def get_terminal_font() -> tuple[str, float | None]:
                         if "WindowsTerminal" in pkg.name:
                             settings = pkg / "LocalState" / "settings.json"
                             if settings.exists():
-                                data = json.loads(settings.read_text())
+                                data = json.loads(settings.read_text(encoding="utf-8"))
                                 profiles = data.get("profiles", {})
                                 defaults = profiles.get("defaults", {})
                                 font_cfg = defaults.get("font", {})
@@ -177,8 +207,14 @@ def get_terminal_font() -> tuple[str, float | None]:
         if not font_name:
             _parse_ghostty_config()
 
-    except Exception:
-        pass
+    except Exception as exc:
+        if isinstance(
+            exc,
+            (FileNotFoundError, plistlib.InvalidFileException, json.JSONDecodeError),
+        ):
+            _log.debug("Terminal font detection failed: %s", exc, exc_info=True)
+        else:
+            _log.warning("Terminal font detection failed: %s", exc, exc_info=True)
 
     # Resolve font name against available fonts
     resolved_name = "monospace"
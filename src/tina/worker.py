@@ -9,6 +9,7 @@ communication.
 import queue
 import threading
 import traceback
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
 from enum import Enum
 from pathlib import Path
@@ -16,11 +17,17 @@ from typing import Any, cast
 
 import matplotlib
 import numpy as np
+from PIL import Image
 
 matplotlib.use("Agg")
 
 from matplotlib import pyplot as plt
 
+from .config.constants import (
+    FREQ_UNIT_CONVERSIONS,
+    WORKER_IDLE_WAIT_MAX_SEC,
+    WORKER_IDLE_WAIT_MIN_SEC,
+)
 from .drivers import (
     StatusCapableDriver,
     TriggerStateDriver,
@@ -79,7 +86,7 @@ class MessageType(Enum):
     LOG = "log"  # Log message (TX/RX/info)
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Message structure for inter-thread communication."""
 
@@ -88,7 +95,7 @@ class Message:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressUpdate:
     """Progress update data."""
 
@@ -125,7 +132,7 @@ class ImportResult:
     paths: dict[str, str | None]
 
 
-@dataclass
+@dataclass(slots=True)
 class MeasurementResult:
     """Measurement result data."""
 
@@ -133,7 +140,7 @@ class MeasurementResult:
     sparams: dict[str, tuple[np.ndarray, np.ndarray]]
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamsResult:
     """VNA parameters read result."""
 
@@ -144,7 +151,7 @@ class ParamsResult:
     averaging_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusResult:
     """Live VNA status for the status bar."""
 
@@ -157,7 +164,7 @@ class StatusResult:
     trigger_source: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LogMessage:
     """Log message data."""
 
@@ -174,7 +181,7 @@ def _render_plot_image_snapshot(
     sparams: dict[str, tuple[np.ndarray, np.ndarray]],
     plot_params: tuple[str, ...],
     plot_type: str,
-    output_path: Path,
+    output_path: Path | None,
     dpi: int,
     pixel_width: int,
     pixel_height: int,
@@ -183,10 +190,10 @@ def _render_plot_image_snapshot(
     y_min: float | None,
     y_max: float | None,
     plot_data: dict[str, np.ndarray] | None = None,
-) -> None:
+) -> Image.Image | None:
     """Render a measurement plot image snapshot from immutable inputs."""
     if plot_type == "smith":
-        create_smith_chart(
+        return create_smith_chart(
             freqs,
             sparams,
             list(plot_params),
@@ -200,7 +207,7 @@ def _render_plot_image_snapshot(
             plot_data=plot_data,
         )
     else:
-        create_matplotlib_plot(
+        return create_matplotlib_plot(
             freqs,
             sparams,
             list(plot_params),
@@ -366,8 +373,7 @@ def _render_tools_plot_snapshot(
     output_path: str,
 ) -> dict[str, Any]:
     """Render the tools image plot from a pure snapshot payload."""
-    unit_multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
-    multiplier = unit_multipliers.get(freq_unit, 1e6)
+    multiplier = FREQ_UNIT_CONVERSIONS.get(freq_unit, 1e6)
     data, y_label, plot_title = _compute_tools_data(freqs, sparams, trace, plot_type)
     freq_axis = freqs / multiplier
 
@@ -503,7 +509,7 @@ class MeasurementWorker:
 
     Usage:
         worker = MeasurementWorker()
-        worker.start()
+        worker.start()  # or worker.start(on_response=callback) to skip polling
 
         # Send command
         worker.send_command(MessageType.CONNECT, config)
@@ -532,12 +538,21 @@ class MeasurementWorker:
         self._measuring = False
         self._debug_scpi = False
         self._job_tokens: dict[int, int] = {}
+        self._on_response: Callable[[], object] | None = None
+
+    def start(self, on_response: Callable[[], object] | None = None):
+        """
+        Start the worker thread.
 
-    def start(self):
-        """Start the worker thread."""
+        Args:
+            on_response: Optional callback run on the worker thread after each
+                response is queued, so the UI can drain the queue when told to
+                instead of polling it. It must be safe to call from any thread.
+        """
         if self._running:
             return
 
+        self._on_response = on_response
         self._running = True
         self._thread = threading.Thread(target=self._worker_loop, daemon=True)
         self._thread.start()
@@ -604,11 +619,25 @@ class MeasurementWorker:
         """
         return self._response_queue.get(timeout=timeout)
 
+    def get_response_nowait(self) -> Message:
+        """
+        Get an already queued response from the worker thread without waiting.
+
+        Returns:
+            Message from worker
+
+        Raises:
+            queue.Empty: If no message is queued
+        """
+        return self._response_queue.get_nowait()
+
     def _send_response(
         self, msg_type: MessageType, data: Any = None, error: str | None = None
     ):
         """Send response to UI thread."""
         self._response_queue.put(Message(type=msg_type, data=data, error=error))
+        if self._on_response is not None:
+            self._on_response()
 
     def _send_progress(
         self, message: str, progress_pct: float, job_id: int | None = None
@@ -655,13 +684,18 @@ class MeasurementWorker:
 
     def _worker_loop(self):
         """Main worker thread loop."""
+        idle_wait = WORKER_IDLE_WAIT_MIN_SEC
         while self._running:
             try:
-                # Wait for command with timeout to allow checking _running flag
+                # Wait for command with timeout to allow checking _running flag.
+                # Commands still wake the thread at once; only the recheck of
+                # _running backs off while idle.
                 try:
-                    msg = self._command_queue.get(timeout=0.1)
+                    msg = self._command_queue.get(timeout=idle_wait)
                 except queue.Empty:
+                    idle_wait = min(idle_wait * 2, WORKER_IDLE_WAIT_MAX_SEC)
                     continue
+                idle_wait = WORKER_IDLE_WAIT_MIN_SEC
 
                 # Process command
                 if msg.type == MessageType.SHUTDOWN:
@@ -1149,18 +1183,20 @@ class MeasurementWorker:
                     result = file_path
                 elif export_kind == "results_plot":
                     report(f"{kind}: rendering plot...", 40)
-                    _render_plot_image_snapshot(
-                        np.array(data["freqs"], dtype=float),
+                    # Without an output path the plot is kept in memory
+                    output_path = data.get("output_path")
+                    image = _render_plot_image_snapshot(
+                        np.asarray(data["freqs"], dtype=float),
                         {
                             str(name): (
-                                np.array(values[0], dtype=float),
-                                np.array(values[1], dtype=float),
+                                np.asarray(values[0], dtype=float),
+                                np.asarray(values[1], dtype=float),
                             )
                             for name, values in dict(data["sparams"]).items()
                         },
                         tuple(str(item) for item in list(data["plot_params"])),
                         str(data["plot_type"]),
-                        Path(str(data["output_path"])),
+                        Path(str(output_path)) if output_path is not None else None,
                         int(data["dpi"]),
                         int(data["pixel_width"]),
                         int(data["pixel_height"]),
@@ -1170,7 +1206,7 @@ class MeasurementWorker:
                         float(data["y_max"]) if data.get("y_max") is not None else None,
                         (
                             {
-                                str(name): np.array(values, dtype=float)
+                                str(name): np.asarray(values, dtype=float)
                                 for name, values in dict(
                                     data.get("plot_data", {})
                                 ).items()
@@ -1180,7 +1216,8 @@ class MeasurementWorker:
                         ),
                     )
                     result = {
-                        "path": str(data["output_path"]),
+                        "path": str(output_path) if output_path is not None else None,
+                        "image": image,
                         "pixel_width": int(data["pixel_width"]),
                         "pixel_height": int(data["pixel_height"]),
                     }
@@ -1435,13 +1472,9 @@ class MeasurementWorker:
             self._send_progress("Reading frequency data...", 50)
             freqs = self._vna.get_frequency_axis()
 
-            # Get S-parameters
-            sparams = {}
-            param_names = ["S11", "S21", "S12", "S22"]
-            for idx, name in enumerate(param_names, start=1):
-                progress = 50 + (idx * 10)
-                self._send_progress(f"Reading {name}...", progress)
-                sparams[name] = self._vna.get_sparam_data(idx)
+            # Get all S-parameters of the sweep in one batched read
+            self._send_progress("Reading S-parameters...", 60)
+            sparams = self._vna.get_all_sparameters()
 
             result = MeasurementResult(frequencies=freqs, sparams=sparams)
 
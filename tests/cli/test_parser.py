@@ -139,6 +139,31 @@ class TestCliParser:
         args = parser.parse_args(["--no-plots"])
         assert args.no_plots is True
 
+    def test_full_parser_is_cached(self):
+        """Test that repeated calls reuse the fully built parser."""
+        assert create_cli_parser() is create_cli_parser()
+
+    def test_quick_argv_uses_minimal_parser(self):
+        """Test that a bare --now invocation skips the full argument groups."""
+        parser = create_cli_parser(["-n"])
+        assert parser is not create_cli_parser()
+        assert "--host" not in parser._option_string_actions
+        assert parser.parse_args(["-n"]).now is True
+
+    def test_quick_parser_is_cached(self):
+        """Test that repeated quick invocations reuse the minimal parser."""
+        assert create_cli_parser([]) is create_cli_parser(["--now"])
+
+    def test_quick_parser_namespace_matches_full_parser(self):
+        """Test that quick and full parsers yield identical default namespaces."""
+        quick = create_cli_parser(["--now"]).parse_args(["--now"])
+        full = create_cli_parser().parse_args(["--now"])
+        assert vars(quick) == vars(full)
+
+    def test_non_quick_argv_uses_full_parser(self):
+        """Test that any other argument selects the full parser."""
+        assert create_cli_parser(["-n", "--host", "1.2.3.4"]) is create_cli_parser()
+
 
 class TestApplyCliSettings:
     """Test applying CLI arguments to settings."""
@@ -273,6 +298,36 @@ class TestApplyCliSettings:
         # Port should be updated
         assert updated.last_port == "inst1"
 
+    def test_empty_text_arguments_do_not_override(self):
+        """Test that empty string arguments leave stored settings untouched."""
+        settings = AppSettings(last_host="original.host", output_folder="data")
+        parser = create_cli_parser()
+        args = parser.parse_args(["--host", "", "--output-folder", ""])
+
+        updated = apply_cli_settings(args, settings)
+        assert updated.last_host == "original.host"
+        assert updated.output_folder == "data"
+
+    def test_sparse_namespace_is_tolerated(self):
+        """Test that a namespace missing optional attributes is accepted."""
+        settings = AppSettings(last_host="original.host")
+
+        updated = apply_cli_settings(argparse.Namespace(now=True), settings)
+        assert updated.last_host == "original.host"
+        assert updated == AppSettings(last_host="original.host")
+
+    def test_apply_does_not_mutate_input_settings(self):
+        """Test that applying CLI arguments returns a new settings object."""
+        settings = AppSettings(last_host="original.host")
+        parser = create_cli_parser()
+        args = parser.parse_args(["--host", "10.0.0.1", "--plot-all"])
+
+        updated = apply_cli_settings(args, settings)
+        assert updated is not settings
+        assert updated.last_host == "10.0.0.1"
+        assert settings.last_host == "original.host"
+        assert settings == AppSettings(last_host="original.host")
+
     def test_combined_flags(self):
         """Test combining multiple flags."""
         settings = AppSettings()
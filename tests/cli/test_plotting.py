@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from unittest.mock import patch
 
 import numpy as np
 import pytest
 
-from tina.cli.plotting import export_plots_cli
+from tina.cli.plotting import _cli_plot_colors, export_plots_cli
 from tina.config.settings import AppSettings
 
 
@@ -30,7 +32,7 @@ class TestExportPlotsCli:
             plot_s11=True, plot_s21=True, plot_s12=False, plot_s22=False
         )
 
-        with patch("tina.cli.plotting.create_matplotlib_plot") as mock_plot:
+        with patch("tina.utils.plotting.create_matplotlib_plot") as mock_plot:
             mock_plot.return_value = None
             export_plots_cli(freqs, sp, settings, str(tmp_path), "test")
             assert mock_plot.call_count == 2
@@ -51,7 +53,9 @@ class TestExportPlotsCli:
             if call_count == 2:
                 raise RuntimeError("simulated failure")
 
-        with patch("tina.cli.plotting.create_matplotlib_plot", side_effect=fail_second):
+        with patch(
+            "tina.utils.plotting.create_matplotlib_plot", side_effect=fail_second
+        ):
             with pytest.raises(RuntimeError, match="One or more plot exports failed"):
                 export_plots_cli(freqs, sp, settings, str(tmp_path), "test")
 
@@ -61,6 +65,35 @@ class TestExportPlotsCli:
         freqs, sp = sparams
         settings = AppSettings(plot_s11=False, plot_s21=False)
 
-        with patch("tina.cli.plotting.create_matplotlib_plot") as mock_plot:
+        with patch("tina.utils.plotting.create_matplotlib_plot") as mock_plot:
             export_plots_cli(freqs, sp, settings, str(tmp_path), "test")
             mock_plot.assert_not_called()
+
+    @pytest.mark.unit
+    def test_import_does_not_load_matplotlib(self):
+        """Importing the CLI plotting module must not pull in matplotlib."""
+        code = "import sys, tina.cli.plotting; " "print('matplotlib' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    @pytest.mark.unit
+    def test_output_paths_are_built_under_output_dir(self, sparams, tmp_path):
+        """Plot files should be written as <output_dir>/<base>_<type>.png."""
+        freqs, sp = sparams
+        settings = AppSettings(plot_s11=True)
+
+        with patch("tina.utils.plotting.create_matplotlib_plot") as mock_plot:
+            export_plots_cli(freqs, sp, settings, tmp_path, "run1")
+
+        written = [call.kwargs["output_path"] for call in mock_plot.call_args_list]
+        assert written == [tmp_path / "run1_magnitude.png", tmp_path / "run1_phase.png"]
+
+    @pytest.mark.unit
+    def test_cli_plot_colors_are_computed_once(self):
+        """The theme-less CLI palette should be memoized and match the fallback."""
+        from tina.utils.plotting import get_plot_colors
+
+        assert _cli_plot_colors() is _cli_plot_colors()
+        assert _cli_plot_colors() == get_plot_colors(None)
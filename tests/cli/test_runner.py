@@ -130,3 +130,56 @@ class TestRunCliMeasurement:
         assert result == 1
         vna.connect.assert_called_once()
         vna.disconnect.assert_called_once()
+
+    def _patch_successful_run(self, monkeypatch, settings):
+        """Wire the runner to an in-memory VNA and exporter; return the plot mock."""
+        vna = MagicMock()
+        vna.idn = "HEWLETT-PACKARD,E5071B,MY12345678,A.01.02"
+        vna.perform_measurement.return_value = (
+            [1e6, 2e6],
+            {"S11": ([0.0, 0.0], [0.0, 0.0])},
+        )
+        settings_manager = MagicMock()
+        settings_manager.load.return_value = settings
+        exporter = MagicMock()
+        exporter.export.return_value = "out/measurement.s2p"
+        plot_mock = MagicMock()
+
+        monkeypatch.setattr("tina.cli.runner.migrate_legacy_config", lambda: None)
+        monkeypatch.setattr("tina.cli.runner.SettingsManager", lambda: settings_manager)
+        monkeypatch.setattr(
+            "tina.cli.runner.apply_cli_settings", lambda args, loaded: loaded
+        )
+        monkeypatch.setattr("tina.cli.runner.VNA", lambda config: vna)
+        monkeypatch.setattr(
+            "tina.cli.runner.TouchstoneExporter", lambda **kwargs: exporter
+        )
+        monkeypatch.setattr("tina.cli.runner.export_plots_cli", plot_mock)
+        return plot_mock
+
+    def test_skips_plot_export_when_no_trace_selected(self, monkeypatch):
+        """Plot export should not be invoked when every plot flag is off."""
+        settings = AppSettings(
+            last_host="192.168.1.100",
+            plot_s11=False,
+            plot_s21=False,
+            plot_s12=False,
+            plot_s22=False,
+        )
+        plot_mock = self._patch_successful_run(monkeypatch, settings)
+
+        result = run_cli_measurement(argparse.Namespace(no_plots=False))
+
+        assert result == 0
+        plot_mock.assert_not_called()
+
+    def test_exports_plots_when_trace_selected(self, monkeypatch):
+        """Plot export should run when at least one plot flag is on."""
+        settings = AppSettings(last_host="192.168.1.100", plot_s21=False)
+        plot_mock = self._patch_successful_run(monkeypatch, settings)
+
+        result = run_cli_measurement(argparse.Namespace(no_plots=False))
+
+        assert result == 0
+        plot_mock.assert_called_once()
+        assert plot_mock.call_args.args[-1] == "measurement"
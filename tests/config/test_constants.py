@@ -86,8 +86,8 @@ def test_default_colors():
 @pytest.mark.unit
 def test_worker_settings():
     """Test worker thread settings."""
-    assert constants.MESSAGE_POLL_INTERVAL_SEC > 0
     assert constants.WORKER_SHUTDOWN_TIMEOUT_SEC > 0
+    assert 0 < constants.WORKER_IDLE_WAIT_MIN_SEC <= constants.WORKER_IDLE_WAIT_MAX_SEC
 
 
 @pytest.mark.unit
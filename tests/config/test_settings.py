@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 from ruamel.yaml import YAML
 
+from tina.config import settings as settings_module
 from tina.config.settings import AppSettings, SettingsManager
 
 
@@ -61,6 +62,13 @@ class TestAppSettings:
         assert "test" in settings1.host_history
         assert "test" not in settings2.host_history
 
+    def test_settings_use_slots(self):
+        """Test that AppSettings instances carry no per-instance __dict__."""
+        settings = AppSettings()
+        assert not hasattr(settings, "__dict__")
+        with pytest.raises(AttributeError):
+            settings.not_a_setting = True
+
     def test_export_flags(self):
         """Test export flag defaults."""
         settings = AppSettings()
@@ -135,6 +143,89 @@ class TestSettingsManager:
         assert loaded.last_port == "inst2"
         assert loaded.sweep_points == 1001
 
+    def test_load_reuses_parse_while_file_unchanged(self, settings_manager):
+        """Test that an unchanged file is parsed once and served from cache."""
+        settings_manager.settings.last_host = "10.0.0.5"
+        settings_manager.save()
+
+        with patch(
+            "tina.config.settings._yaml.load",
+            wraps=settings_module._yaml.load,
+        ) as mock_load:
+            first = settings_manager.load()
+            second = settings_manager.load()
+
+        assert mock_load.call_count == 1
+        assert first == second
+        assert first is not second
+        assert first.host_history is not second.host_history
+
+    def test_load_reparses_after_file_change(self, settings_manager):
+        """Test that saving new values invalidates the cached parse."""
+        settings_manager.settings.last_host = "10.0.0.5"
+        settings_manager.save()
+        assert settings_manager.load().last_host == "10.0.0.5"
+
+        settings_manager.settings.last_host = "10.0.0.6"
+        settings_manager.save()
+        assert settings_manager.load().last_host == "10.0.0.6"
+
+    def test_cached_load_is_isolated_from_caller_mutation(self, settings_manager):
+        """Test that mutating a loaded result does not leak into later loads."""
+        settings_manager.save()
+        loaded = settings_manager.load()
+        loaded.last_host = "mutated"
+        loaded.port_history.append("custom")
+
+        reloaded = settings_manager.load()
+        assert reloaded.last_host == ""
+        assert "custom" not in reloaded.port_history
+
+    def test_repeated_save_skips_rereading_unchanged_file(self, settings_manager):
+        """Test that consecutive saves reuse the last written YAML document."""
+        settings_manager.save()
+
+        with patch(
+            "tina.config.settings._yaml.load", wraps=settings_module._yaml.load
+        ) as mock_load:
+            settings_manager.settings.last_host = "10.0.0.7"
+            settings_manager.save()
+
+        mock_load.assert_not_called()
+        assert "last_host: 10.0.0.7" in settings_manager.config_file.read_text()
+
+    def test_save_without_changes_does_not_rewrite_file(self, settings_manager):
+        """Test that saving unchanged settings leaves the file alone."""
+        settings_manager.settings.last_host = "10.0.0.9"
+        settings_manager.save()
+
+        with patch(
+            "tina.config.settings._yaml.dump", wraps=settings_module._yaml.dump
+        ) as mock_dump:
+            settings_manager.save()
+            SettingsManager().save(settings_manager.load())
+
+        mock_dump.assert_not_called()
+
+        settings_manager.settings.last_host = "10.0.0.10"
+        settings_manager.save()
+        assert "last_host: 10.0.0.10" in settings_manager.config_file.read_text()
+
+    def test_save_rereads_externally_edited_file(self, settings_manager):
+        """Test that external edits (e.g. new comments) are picked up by save."""
+        settings_manager.save()
+        original = settings_manager.config_file.read_text()
+        settings_manager.config_file.write_text(
+            "# hand-written note\n" + original, encoding="utf-8"
+        )
+
+        settings_manager.settings.last_host = "10.0.0.8"
+        settings_manager.save()
+
+        text = settings_manager.config_file.read_text()
+        assert "# hand-written note" in text
+        assert "last_host: 10.0.0.8" in text
+
     def test_corrupted_config_returns_defaults(self, settings_manager):
         """Test that corrupted config returns defaults."""
         # Write unparseable YAML (triggers the exception path in load())
@@ -157,6 +248,12 @@ class TestSettingsManager:
         assert len(backups) == 1
         assert malformed in backups[0].read_text()
 
+    def test_default_ports_set_matches_list(self):
+        """Test that the membership set mirrors the ordered default port list."""
+        assert SettingsManager._DEFAULT_PORTS_SET == frozenset(
+            SettingsManager.DEFAULT_PORTS
+        )
+
     def test_merge_port_history_adds_defaults(self, settings_manager):
         """Test that default ports are always present."""
         settings_manager.settings.port_history = ["custom_port"]
@@ -190,6 +287,17 @@ class TestSettingsManager:
         custom_idx = settings_manager.settings.port_history.index("custom_port")
         assert custom_idx >= defaults_count
 
+    def test_add_port_to_history_keeps_most_recent_customs(self, settings_manager):
+        """Test that trimming drops the oldest custom ports, not the newest."""
+        settings_manager.settings.port_history = SettingsManager.DEFAULT_PORTS.copy()
+        for i in range(6):
+            settings_manager.add_port_to_history(f"custom{i}")
+
+        history = settings_manager.settings.port_history
+        assert len(history) == SettingsManager.MAX_PORT_HISTORY
+        assert history[len(SettingsManager.DEFAULT_PORTS)] == "custom5"
+        assert "custom0" not in history
+
     def test_add_port_to_history_existing_default(self, settings_manager):
         """Test adding existing default port moves it."""
         settings_manager.settings.port_history = SettingsManager.DEFAULT_PORTS.copy()
@@ -18,6 +18,7 @@ from tests.fixtures.sample_data import (
     generate_sample_sparameters,
 )
 from tina.drivers.base import VNAConfig
+from tina.drivers.hp_e5071b import _resource_manager as _hp_resource_manager
 from tina.worker import MessageType
 
 # ===== Configuration Fixtures =====
@@ -61,7 +62,10 @@ def mock_pyvisa_resource_manager(monkeypatch):
         return mock_rm
 
     monkeypatch.setattr(pyvisa, "ResourceManager", mock_resource_manager_factory)
-    return mock_rm
+    # The HP driver caches its resource manager; make it pick up this mock
+    _hp_resource_manager.cache_clear()
+    yield mock_rm
+    _hp_resource_manager.cache_clear()
 
 
 @pytest.fixture
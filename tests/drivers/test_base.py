@@ -4,6 +4,9 @@ Tests the base driver abstraction, driver discovery, and configuration.
 """
 
 import inspect
+import re
+import subprocess
+import sys
 
 import pytest
 
@@ -429,6 +432,94 @@ class TestDriverDiscovery:
             assert hasattr(driver_class, "driver_name")
             assert isinstance(driver_class.driver_name, str)
 
+    @pytest.mark.unit
+    def test_bundled_drivers_register_on_import(self):
+        """Drivers in the package are registered by VNABase.__init_subclass__."""
+        from tina.drivers.hp_e5071b import HPE5071B
+        from tina.drivers.keysight_p5007a import KeysightP5007A
+
+        drivers = discover_drivers()
+
+        assert drivers[HPE5071B.driver_name] is HPE5071B
+        assert drivers[KeysightP5007A.driver_name] is KeysightP5007A
+
+    @pytest.mark.unit
+    def test_subclasses_outside_drivers_package_are_not_registered(self):
+        """Test doubles such as MockVNA must not take part in auto-detection."""
+        drivers = discover_drivers()
+
+        assert DummyVNA not in drivers.values()
+        assert detect_vna_driver("MOCK,VNA1000,SERIAL123,1.0.0") is None
+
+    @pytest.mark.unit
+    def test_detect_vna_driver_uses_combined_idn_pattern(self):
+        """Bundled drivers are resolved through their compiled IDN patterns."""
+        from tina.drivers.hp_e5071b import HPE5071B
+        from tina.drivers.keysight_p5007a import KeysightP5007A
+
+        assert HPE5071B.idn_pattern is not None
+        assert KeysightP5007A.idn_pattern is not None
+        assert (
+            detect_vna_driver("Agilent Technologies,E5071C,MY123,A.09.50") is HPE5071B
+        )
+        assert detect_vna_driver("Keysight Technologies,P5007A,MY1,A.01") is (
+            KeysightP5007A
+        )
+        assert detect_vna_driver("HEWLETT-PACKARD,8753D,MY1,A.01") is None
+
+    @pytest.mark.unit
+    def test_detect_vna_driver_follows_registry_order(self, monkeypatch):
+        """Overlapping patterns resolve to the earliest registered driver."""
+        from tina.drivers import base as driver_base
+
+        class ModelDriver(DummyVNA):
+            driver_name = "Model"
+            idn_pattern = re.compile(r"e5071", re.IGNORECASE)
+
+        class VendorDriver(DummyVNA):
+            driver_name = "Vendor"
+            idn_pattern = re.compile(r"^agilent", re.IGNORECASE)
+
+        monkeypatch.setattr(
+            driver_base,
+            "_DRIVER_REGISTRY",
+            {"Model": ModelDriver, "Vendor": VendorDriver},
+        )
+
+        # The vendor pattern matches further left, but Model registered first
+        assert detect_vna_driver("Agilent Technologies,E5071C,1,A") is ModelDriver
+        assert detect_vna_driver("Agilent Technologies,8753D,1,A") is VendorDriver
+
+    @pytest.mark.unit
+    def test_detect_vna_driver_falls_back_to_idn_matcher(self, monkeypatch):
+        """Drivers without an idn_pattern are still tried via idn_matcher."""
+        from tina.drivers import base as driver_base
+
+        class PatternlessDriver(DummyVNA):
+            driver_name = "Patternless"
+
+            @staticmethod
+            def idn_matcher(idn_string: str) -> bool:
+                return "fieldfox" in idn_string.lower()
+
+        registry = dict(discover_drivers())
+        registry["Patternless"] = PatternlessDriver
+        monkeypatch.setattr(driver_base, "_DRIVER_REGISTRY", registry)
+
+        assert detect_vna_driver("Keysight,FieldFox N9913A,1,A") is PatternlessDriver
+
+    @pytest.mark.unit
+    def test_discovery_does_not_import_pyvisa(self):
+        """Enumerating drivers must not pay the pyvisa import cost."""
+        code = (
+            "import sys, tina.drivers; tina.drivers.discover_drivers(); "
+            "print('pyvisa' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
 
 class TestVNAConfiguration:
     """Test VNA configuration and parameter setting."""
@@ -5,18 +5,28 @@ Tests HP-specific functionality including connection, configuration,
 measurement sequences, and SCPI command generation.
 """
 
+import pkgutil
+import socket
+import threading
+import time
 import types
 from typing import cast
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import numpy as np
 import pytest
 import pyvisa
 
 from tests.fixtures.mock_visa import MockVisaResource
+from tina.config.constants import LOG_EPSILON
 from tina.drivers import base as driver_base
 from tina.drivers.base import VNAConfig
-from tina.drivers.hp_e5071b import HPE5071B
+from tina.drivers.hp_e5071b import HPE5071B, _sdata_to_db_deg
+from tina.drivers.scpi_commands import (
+    cmd_select_param,
+    cmd_set_freq_start,
+    join_commands,
+)
 
 
 class TestHPE5071BIdentification:
@@ -44,6 +54,23 @@ class TestHPE5071BIdentification:
         assert not HPE5071B.idn_matcher("HEWLETT-PACKARD,8753D,MY12345678,A.01.02")
         assert not HPE5071B.idn_matcher("UNKNOWN,MODEL,12345,1.0")
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "idn, expected",
+        [
+            ("HEWLETT-PACKARD,E5071B,MY12345678,A.01.02", True),
+            ("Agilent Technologies, E5071C ,MY1,A.09.50", True),
+            ("ACME,N9913A,E5071-SN42,A.01", False),
+            ("ACME,N9913A,SN42,E5071.FW", False),
+            ("E5071B", False),
+            ("", False),
+        ],
+    )
+    def test_idn_matcher_only_checks_model_field(self, idn, expected):
+        """The model field decides, and the idn_pattern agrees."""
+        assert HPE5071B.idn_matcher(idn) is expected
+        assert (HPE5071B.idn_pattern.search(idn) is not None) is expected
+
     @pytest.mark.unit
     def test_driver_name(self):
         """Test driver has correct name."""
@@ -63,31 +90,80 @@ class TestHPE5071BConnection:
         assert vna.inst is None
 
     @pytest.mark.unit
-    @patch("socket.socket")
-    def test_check_host_reachable_success(self, mock_socket, vna_config):
+    @patch("socket.create_connection")
+    def test_check_host_reachable_success(self, mock_connect, vna_config):
         """Test host reachability check succeeds."""
-        # Mock socket to simulate successful connection
-        mock_sock_instance = MagicMock()
-        mock_sock_instance.connect_ex.return_value = 0
-        mock_socket.return_value.__enter__.return_value = mock_sock_instance
-
         vna = HPE5071B(vna_config)
         result = vna._check_host_reachable("192.168.1.100")
         assert result is True
 
     @pytest.mark.unit
-    @patch("socket.socket")
-    def test_check_host_reachable_failure(self, mock_socket, vna_config):
+    @patch("socket.create_connection", side_effect=ConnectionRefusedError)
+    def test_check_host_reachable_failure(self, mock_connect, vna_config):
         """Test host reachability check fails."""
-        # Mock socket to simulate failed connection
-        mock_sock_instance = MagicMock()
-        mock_sock_instance.connect_ex.return_value = 1  # Connection refused
-        mock_socket.return_value.__enter__.return_value = mock_sock_instance
-
         vna = HPE5071B(vna_config)
         result = vna._check_host_reachable("192.168.1.100", timeout=0.1)
         assert result is False
 
+    @pytest.mark.unit
+    @patch("socket.create_connection", side_effect=ConnectionRefusedError)
+    def test_check_host_reachable_resolves_host_once(self, mock_connect, vna_config):
+        """A hostname is looked up once and both ports probe the same address."""
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.7", 0))]
+        vna = HPE5071B(vna_config)
+
+        with patch("socket.getaddrinfo", return_value=infos) as mock_lookup:
+            assert vna._check_host_reachable("vna.lab", timeout=0.1) is False
+
+        mock_lookup.assert_called_once()
+        assert mock_lookup.call_args.kwargs["family"] == socket.AF_INET
+        assert sorted(c.args[0] for c in mock_connect.call_args_list) == [
+            ("10.0.0.7", 111),
+            ("10.0.0.7", 5025),
+        ]
+
+    @pytest.mark.unit
+    def test_check_host_reachable_unresolvable_host(self, vna_config):
+        """A name that does not resolve is unreachable without probing ports."""
+        vna = HPE5071B(vna_config)
+
+        with (
+            patch("socket.getaddrinfo", side_effect=socket.gaierror),
+            patch("tina.drivers.hp_e5071b._probe_port") as mock_probe,
+        ):
+            assert vna._check_host_reachable("no-such-vna.invalid") is False
+
+        mock_probe.assert_not_called()
+
+    @pytest.mark.unit
+    def test_check_host_reachable_does_not_wait_for_filtered_port(self, vna_config):
+        """A black-holed port must not delay a success on the other port."""
+        release = threading.Event()
+        probed = []
+        daemon_flags = []
+
+        def fake_probe(host, port, timeout):
+            probed.append(port)
+            daemon_flags.append(threading.current_thread().daemon)
+            if port == 111:
+                release.wait(timeout=5)
+                return False
+            return True
+
+        vna = HPE5071B(vna_config)
+        try:
+            with patch("tina.drivers.hp_e5071b._probe_port", fake_probe):
+                started = time.monotonic()
+                assert vna._check_host_reachable("192.168.1.100") is True
+                elapsed = time.monotonic() - started
+        finally:
+            release.set()
+
+        assert elapsed < 2
+        assert sorted(probed) == [111, 5025]
+        # A probe left running must not keep the interpreter alive
+        assert daemon_flags == [True, True]
+
     @pytest.mark.unit
     def test_connect_no_host(self):
         """Test that connecting without host raises error."""
@@ -115,6 +191,27 @@ class TestHPE5071BConnection:
         assert not vna.is_connected()
         assert vna.idn == ""
 
+    @pytest.mark.integration
+    def test_reconnect_reuses_resource_manager(
+        self, vna_config, mock_pyvisa_resource_manager, patch_socket_reachable
+    ):
+        """The VISA resource manager is created once and reused on reconnect."""
+        created = []
+
+        def counting_factory(backend=None):
+            created.append(backend)
+            return mock_pyvisa_resource_manager
+
+        vna = HPE5071B(vna_config)
+        with patch("pyvisa.ResourceManager", counting_factory):
+            vna.connect()
+            vna.disconnect()
+            vna.connect()
+            HPE5071B(vna_config).connect()
+
+        assert created == ["@py"]
+        vna.disconnect()
+
     @pytest.mark.integration
     def test_double_connect(
         self, vna_config, mock_pyvisa_resource_manager, patch_socket_reachable
@@ -232,7 +329,8 @@ class TestHPE5071BConfiguration:
 
         commands = cast(MockVisaResource, vna.inst).command_history
         # Should set format, sweep type, points, averaging
-        assert any("FORM" in cmd and "ASC" in cmd for cmd in commands)
+        assert any("FORM:DATA" in cmd and "REAL" in cmd for cmd in commands)
+        assert any("FORM:BORD" in cmd and "SWAP" in cmd for cmd in commands)
         assert any("SWE" in cmd and "LIN" in cmd for cmd in commands)
         assert any("POIN" in cmd for cmd in commands)
         assert any("AVER" in cmd for cmd in commands)
@@ -274,7 +372,12 @@ class TestHPE5071BMeasurement:
 
         vna.trigger_sweep()
 
-        commands = cast(MockVisaResource, vna.inst).command_history
+        # Chained program messages are split back into individual commands
+        commands = [
+            unit.lstrip(":")
+            for message in cast(MockVisaResource, vna.inst).command_history
+            for unit in message.split(";")
+        ]
         queries = cast(MockVisaResource, vna.inst).query_history
 
         # Should abort, set single mode, set BUS trigger, init
@@ -303,6 +406,47 @@ class TestHPE5071BMeasurement:
 
         vna.disconnect()
 
+    @pytest.mark.integration
+    def test_get_frequency_axis_is_read_back_from_instrument(
+        self, vna_config, mock_pyvisa_resource_manager, patch_socket_reachable
+    ):
+        """The axis reflects the sweep the instrument applied, not the request."""
+        vna = HPE5071B(vna_config)
+        vna.config.set_freq_range = True
+        vna.config.set_sweep_points = True
+        vna.config.sweep_points = 201
+        vna.connect()
+        vna.configure_frequency()
+        vna.configure_measurements()
+        inst = cast(MockVisaResource, vna.inst)
+        # The instrument clamps the point count it was sent
+        inst._sweep_points = 101
+        inst.reset_history()
+
+        freqs = vna.get_frequency_axis()
+
+        assert any("FREQ:DATA" in q for q in inst.query_history)
+        assert len(freqs) == 101
+        assert len(vna.get_sparam_data(1)[0]) == 101
+
+        vna.disconnect()
+
+    @pytest.mark.integration
+    def test_trace_length_must_match_frequency_axis(
+        self, vna_config, mock_pyvisa_resource_manager, patch_socket_reachable
+    ):
+        """A trace with a different point count than the axis is rejected."""
+        vna = HPE5071B(vna_config)
+        vna.connect()
+        inst = cast(MockVisaResource, vna.inst)
+        vna.get_frequency_axis()
+        inst._sweep_points += 1
+
+        with pytest.raises(ValueError, match="frequency axis"):
+            vna.get_all_sparameters()
+
+        vna.disconnect()
+
     @pytest.mark.integration
     def test_get_sparam_data(
         self, vna_config, mock_pyvisa_resource_manager, patch_socket_reachable
@@ -428,11 +572,32 @@ class TestHPE5071BDataValidation:
         vna._connected = True
         return vna, mock_inst
 
+    @pytest.mark.unit
+    def test_binary_reads_return_writable_arrays(self, connected_vna):
+        """Axis and traces stay writable although pyvisa's buffer is read-only."""
+        vna, mock_inst = connected_vna
+
+        def read_only_block(command, **kwargs):
+            values = [1.0, 2.0] if "FREQ" in command else [1.0, 0.0, 0.5, 0.0]
+            block = np.frombuffer(np.array(values).tobytes())
+            assert not block.flags.writeable
+            return block
+
+        mock_inst.query_binary_values.side_effect = read_only_block
+
+        freqs = vna.get_frequency_axis()
+        mag_db, phase_deg = vna.get_sparam_data(1)
+        freqs *= 2.0
+        mag_db += 1.0
+        phase_deg += 1.0
+
+        np.testing.assert_allclose(freqs, [2.0, 4.0])
+
     @pytest.mark.unit
     def test_get_sparam_data_empty_response_raises(self, connected_vna):
         """get_sparam_data should raise ValueError when CMD_GET_SDATA returns empty list."""
         vna, mock_inst = connected_vna
-        mock_inst.query_ascii_values.return_value = []
+        mock_inst.query_binary_values.return_value = np.array([])
         mock_inst.write = MagicMock()
 
         with pytest.raises(ValueError, match="unexpected number of values"):
@@ -442,12 +607,207 @@ class TestHPE5071BDataValidation:
     def test_get_sparam_data_odd_length_raises(self, connected_vna):
         """get_sparam_data should raise ValueError when CMD_GET_SDATA returns odd count."""
         vna, mock_inst = connected_vna
-        mock_inst.query_ascii_values.return_value = [0.5, -0.5, 0.7]
+        mock_inst.query_binary_values.return_value = np.array([0.5, -0.5, 0.7])
         mock_inst.write = MagicMock()
 
         with pytest.raises(ValueError, match="unexpected number of values"):
             vna.get_sparam_data(1)
 
+    @pytest.mark.unit
+    def test_get_sparam_data_reads_little_endian_real64_block(self, connected_vna):
+        """S-parameter data is read as a binary block and decoded as complex pairs."""
+        vna, mock_inst = connected_vna
+        mock_inst.query_binary_values.return_value = np.array([0.5, 0.0, 0.0, -0.1])
+
+        mag_db, phase_deg = vna.get_sparam_data(1)
+
+        mock_inst.query_binary_values.assert_called_once_with(
+            "CALC1:DATA:SDAT?", datatype="d", is_big_endian=False, container=np.ndarray
+        )
+        mock_inst.query_ascii_values.assert_not_called()
+        np.testing.assert_allclose(mag_db, 20 * np.log10([0.5, 0.1]), rtol=1e-9)
+        np.testing.assert_allclose(phase_deg, [0.0, -90.0])
+
+    @pytest.mark.unit
+    def test_get_sparam_data_matches_complex_reference(self, connected_vna):
+        """The fused conversion must agree with the plain complex-number maths."""
+        vna, mock_inst = connected_vna
+        rng = np.random.default_rng(1234)
+        raw = rng.normal(size=2 * 601)
+        raw[:2] = 0.0  # exercise the LOG_EPSILON floor
+        mock_inst.query_binary_values.return_value = raw.copy()
+
+        mag_db, phase_deg = vna.get_sparam_data(1)
+
+        comp = raw[0::2] + 1j * raw[1::2]
+        np.testing.assert_allclose(
+            mag_db, 20 * np.log10(np.abs(comp) + LOG_EPSILON), rtol=1e-12
+        )
+        np.testing.assert_allclose(phase_deg, np.angle(comp, deg=True), atol=1e-12)
+        assert mag_db.shape == phase_deg.shape == (601,)
+
+    @pytest.mark.unit
+    def test_sdata_conversion_writes_into_given_buffers(self):
+        """Preallocated output buffers are filled in place and returned."""
+        data = np.array([3.0, 4.0, 0.0, -2.0])
+        mag_out = np.empty(2)
+        phase_out = np.empty(2)
+
+        mag_db, phase_deg = _sdata_to_db_deg(data, mag_out, phase_out)
+
+        assert mag_db is mag_out
+        assert phase_deg is phase_out
+        np.testing.assert_allclose(mag_out, 20 * np.log10([5.0, 2.0]))
+        np.testing.assert_allclose(phase_out, [np.degrees(np.arctan2(4, 3)), -90.0])
+
+    @pytest.mark.unit
+    def test_get_all_sparameters_reads_traces_without_sleeping(self, connected_vna):
+        """All four traces are read back to back and converted together."""
+        vna, mock_inst = connected_vna
+        traces = [np.array([0.1 * n, 0.0, 0.0, 0.1 * n]) for n in range(1, 5)]
+        mock_inst.query_binary_values.side_effect = traces
+
+        with patch("tina.drivers.hp_e5071b.time.sleep") as mock_sleep:
+            sparams = vna.get_all_sparameters()
+
+        mock_sleep.assert_not_called()
+        assert [c.args[0] for c in mock_inst.write.call_args_list] == [
+            "CALC1:PAR1:SEL",
+            "CALC1:PAR2:SEL",
+            "CALC1:PAR3:SEL",
+            "CALC1:PAR4:SEL",
+        ]
+        assert list(sparams) == ["S11", "S21", "S12", "S22"]
+        for n, (mag_db, phase_deg) in enumerate(sparams.values(), start=1):
+            np.testing.assert_allclose(mag_db, 20 * np.log10([0.1 * n] * 2))
+            np.testing.assert_allclose(phase_deg, [0.0, 90.0])
+
+    @pytest.mark.unit
+    def test_get_all_sparameters_does_not_reuse_results(self, connected_vna):
+        """Repeat sweeps never overwrite the results of an earlier sweep."""
+        vna, mock_inst = connected_vna
+        mock_inst.query_binary_values.side_effect = [np.array([1.0, 0.0])] * 4 + [
+            np.array([0.1, 0.0])
+        ] * 4
+
+        first = vna.get_all_sparameters()
+        second = vna.get_all_sparameters()
+
+        np.testing.assert_allclose(first["S11"][0], [0.0], atol=1e-9)
+        np.testing.assert_allclose(second["S11"][0], [-20.0])
+        assert not np.shares_memory(first["S11"][0], second["S11"][0])
+
+    @pytest.mark.unit
+    def test_get_all_sparameters_rejects_mismatched_traces(self, connected_vna):
+        """Traces of different lengths cannot come from the same sweep."""
+        vna, mock_inst = connected_vna
+        mock_inst.query_binary_values.side_effect = [
+            np.zeros(4),
+            np.zeros(4),
+            np.zeros(6),
+            np.zeros(4),
+        ]
+
+        with pytest.raises(ValueError, match="different lengths"):
+            vna.get_all_sparameters()
+
+
+class TestHPE5071BOperationComplete:
+    """Unit tests for operation-complete waits and configuration syncs."""
+
+    @pytest.fixture
+    def connected_vna(self, vna_config):
+        """Create a connected VNA with a mocked instrument."""
+        vna = HPE5071B(vna_config)
+        mock_inst = MagicMock()
+        vna.inst = mock_inst
+        vna._connected = True
+        return vna, mock_inst
+
+    @pytest.mark.integration
+    def test_connect_leaves_status_registers_alone(
+        self, vna_config, mock_pyvisa_resource_manager, patch_socket_reachable
+    ):
+        """Connecting and sweeping must not clear the instrument's error queue."""
+        vna = HPE5071B(vna_config)
+        vna.connect()
+        vna.trigger_sweep()
+
+        commands = cast(MockVisaResource, vna.inst).command_history
+        assert not any("*CLS" in command for command in commands)
+
+        vna.disconnect()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("configure_measurements", ()),
+            ("setup_s_parameters", ()),
+            ("set_trigger_source", ("BUS",)),
+            ("restore_trigger_state", (("INT", True),)),
+        ],
+    )
+    def test_configuration_blocks_sync_once_without_sleeping(
+        self, connected_vna, method, args
+    ):
+        """Configuration blocks end with one *OPC? instead of fixed delays."""
+        vna, mock_inst = connected_vna
+        mock_inst.query.return_value = "1\n"
+
+        with patch("tina.drivers.hp_e5071b.time.sleep") as mock_sleep:
+            getattr(vna, method)(*args)
+
+        mock_sleep.assert_not_called()
+        mock_inst.query.assert_called_once_with("*OPC?")
+
+    @pytest.mark.unit
+    def test_setup_s_parameters_sends_one_chained_message(self, connected_vna):
+        """The whole trace setup should go out as a single VISA write."""
+        vna, mock_inst = connected_vna
+        mock_inst.query.return_value = "1\n"
+
+        vna.setup_s_parameters()
+
+        mock_inst.write.assert_called_once_with(
+            ":CALC1:PAR:COUN 4;"
+            ":CALC1:PAR1:DEF S11;:CALC1:PAR1:SEL;"
+            ":CALC1:PAR2:DEF S21;:CALC1:PAR2:SEL;"
+            ":CALC1:PAR3:DEF S12;:CALC1:PAR3:SEL;"
+            ":CALC1:PAR4:DEF S22;:CALC1:PAR4:SEL;"
+            ":CALC1:PAR1:SEL"
+        )
+
+    @pytest.mark.unit
+    def test_join_commands_resets_each_header_to_the_root(self):
+        """Subsystem commands get a leading colon; common commands do not."""
+        assert join_commands(["ABOR", ":INIT1", "*TRG"]) == ":ABOR;:INIT1;*TRG"
+        assert join_commands([]) == ""
+
+    @pytest.mark.unit
+    def test_command_builders_reuse_strings(self):
+        """Repeated builder calls return the cached string object."""
+        assert cmd_select_param(2) is cmd_select_param(2)
+        assert cmd_select_param(2) == "CALC1:PAR2:SEL"
+        # int and float arguments format differently, so they are cached apart
+        assert cmd_set_freq_start(1e6) == "SENS1:FREQ:STAR 1000000.0"
+        assert cmd_set_freq_start(1000000) == "SENS1:FREQ:STAR 1000000"
+
+    @pytest.mark.unit
+    def test_wait_polls_opc_on_resource_without_srq(self, vna_config):
+        """A TCPIP INSTR session has no wait_for_srq, so waits poll *OPC?."""
+        vna = HPE5071B(vna_config)
+        inst = MagicMock(spec=["write", "query", "close"])
+        inst.query.side_effect = ["0\n", "+1\n"]
+        vna.inst = inst
+        vna._connected = True
+
+        with patch("tina.drivers.hp_e5071b.time.sleep"):
+            vna._wait_for_operation_complete(timeout_seconds=1)
+
+        assert inst.query.call_args_list == [call("*OPC?"), call("*OPC?")]
+        inst.write.assert_not_called()
+
 
 class TestHPE5071BErrorHandling:
     """Test HP E5071B error handling and edge cases."""
@@ -492,23 +852,37 @@ class TestDriverDiscovery:
 
         def fake_import_module(name, package=None):
             imported.append((name, package))
-            module = types.ModuleType("fake_driver_module")
-            setattr(module, "HPE5071B", HPE5071B)
-            return module
+            # Defining the subclass is what registers it
+            type(
+                "FakeE5071B",
+                (HPE5071B,),
+                {
+                    "__module__": f"{driver_base.__package__}.hp_e5071b",
+                    "driver_name": "Fake E5071B",
+                },
+            )
+            return types.ModuleType("fake_driver_module")
 
         monkeypatch.setattr(
-            driver_base.Path,
-            "glob",
-            lambda *_args, **_kwargs: [driver_base.Path("hp_e5071b.py")],
+            driver_base.pkgutil,
+            "iter_modules",
+            lambda *_args, **_kwargs: [
+                pkgutil.ModuleInfo(None, "base", False),
+                pkgutil.ModuleInfo(None, "hp_e5071b", False),
+            ],
         )
         monkeypatch.setattr(driver_base.importlib, "import_module", fake_import_module)
+        monkeypatch.setattr(driver_base, "_DRIVERS_IMPORTED", False)
 
         try:
             driver_base._DRIVER_REGISTRY.clear()
             drivers = dict(driver_base.discover_drivers())
+            imports_after_first_call = list(imported)
+            driver_base.discover_drivers()
         finally:
             driver_base._DRIVER_REGISTRY.clear()
             driver_base._DRIVER_REGISTRY.update(original_registry)
 
-        assert drivers[HPE5071B.driver_name] is HPE5071B
+        assert drivers["Fake E5071B"].__name__ == "FakeE5071B"
+        assert imported == imports_after_first_call
         assert imported == [(".hp_e5071b", driver_base.__package__)]
@@ -406,7 +406,6 @@ class TestKeysightP5007ADataAcquisition:
         """Test frequency axis acquisition."""
         vna, mock_inst = connected_vna
         mock_inst.query.side_effect = ["10000000.0", "1500000000.0", "201"]
-        mock_inst.query_ascii_values.return_value = []
 
         freqs = vna.get_frequency_axis()
         assert len(freqs) == 201
@@ -428,23 +427,39 @@ class TestKeysightP5007ADataAcquisition:
         """Test S-parameter data acquisition."""
         vna, mock_inst = connected_vna
         # Simulate complex data: real, imag pairs
-        mock_inst.query_ascii_values.return_value = [0.5, -0.5, 0.7, -0.3]
-        mock_inst.query.return_value = "1\n"
+        mock_inst.query_ascii_values.return_value = np.array([0.5, -0.5, 0.7, -0.3])
 
         mag, phase = vna.get_sparam_data(1)
         assert len(mag) == 2
         assert len(phase) == 2
+        mock_inst.query_ascii_values.assert_called_once_with(
+            "CALC1:DATA:SDAT?", container=np.array
+        )
+        np.testing.assert_allclose(mag[0], 20 * np.log10(np.hypot(0.5, 0.5)))
+        np.testing.assert_allclose(
+            phase, np.degrees(np.arctan2([-0.5, -0.3], [0.5, 0.7]))
+        )
 
     @pytest.mark.unit
     def test_get_sparam_data_odd_length(self, connected_vna):
         """Odd-length SDAT responses should raise a clear parse error."""
         vna, mock_inst = connected_vna
-        mock_inst.query_ascii_values.return_value = [0.5, -0.5, 0.7]
-        mock_inst.query.return_value = "1\n"
+        mock_inst.query_ascii_values.return_value = np.array([0.5, -0.5, 0.7])
 
         with pytest.raises(ValueError, match="odd number of values"):
             vna.get_sparam_data(1)
 
+    @pytest.mark.unit
+    def test_get_sparam_data_accepts_integer_values(self, connected_vna):
+        """Values parsed as integers are still converted as float64 pairs."""
+        vna, mock_inst = connected_vna
+        mock_inst.query_ascii_values.return_value = np.array([1, 0, 0, 1])
+
+        mag, phase = vna.get_sparam_data(1)
+
+        np.testing.assert_allclose(mag, [0.0, 0.0], atol=1e-9)
+        np.testing.assert_allclose(phase, [0.0, 90.0])
+
     @pytest.mark.unit
     def test_get_all_sparameters(self, connected_vna):
         """Test getting all S-parameters."""
@@ -119,6 +119,13 @@ class MockVisaResource:
         self._track_call(command)
         self._simulate_delay(5)
 
+        # Chained program messages apply each command in turn
+        for unit in command.split(";"):
+            if unit.strip():
+                self._apply_command(unit)
+
+    def _apply_command(self, command: str) -> None:
+        """Update the simulated instrument state for a single SCPI command."""
         cmd = self._normalize_scpi(command)
 
         if "SENS1:FREQ:STAR" in cmd or "SENS:FREQ:STAR" in cmd:
@@ -247,6 +254,37 @@ class MockVisaResource:
         Raises:
             pyvisa.VisaIOError: If resource is closed
         """
+        return list(self._query_array(command))
+
+    def query_binary_values(
+        self,
+        command: str,
+        datatype: str = "f",
+        is_big_endian: bool = False,
+        container: Any = list,
+    ) -> Any:
+        """
+        Simulate querying an IEEE 488.2 binary block.
+
+        Args:
+            command: SCPI query string
+            datatype: struct format character of each value
+            is_big_endian: Byte order of the block (ignored in mock)
+            container: Type used to hold the returned values
+
+        Returns:
+            Values wrapped in ``container``
+
+        Raises:
+            pyvisa.VisaIOError: If resource is closed
+        """
+        values = self._query_array(command)
+        if container is np.ndarray:
+            return values.astype("f8" if datatype == "d" else "f4")
+        return container(values)
+
+    def _query_array(self, command: str) -> np.ndarray:
+        """Build the simulated array response shared by ASCII and binary queries."""
         if self._closed:
             raise pyvisa.VisaIOError(visa_constants.VI_ERROR_INV_OBJECT)
 
@@ -258,15 +296,13 @@ class MockVisaResource:
 
         if "FREQ:DATA?" in cmd:
             if self._sweep_type == "LIN":
-                return list(
-                    np.linspace(self._freq_start, self._freq_stop, self._sweep_points)
-                )
-            return list(
-                np.logspace(
-                    np.log10(self._freq_start),
-                    np.log10(self._freq_stop),
-                    self._sweep_points,
+                return np.linspace(
+                    self._freq_start, self._freq_stop, self._sweep_points
                 )
+            return np.logspace(
+                np.log10(self._freq_start),
+                np.log10(self._freq_stop),
+                self._sweep_points,
             )
 
         if "DATA:SDAT?" in cmd:
@@ -288,14 +324,12 @@ class MockVisaResource:
             real = mag * np.cos(np.deg2rad(phase))
             imag = mag * np.sin(np.deg2rad(phase))
 
-            data: list[float] = []
-            for real_value, imag_value in zip(real, imag):
-                data.append(real_value)
-                data.append(imag_value)
-
+            data = np.empty(2 * self._sweep_points)
+            data[0::2] = real
+            data[1::2] = imag
             return data
 
-        return []
+        return np.empty(0)
 
     def close(self) -> None:
         """Close the resource."""
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import re
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
+from rich.style import Style
 
 from tina.gui.tabs.log_logic import (
     MAX_LOG_HISTORY,
     build_style_map,
     copy_log,
+    filter_log_entries,
+    flush_pending_log,
     format_log_entry,
     log_message,
+    log_timestamp,
+    new_log_history,
+    passes_log_filters,
+    read_log_filters,
     refresh_log_display,
     should_show_log,
 )
@@ -60,7 +68,7 @@ def _make_app(
         get_css_variables=lambda: css_vars or {},
         _cached_style_map=None,
         query_one=query_one,
-        log_messages=[],
+        log_messages=new_log_history(),
         copy_to_clipboard=MagicMock(),
         notify=MagicMock(),
     )
@@ -73,7 +81,7 @@ class TestBuildStyleMap:
         """build_style_map should use the 'accent' CSS variable for the tx icon style."""
         app, _ = _make_app(css_vars={"accent": "#aabbcc"})
         style_map = build_style_map(app)
-        assert style_map["tx"][1] == "#aabbcc"
+        assert style_map["tx"][1] == Style.parse("#aabbcc")
 
     def test_falls_back_to_constants_when_vars_absent(self):
         """build_style_map falls back to THEME_* constants when CSS vars are missing."""
@@ -81,7 +89,7 @@ class TestBuildStyleMap:
 
         app, _ = _make_app(css_vars={})
         style_map = build_style_map(app)
-        assert style_map["tx"][1] == THEME_ACCENT
+        assert style_map["tx"][1] == Style.parse(THEME_ACCENT)
 
     def test_compound_levels_exist(self):
         """Compound levels like tx/poll and rx/poll must be present in the style map."""
@@ -93,8 +101,8 @@ class TestBuildStyleMap:
 
 @pytest.mark.unit
 class TestFormatLogEntry:
-    def test_escapes_rich_markup_in_message(self):
-        """format_log_entry must escape markup characters in the log message."""
+    def test_keeps_rich_markup_in_message_verbatim(self):
+        """format_log_entry must not interpret markup characters in the message."""
         app, _ = _make_app()
         app._cached_style_map = build_style_map(app)
         entry = {
@@ -103,9 +111,16 @@ class TestFormatLogEntry:
             "message": "a [bold]b[/bold]",
         }
         result = format_log_entry(app, entry)
-        # rich_escape turns [bold] into \[bold] — the bracket is escaped, not stripped
-        assert r"\[bold]" in result
-        assert "a" in result
+        assert result.plain == "12:00:00 i a [bold]b[/bold]"
+        assert not any(span.start >= len("12:00:00 i ") for span in result.spans)
+
+    def test_styles_icon_with_parsed_level_style(self):
+        """The level icon carries the pre-parsed style from the style map."""
+        app, _ = _make_app(css_vars={"error": "#ff0000"})
+        entry = {"timestamp": "12:00:00", "level": "error", "message": "oops"}
+        result = format_log_entry(app, entry)
+        icon_span = next(span for span in result.spans if span.start == 9)
+        assert icon_span.style == Style.parse("bold #ff0000")
 
     def test_uses_cached_style_map(self):
         """format_log_entry should build and cache the style_map on first call."""
@@ -174,6 +189,15 @@ class TestLogMessage:
         log_message(app, "new", level="info")
         assert len(app.log_messages) == MAX_LOG_HISTORY
 
+    def test_history_keeps_newest_entries_up_to_cap(self):
+        """The app's log history drops its oldest entries once full."""
+        app, _ = _make_app()
+        for i in range(MAX_LOG_HISTORY + 5):
+            log_message(app, f"msg{i}", level="info")
+        assert len(app.log_messages) == MAX_LOG_HISTORY
+        assert app.log_messages[0]["message"] == "msg5"
+        assert app.log_messages[-1]["message"] == f"msg{MAX_LOG_HISTORY + 4}"
+
     def test_writes_to_richlog_when_level_shown(self):
         """log_message writes to the RichLog widget when the level passes its filter."""
         rich_log = _FakeRichLog()
@@ -191,6 +215,160 @@ class TestLogMessage:
         assert not rich_log.lines
 
 
+@pytest.mark.unit
+class TestBulkLogFilters:
+    def test_filters_match_should_show_log(self):
+        """Filters read once give the same verdict as per-entry checks."""
+        checks = {
+            "#check_log_tx": _FakeCheckbox(True),
+            "#check_log_poll": _FakeCheckbox(False),
+            "#check_log_info": _FakeCheckbox(True),
+        }
+        app, _ = _make_app(checkboxes=checks)
+        filters = read_log_filters(app)
+
+        for level in ("tx", "tx/poll", "info", "unknown_level"):
+            assert passes_log_filters(level, filters) is should_show_log(app, level)
+
+    def test_refresh_reads_each_checkbox_once(self):
+        """Rebuilding the log looks up the filter checkboxes once, not per entry."""
+        app, rich_log = _make_app(checkboxes={"#check_log_info": _FakeCheckbox(True)})
+        lookup = app.query_one
+        queried: list[str] = []
+
+        def counting_query_one(selector, widget_type=None):
+            queried.append(selector)
+            return lookup(selector, widget_type)
+
+        app.query_one = counting_query_one
+        app.log_messages = [
+            {"timestamp": "00:00:00", "level": "info", "message": str(index)}
+            for index in range(50)
+        ]
+
+        refresh_log_display(app)
+
+        assert len(rich_log.lines) == 1
+        assert rich_log.lines[0].plain.count("\n") == 49
+        assert queried.count("#check_log_info") == 1
+
+    def test_messages_reuse_filters_read_by_refresh(self):
+        """After a rebuild, logging checks the cached filters, not the checkboxes."""
+        checks = {
+            "#check_log_info": _FakeCheckbox(True),
+            "#check_log_debug": _FakeCheckbox(False),
+        }
+        app, _ = _make_app(checkboxes=checks)
+        refresh_log_display(app)
+        app.query_one = MagicMock()
+
+        log_message(app, "hidden", level="debug")
+
+        assert app.log_messages[-1]["message"] == "hidden"
+        app.query_one.assert_not_called()
+
+    def test_filter_entries_checks_each_level_once(self, monkeypatch):
+        """Entries are filtered in order with one verdict per distinct level."""
+        import tina.gui.tabs.log_logic as log_logic
+
+        checked: list[str] = []
+        real_passes = log_logic.passes_log_filters
+
+        def counting_passes(level, filters):
+            checked.append(level)
+            return real_passes(level, filters)
+
+        monkeypatch.setattr(log_logic, "passes_log_filters", counting_passes)
+        entries = [
+            {"level": level, "message": str(index)}
+            for index, level in enumerate(["info", "tx/poll", "debug"] * 20)
+        ]
+
+        visible = filter_log_entries(entries, {"poll": False, "debug": True})
+
+        assert [entry["level"] for entry in visible] == ["info", "debug"] * 20
+        assert [entry["message"] for entry in visible][:2] == ["0", "2"]
+        assert sorted(checked) == ["debug", "info", "tx/poll"]
+
+
+@pytest.mark.unit
+class TestLogTimestamp:
+    def test_formats_once_per_second(self, monkeypatch):
+        """Timestamps within one wall-clock second reuse the formatted string."""
+        import tina.gui.tabs.log_logic as log_logic
+
+        clock = [1000.2]
+        strftime = MagicMock(side_effect=lambda _fmt, t: f"t{t}")
+        fake_time = SimpleNamespace(
+            time=lambda: clock[0], localtime=lambda secs: secs, strftime=strftime
+        )
+        monkeypatch.setattr(log_logic, "time", fake_time)
+
+        first = log_timestamp()
+        clock[0] = 1000.9
+        assert log_timestamp() == first == "t1000"
+        clock[0] = 1001.0
+        assert log_timestamp() == "t1001"
+        assert strftime.call_count == 2
+
+    def test_matches_clock_format(self):
+        """The timestamp is the local time as HH:MM:SS."""
+        assert re.fullmatch(r"\d{2}:\d{2}:\d{2}", log_timestamp())
+
+
+@pytest.mark.unit
+class TestBatchedLogWrites:
+    def _batching_app(self):
+        """Build an app stub with a built Log tab and write batching enabled."""
+        checks = {"#check_log_info": _FakeCheckbox(True)}
+        app, rich_log = _make_app(checkboxes=checks)
+        app._pending_log_lines = []
+        app._log_tab_built = True
+        app.call_later = MagicMock()
+        return app, rich_log
+
+    def test_burst_is_written_once_on_flush(self):
+        """Lines logged together are queued and written in a single call."""
+        app, rich_log = self._batching_app()
+
+        for index in range(3):
+            log_message(app, f"line {index}", level="info")
+
+        assert rich_log.lines == []
+        app.call_later.assert_called_once_with(flush_pending_log, app)
+
+        flush_pending_log(app)
+
+        assert len(rich_log.lines) == 1
+        messages = [
+            line.split(" ", 2)[2] for line in rich_log.lines[0].plain.splitlines()
+        ]
+        assert messages == ["line 0", "line 1", "line 2"]
+        assert app._pending_log_lines == []
+
+    def test_refresh_drops_lines_already_in_history(self):
+        """A rebuild writes queued lines itself, so the flush has nothing left."""
+        app, rich_log = self._batching_app()
+        log_message(app, "queued", level="info")
+
+        refresh_log_display(app)
+        flush_pending_log(app)
+
+        assert len(rich_log.lines) == 1
+        assert rich_log.lines[0].plain.count("queued") == 1
+
+    def test_unbuilt_log_tab_only_records_history(self):
+        """Before the Log tab exists, messages are stored but not formatted."""
+        app, rich_log = self._batching_app()
+        app._log_tab_built = False
+
+        log_message(app, "stored", level="info")
+
+        assert app.log_messages[-1]["message"] == "stored"
+        assert app._pending_log_lines == []
+        app.call_later.assert_not_called()
+
+
 @pytest.mark.unit
 class TestRefreshLogDisplay:
     def test_clears_and_rebuilds_visible_lines(self):
@@ -209,6 +387,18 @@ class TestRefreshLogDisplay:
         assert rich_log.cleared
         assert len(rich_log.lines) == 1
         assert "shown" in rich_log.lines[0]
+        assert "hidden" not in rich_log.lines[0]
+
+    def test_nothing_visible_writes_nothing(self):
+        """A fully filtered history leaves the cleared widget empty."""
+        checks = {"#check_log_info": _FakeCheckbox(False)}
+        app, rich_log = _make_app(checkboxes=checks)
+        app.log_messages = [
+            {"timestamp": "00:00:00", "level": "info", "message": "hidden"},
+        ]
+        refresh_log_display(app)
+        assert rich_log.cleared
+        assert rich_log.lines == []
 
 
 @pytest.mark.unit
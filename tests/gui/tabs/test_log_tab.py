@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import pytest
 from textual.app import App, ComposeResult
-from textual.widgets import Checkbox, RichLog
+from textual.widgets import Checkbox, RichLog, Static, TabbedContent, TabPane
 
 from tina.gui.tabs.log import compose_log_tab
+from tina.gui.tabs.log_logic import MAX_LOG_HISTORY, new_log_history
+from tina.main import VNAApp
 
 
 class _LogTabApp(App):
@@ -16,6 +18,33 @@ class _LogTabApp(App):
         yield from compose_log_tab()
 
 
+class _LazyLogTabApp(App):
+    """Minimal app that builds the Log tab the way VNAApp does, on first use."""
+
+    on_tab_activated = VNAApp.on_tab_activated
+    _build_log_tab = VNAApp._build_log_tab
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.last_measurement = None
+        self.log_messages = new_log_history()
+        self.log_messages.extend(
+            [
+                {"timestamp": "12:00:00", "level": "info", "message": "before open"},
+                {"timestamp": "12:00:01", "level": "debug", "message": "hidden"},
+                {"timestamp": "12:00:02", "level": "info", "message": "also shown"},
+            ]
+        )
+        self._cached_style_map = None
+        self._log_tab_built = False
+
+    def compose(self) -> ComposeResult:
+        with TabbedContent():
+            with TabPane("Setup", id="tab_measure"):
+                yield Static("setup")
+            yield TabPane("Log", id="tab_log")
+
+
 @pytest.mark.unit
 class TestComposeLogTab:
     """Smoke tests for the Log tab composition contract."""
@@ -55,3 +84,38 @@ class TestComposeLogTab:
         async with _LogTabApp().run_test() as pilot:
             log_area = pilot.app.query_one("#log_content", RichLog)
             assert "copy_log" in (log_area.border_title or "")
+
+    @pytest.mark.asyncio
+    async def test_log_content_is_capped_at_history_size(self) -> None:
+        """The RichLog keeps no more lines than the stored log history."""
+        async with _LogTabApp().run_test() as pilot:
+            log_area = pilot.app.query_one("#log_content", RichLog)
+            assert log_area.max_lines == MAX_LOG_HISTORY
+
+
+@pytest.mark.unit
+class TestLazyLogTab:
+    """The app's Log tab is only built when it is first opened."""
+
+    @pytest.mark.asyncio
+    async def test_log_tab_is_built_on_first_activation(self) -> None:
+        """Opening the Log tab mounts it once and replays the stored log."""
+        app = _LazyLogTabApp()
+        async with app.run_test() as pilot:
+            assert not app.query("#log_content")
+
+            app.query_one(TabbedContent).active = "tab_log"
+            await pilot.pause()
+
+            log_area = app.query_one("#log_content", RichLog)
+            assert [line.text.rstrip() for line in log_area.lines] == [
+                "12:00:00 i before open",
+                "12:00:02 i also shown",
+            ]
+
+            app.query_one(TabbedContent).active = "tab_measure"
+            await pilot.pause()
+            app.query_one(TabbedContent).active = "tab_log"
+            await pilot.pause()
+
+            assert len(app.query("#log_content")) == 1
@@ -0,0 +1,74 @@
+"""Unit tests for setup_logic helpers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from tina.gui.tabs.setup_logic import (
+    get_host_autocomplete_choices,
+    get_port_autocomplete_choices,
+    parse_float_input,
+    parse_int_input,
+)
+
+
+def _app(host_history: list[str], port_history: list[str]) -> SimpleNamespace:
+    return SimpleNamespace(
+        settings=SimpleNamespace(host_history=host_history, port_history=port_history)
+    )
+
+
+@pytest.mark.unit
+class TestHistoryAutocompleteChoices:
+    """Tests for host/port history autocomplete choices."""
+
+    def test_choices_skip_empty_entries_and_keep_order(self):
+        """Choices follow MRU order and omit blank history entries."""
+        app = _app(["10.0.0.2", "", "10.0.0.1"], ["inst0"])
+
+        choices = get_host_autocomplete_choices(app)
+
+        assert [c.value for c in choices] == ["10.0.0.2", "10.0.0.1"]
+        assert all(c.kind == "history" for c in choices)
+
+    def test_unchanged_history_reuses_cached_choices(self):
+        """Repeated calls with identical history return the same tuple."""
+        app = _app([], ["inst0", "inst1"])
+
+        first = get_port_autocomplete_choices(app)
+
+        assert isinstance(first, tuple)
+        assert get_port_autocomplete_choices(app) is first
+
+    def test_mutated_history_rebuilds_choices(self):
+        """In-place history mutation is reflected on the next call."""
+        app = _app(["10.0.0.1"], [])
+        get_host_autocomplete_choices(app)
+
+        app.settings.host_history.insert(0, "10.0.0.9")
+
+        assert [c.value for c in get_host_autocomplete_choices(app)] == [
+            "10.0.0.9",
+            "10.0.0.1",
+        ]
+
+
+@pytest.mark.unit
+class TestNumericInputParsing:
+    """Tests for the fallback-aware numeric setup input parsers."""
+
+    def test_valid_values_are_parsed(self):
+        """Well-formed input wins over the fallback."""
+        assert parse_float_input(" 2.5 ", 1.0) == 2.5
+        assert parse_int_input("801", 601) == 801
+
+    @pytest.mark.parametrize("raw", ["", "   ", "12.", "abc"])
+    def test_incomplete_values_keep_fallback(self, raw):
+        """Empty or half-typed input keeps the previous integer value."""
+        assert parse_int_input(raw, 601) == 601
+
+    def test_invalid_float_keeps_fallback(self):
+        """A non-numeric frequency keeps the previous value."""
+        assert parse_float_input("1e", 1100.0) == 1100.0
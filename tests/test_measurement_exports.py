@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import tkinter as tk
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, cast
@@ -19,9 +20,18 @@ from src.tina.export import (
     embed_svg_metadata,
 )
 from src.tina.gui.tabs import tools_logic
-from src.tina.main import VNAApp
+from src.tina.main import VNAApp, WorkerResponsesQueued
 from src.tina.utils.touchstone import TouchstoneExporter
-from src.tina.worker import ImportRequest, ImportResult, MessageType
+from src.tina.worker import (
+    BackgroundJob,
+    ImportRequest,
+    ImportResult,
+    LogMessage,
+    MeasurementResult,
+    MeasurementWorker,
+    MessageType,
+    ProgressUpdate,
+)
 
 ORIGINAL_ASYNCIO_CREATE_TASK = asyncio.create_task
 
@@ -166,7 +176,7 @@ class _FakeApp:
     _results_plot_cache_key: tuple[object, ...] | None
     _results_plot_display_key: tuple[int, int] | None
     _results_plot_pixel_size: tuple[int, int] | None
-    last_plot_path: str | None
+    last_plot_image: Image.Image | None
     plot_temp_dir: Path
 
     def __init__(
@@ -260,7 +270,7 @@ class _FakeApp:
         )
         self._get_tools_trace = cast(Any, lambda: "S21")
         self.plot_temp_dir = Path("/tmp")
-        self.last_plot_path = None
+        self.last_plot_image = None
         self._results_plot_generation = 0
         self._results_plot_cache_key = None
         self._results_plot_display_key = None
@@ -312,6 +322,13 @@ class _FakeApp:
             Any,
             lambda: VNAApp._refresh_export_button_labels(cast(Any, self)),
         )
+        self._widget_cache = {}
+        self._cached_query = cast(
+            Any,
+            lambda selector, expect_type: VNAApp._cached_query(
+                cast(Any, self), selector, expect_type
+            ),
+        )
         self._minimal_export_suffix = cast(
             Any,
             lambda minimal_export: VNAApp._minimal_export_suffix(minimal_export),
@@ -450,6 +467,43 @@ class TestDirectMeasurementPlotExports:
             "No measurement data to export", "error"
         )
 
+    def test_file_dialogs_reuse_one_hidden_root(
+        self, sample_measurement: dict[str, Any], tmp_path: Path
+    ) -> None:
+        """Repeated exports parent their dialogs on the same hidden Tk root."""
+        app = _FakeApp(sample_measurement, output_folder=str(tmp_path))
+        fake_root = MagicMock()
+        fake_tk = MagicMock(return_value=fake_root)
+        fake_dialog = MagicMock(return_value=str(tmp_path / "plot.png"))
+
+        with (
+            patch("src.tina.main.tk.Tk", fake_tk),
+            patch("src.tina.main.filedialog.asksaveasfilename", fake_dialog),
+        ):
+            VNAApp.handle_export_png(cast(Any, app))
+            VNAApp.handle_export_svg(cast(Any, app))
+
+        fake_tk.assert_called_once()
+        fake_root.withdraw.assert_called_once()
+        fake_root.destroy.assert_not_called()
+        assert fake_dialog.call_count == 2
+        assert all(
+            call.kwargs["parent"] is fake_root for call in fake_dialog.mock_calls
+        )
+
+    def test_dialog_root_is_recreated_after_being_destroyed(self) -> None:
+        """A root destroyed outside the app is replaced on the next dialog."""
+        app = _FakeApp(None)
+        stale_root = MagicMock()
+        stale_root.winfo_exists.side_effect = tk.TclError("destroyed")
+        app._tk_root = stale_root
+        fresh_root = MagicMock()
+
+        with patch("src.tina.main.tk.Tk", return_value=fresh_root):
+            assert VNAApp._dialog_root(cast(Any, app)) is fresh_root
+
+        assert app._tk_root is fresh_root
+
     def test_export_png_uses_current_plot_selection(
         self, sample_measurement: dict[str, Any], tmp_path: Path
     ) -> None:
@@ -1921,6 +1975,159 @@ class TestMeasurementImportNotifications:
         assert app._tabbed_content.active == "tab_measure"
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_resize_burst_is_coalesced_into_one_update(
+    sample_measurement: dict[str, Any],
+) -> None:
+    """A burst of resize events should redraw plots and the path label once."""
+
+    class _FakeTimer:
+        """Minimal timer stub for resize debounce tests."""
+
+        def __init__(self, callback) -> None:
+            self.callback = callback
+            self.stopped = False
+
+        def stop(self) -> None:
+            """Record that the timer would have been stopped."""
+            self.stopped = True
+
+    app = object.__new__(VNAApp)
+    app.last_measurement = sample_measurement
+    app.last_output_path = sample_measurement["output_path"]
+    app._resize_timer = None
+    app._redraw_plot = AsyncMock()
+    app._delayed_tools_refresh = AsyncMock()
+    app._update_output_path_label = MagicMock()
+    app._is_tools_tab_active = MagicMock(return_value=True)
+
+    timers: list[_FakeTimer] = []
+
+    def set_timer(delay: float, callback=None, *, name=None, pause: bool = False):
+        assert delay == pytest.approx(0.15)
+        timer = _FakeTimer(callback)
+        timers.append(timer)
+        return timer
+
+    cast(Any, app).set_timer = set_timer
+
+    for _ in range(3):
+        VNAApp.on_resize(app, SimpleNamespace())
+
+    assert [timer.stopped for timer in timers] == [True, True, False]
+
+    await timers[-1].callback()
+
+    assert app._resize_timer is None
+    app._update_output_path_label.assert_called_once_with()
+    app._redraw_plot.assert_awaited_once_with()
+    app._delayed_tools_refresh.assert_awaited_once_with()
+
+
+@pytest.mark.unit
+def test_worker_notification_drains_all_queued_responses() -> None:
+    """One worker notification should handle every response queued so far."""
+    app = object.__new__(VNAApp)
+    app.worker = MeasurementWorker()
+    handled: list[str] = []
+    app._handle_worker_message = cast(Any, lambda msg: handled.append(msg.data.message))
+    app.worker._send_response(MessageType.LOG, LogMessage("first", "info"))
+    app.worker._send_response(MessageType.LOG, LogMessage("second", "info"))
+
+    VNAApp.on_worker_responses_queued(app, WorkerResponsesQueued())
+    VNAApp.on_worker_responses_queued(app, WorkerResponsesQueued())
+
+    assert handled == ["first", "second"]
+
+
+@pytest.mark.unit
+def test_worker_notification_handles_a_bounded_batch() -> None:
+    """A burst of responses is split across notifications, none is lost."""
+    app = object.__new__(VNAApp)
+    app.worker = MeasurementWorker()
+    handled: list[str] = []
+    app._handle_worker_message = cast(Any, lambda msg: handled.append(msg.data.message))
+    for text in ("first", "second", "third"):
+        app.worker._send_response(MessageType.LOG, LogMessage(text, "info"))
+
+    with patch("src.tina.main.WORKER_RESPONSE_BATCH", 2):
+        VNAApp.on_worker_responses_queued(app, WorkerResponsesQueued())
+        assert handled == ["first", "second"]
+        VNAApp.on_worker_responses_queued(app, WorkerResponsesQueued())
+
+    assert handled == ["first", "second", "third"]
+
+
+@pytest.mark.unit
+def test_worker_notification_skips_superseded_progress() -> None:
+    """Only the newest progress per target in a batch reaches the handler."""
+    app = object.__new__(VNAApp)
+    app.worker = MeasurementWorker()
+    handled: list[object] = []
+    app._handle_worker_message = cast(Any, lambda msg: handled.append(msg.data))
+    send = app.worker._send_response
+    send(MessageType.PROGRESS, ProgressUpdate("Sweep", 10.0))
+    send(MessageType.PROGRESS, ProgressUpdate("Job", 10.0, job_id=1))
+    send(MessageType.LOG, LogMessage("between", "info"))
+    send(MessageType.PROGRESS, ProgressUpdate("Sweep", 20.0))
+    send(MessageType.PROGRESS, ProgressUpdate("Sweep", 30.0))
+    send(MessageType.PROGRESS, BackgroundJob(job_id=1, operation="Job", progress=100.0))
+
+    VNAApp.on_worker_responses_queued(app, WorkerResponsesQueued())
+
+    assert handled == [
+        ProgressUpdate("Job", 10.0, job_id=1),
+        LogMessage("between", "info"),
+        ProgressUpdate("Sweep", 30.0),
+        BackgroundJob(job_id=1, operation="Job", progress=100.0),
+    ]
+
+
+@pytest.mark.unit
+def test_worker_messages_dispatch_by_type() -> None:
+    """Responses reach their handler; command-only types are ignored."""
+    app = object.__new__(VNAApp)
+    logged: list[tuple[str, str]] = []
+    app.log_message = cast(Any, lambda message, level: logged.append((message, level)))
+
+    VNAApp._handle_worker_message(
+        app, SimpleNamespace(type=MessageType.LOG, data=LogMessage("hi", "info"))
+    )
+    VNAApp._handle_worker_message(
+        app, SimpleNamespace(type=MessageType.CONNECT, data=None)
+    )
+
+    assert logged == [("hi", "info")]
+
+
+@pytest.mark.unit
+def test_measurement_without_export_selection_schedules_no_task(
+    sample_measurement: dict[str, Any],
+) -> None:
+    """MEASUREMENT_COMPLETE with nothing to export finishes without a task."""
+    app = _FakeApp(None, selected_params=())
+    app.measuring = True
+    app._prepare_measurement_export = cast(
+        Any, lambda result: VNAApp._prepare_measurement_export(cast(Any, app), result)
+    )
+    result = MeasurementResult(
+        frequencies=sample_measurement["freqs"],
+        sparams=sample_measurement["sparams"],
+    )
+
+    with patch("src.tina.main.asyncio.create_task") as create_task:
+        VNAApp._handle_worker_message(
+            cast(Any, app),
+            SimpleNamespace(type=MessageType.MEASUREMENT_COMPLETE, data=result),
+        )
+
+    create_task.assert_not_called()
+    assert app.measuring is False
+    app.enable_buttons_for_state.assert_called_once()
+    app.reset_progress.assert_called_once()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_plot_control_changes_are_debounced(
@@ -2597,7 +2804,7 @@ class TestPlotRedrawCaching:
 
     @pytest.mark.asyncio
     async def test_delayed_redraw_plot_skips_when_results_plot_is_current(
-        self, sample_measurement: dict[str, Any], tmp_path: Path
+        self, sample_measurement: dict[str, Any]
     ) -> None:
         """Results tab activation should no-op when the image is already current."""
         app = _FakeApp(sample_measurement)
@@ -2626,9 +2833,7 @@ class TestPlotRedrawCaching:
         )
         app._results_plot_display_key = (120, 30)
         app._results_plot_pixel_size = (1920, 1080)
-        plot_file = tmp_path / "current_plot_1.png"
-        plot_file.write_bytes(b"png")
-        app.last_plot_path = str(plot_file)
+        app.last_plot_image = Image.new("RGBA", (1920, 1080))
         app._update_results = AsyncMock()
 
         await VNAApp._delayed_redraw_plot(cast(Any, app))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib
+import subprocess
 import sys
 from contextlib import contextmanager
 from types import ModuleType
@@ -109,12 +110,12 @@ def test_gui_app_module_exports_names_without_eager_main_import():
 
 @pytest.mark.unit
 def test_loader_skips_progress_bar_for_help_flag():
-    """The loader should delegate directly to tina.main for help output."""
+    """The loader should delegate directly to the CLI entry for help output."""
     loader = importlib.import_module("tina._loader")
     fake_main = Mock()
 
     with patch.object(sys, "argv", ["tina", "--help"]):
-        with patch("tina.main.main", fake_main):
+        with patch("tina.cli.entry.main", fake_main):
             with patch("rich.progress.Progress") as mock_progress:
                 loader.main()
 
@@ -124,12 +125,12 @@ def test_loader_skips_progress_bar_for_help_flag():
 
 @pytest.mark.unit
 def test_loader_skips_progress_bar_for_now_flag():
-    """The loader should delegate directly to tina.main in CLI mode."""
+    """The loader should delegate directly to the CLI entry in CLI mode."""
     loader = importlib.import_module("tina._loader")
     fake_main = Mock()
 
     with patch.object(sys, "argv", ["tina", "--now"]):
-        with patch("tina.main.main", fake_main):
+        with patch("tina.cli.entry.main", fake_main):
             with patch("rich.progress.Progress") as mock_progress:
                 loader.main()
 
@@ -137,6 +138,35 @@ def test_loader_skips_progress_bar_for_now_flag():
     mock_progress.assert_not_called()
 
 
+@pytest.mark.unit
+def test_help_does_not_import_gui_modules():
+    """``tina --help`` must not pay for importing the GUI, Textual or matplotlib."""
+    code = (
+        "import sys\n"
+        "sys.argv = ['tina', '--help']\n"
+        "from tina._loader import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = ('tina.main', 'textual', 'matplotlib', 'skrf')\n"
+        "print(sorted(name for name in heavy if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+@pytest.mark.unit
+def test_main_module_reexports_cli_entry():
+    """``tina.main.main`` stays available for ``python -m tina.main`` and GUI exports."""
+    from tina.cli.entry import main as entry_main
+    from tina.main import main as app_main
+
+    assert app_main is entry_main
+
+
 @pytest.mark.unit
 def test_loader_uses_progress_bar_and_executes_all_steps():
     """The loader should run all preload steps before launching the app."""
@@ -194,3 +224,37 @@ def test_loader_uses_progress_bar_and_executes_all_steps():
 
     assert executed_steps == ["numpy", "matplotlib", "scikit-rf"]
     assert fake_main.call_count == 1
+
+
+@pytest.mark.unit
+def test_top_level_package_exports_are_lazy():
+    """Importing ``tina`` should not eagerly bind heavy exports."""
+    with _evict_module("tina"):
+        tina = importlib.import_module("tina")
+
+        assert set(tina.__all__) <= set(tina.__dir__())
+        for name in tina.__all__:
+            assert name not in tina.__dict__
+
+
+@pytest.mark.unit
+def test_top_level_package_exports_resolve_and_cache():
+    """Accessing a lazy export should resolve it from its submodule and cache it."""
+    from tina.config.settings import AppSettings
+    from tina.drivers import HPE5071B
+
+    with _evict_module("tina"):
+        tina = importlib.import_module("tina")
+
+        assert tina.AppSettings is AppSettings
+        assert tina.VNA is HPE5071B
+        assert tina.__dict__["AppSettings"] is AppSettings
+
+
+@pytest.mark.unit
+def test_top_level_package_unknown_attribute_raises():
+    """Unknown attributes should still raise AttributeError."""
+    import tina
+
+    with pytest.raises(AttributeError):
+        _ = tina.does_not_exist
@@ -1,7 +1,10 @@
-"""Unit tests for hex_to_rgb and get_plot_colors."""
+"""Unit tests for hex_to_rgb, get_plot_colors and get_app_plot_colors."""
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
 
 from tina.config.constants import THEME_WARNING
@@ -10,9 +13,11 @@ from tina.gui.plotting.colors import (
     SPARAM_FALLBACK_COLORS,
     SPARAM_THEME_KEYS,
     TRACE_COLOR_DEFAULT,
+    get_app_plot_colors,
     get_plot_colors,
     hex_to_rgb,
 )
+from tina.utils import plotting
 
 
 class TestHexToRgb:
@@ -52,6 +57,13 @@ class TestHexToRgb:
         with pytest.raises(ValueError):
             hex_to_rgb("")
 
+    @pytest.mark.unit
+    def test_non_hex_characters_raise_value_error(self):
+        """Signs, spaces and underscores accepted by int() are not hex digits."""
+        for bad in ("#-12345", "#+12345", "# 12345", "#12_345", "#gggggg"):
+            with pytest.raises(ValueError):
+                hex_to_rgb(bad)
+
 
 class TestGetPlotColors:
     """Tests for the get_plot_colors color scheme builder."""
@@ -147,6 +159,35 @@ class TestGetPlotColors:
         for param, hex_val in result["traces"].items():
             assert result["traces_rgb"][param] == hex_to_rgb(hex_val)
 
+    @pytest.mark.unit
+    def test_fallback_traces_are_not_reparsed(self, monkeypatch):
+        """Traces matching the fallback palette reuse the precomputed RGB tuples."""
+        calls: list[str] = []
+
+        def counting_hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+            calls.append(hex_color)
+            return hex_to_rgb(hex_color)
+
+        monkeypatch.setattr(plotting, "hex_to_rgb", counting_hex_to_rgb)
+        theme = {SPARAM_THEME_KEYS["S12"]: SPARAM_FALLBACK_COLORS["S12"]}
+        theme[SPARAM_THEME_KEYS["S11"]] = "#123456"
+
+        result = get_plot_colors(theme)
+
+        assert result["traces_rgb"]["S11"] == (0x12, 0x34, 0x56)
+        assert result["traces_rgb"]["S12"] == hex_to_rgb(SPARAM_FALLBACK_COLORS["S12"])
+        assert "#123456" in calls
+        assert SPARAM_FALLBACK_COLORS["S12"] not in calls
+        assert SPARAM_FALLBACK_COLORS["S22"] not in calls
+
+    @pytest.mark.unit
+    def test_plotting_shares_color_helpers_with_colors_module(self):
+        """Both color modules use one hex parser and one fallback RGB table."""
+        from tina.utils import colors
+
+        assert plotting.hex_to_rgb is colors.hex_to_rgb
+        assert plotting.SPARAM_FALLBACK_COLORS_RGB is colors.SPARAM_FALLBACK_COLORS_RGB
+
     @pytest.mark.unit
     def test_cursor1_is_alias_for_warning(self):
         """cursor1 color must equal the warning color (they share the same resolved value)."""
@@ -160,3 +201,23 @@ class TestGetPlotColors:
         theme = {"warning": "not-a-color"}
         result = get_plot_colors(theme)
         assert result["cursor1_rgb"] == hex_to_rgb(THEME_WARNING)
+
+
+class TestGetAppPlotColors:
+    """Tests for the per-theme plot color cache kept on the app."""
+
+    @pytest.mark.unit
+    def test_theme_variables_are_read_until_cache_is_cleared(self):
+        """Colors are built once per theme and rebuilt after a reset."""
+        css = MagicMock(return_value={"foreground": "#abcdef"})
+        app = SimpleNamespace(get_css_variables=css)
+
+        first = get_app_plot_colors(app)
+        assert get_app_plot_colors(app) is first
+        assert first == get_plot_colors({"foreground": "#abcdef"})
+        css.assert_called_once()
+
+        app._cached_plot_colors = None
+        css.return_value = {"foreground": "#123456"}
+        assert get_app_plot_colors(app)["fg"] == "#123456"
+        assert css.call_count == 2
@@ -0,0 +1,55 @@
+"""Tests for the GUI entry point's event loop selection."""
+
+from __future__ import annotations
+
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import tina.main as main_module
+
+
+@pytest.fixture
+def fake_app():
+    """Patch out config migration and VNAApp construction."""
+    app = MagicMock()
+    with (
+        patch("tina.config.migration.migrate_legacy_config", return_value=None),
+        patch.object(main_module, "VNAApp", return_value=app),
+    ):
+        yield app
+
+
+@pytest.mark.unit
+def test_run_gui_uses_uvloop_when_installed(fake_app, monkeypatch):
+    """An installed uvloop drives the app's async entry point."""
+    uvloop = ModuleType("uvloop")
+    uvloop.run = MagicMock()
+    monkeypatch.setitem(sys.modules, "uvloop", uvloop)
+    monkeypatch.setattr(sys, "platform", "linux")
+
+    main_module.run_gui()
+
+    uvloop.run.assert_called_once_with(fake_app.run_async.return_value)
+    fake_app.run.assert_not_called()
+
+
+@pytest.mark.unit
+def test_run_gui_falls_back_without_uvloop(fake_app, monkeypatch):
+    """Without uvloop the app runs on the default asyncio loop."""
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    main_module.run_gui()
+
+    fake_app.run.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_uvloop_is_never_used_on_windows(monkeypatch):
+    """uvloop does not support Windows, so it is not even imported there."""
+    monkeypatch.setitem(sys.modules, "uvloop", ModuleType("uvloop"))
+    monkeypatch.setattr(sys, "platform", "win32")
+
+    assert main_module._import_uvloop() is None
@@ -0,0 +1,149 @@
+"""Tests for the app's cached lookups of long-lived widgets."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+
+from tina.main import VNAApp
+
+
+def _make_app() -> tuple[VNAApp, list[str]]:
+    """Build an unmounted app whose ``query_one`` records each selector."""
+    app = object.__new__(VNAApp)
+    app._widget_cache = {}
+    app.connected = True
+    widgets: dict[str, MagicMock] = {}
+    queried: list[str] = []
+
+    def query_one(selector: str, _widget_type=None) -> MagicMock:
+        queried.append(selector)
+        return widgets.setdefault(selector, MagicMock())
+
+    cast(Any, app).query_one = query_one
+    return app, queried
+
+
+@pytest.mark.unit
+def test_progress_updates_query_each_widget_once() -> None:
+    """Repeated progress updates reuse the widgets found on the first call."""
+    app, queried = _make_app()
+
+    for progress in (10.0, 50.0, 90.0):
+        VNAApp.set_progress(app, "Measuring", progress)
+    VNAApp.reset_progress(app)
+
+    assert sorted(queried) == ["#progress_bar", "#progress_label"]
+    progress_bar = app._widget_cache["#progress_bar"]
+    cast(MagicMock, progress_bar.update).assert_called_with(total=100, progress=0)
+
+
+@pytest.mark.unit
+def test_button_state_changes_share_cached_buttons() -> None:
+    """Button toggles look up each action button only once."""
+    app, queried = _make_app()
+    cast(Any, app)._refresh_export_button_labels = MagicMock()
+    cast(Any, app)._sync_measurement_action_buttons = MagicMock()
+
+    VNAApp.disable_all_buttons(app)
+    VNAApp.enable_buttons_for_state(app)
+    VNAApp.update_connect_button(app)
+
+    assert sorted(queried) == ["#btn_connect", "#btn_measure", "#btn_read_params"]
+    assert app._widget_cache["#btn_measure"].disabled is False
+
+
+@pytest.mark.unit
+def test_export_buttons_restyle_only_when_mode_changes() -> None:
+    """Export button styling is skipped while minimal-export mode is unchanged."""
+    app, queried = _make_app()
+    app._minimal_export_mode = False
+
+    VNAApp._refresh_export_button_labels(app)
+    first_pass = len(queried)
+    VNAApp._refresh_export_button_labels(app)
+    assert len(queried) == first_pass
+
+    app._minimal_export_mode = True
+    VNAApp._refresh_export_button_labels(app)
+    assert len(queried) == 2 * first_pass
+
+
+@pytest.mark.unit
+def test_output_path_label_redrawn_only_when_width_or_path_changes() -> None:
+    """The path label is re-truncated only after its width or path changes."""
+    app, _ = _make_app()
+    app.last_output_path = "/data/measurements/run_001.s2p"
+    for selector in (
+        "#btn_open_output",
+        "#btn_export_touchstone",
+        "#btn_export_csv",
+        "#btn_export_png",
+        "#btn_export_svg",
+    ):
+        app._widget_cache[selector] = MagicMock(size=MagicMock(width=8))
+    container = MagicMock(size=MagicMock(width=120))
+    label = MagicMock()
+    app._widget_cache["#output_file_container"] = container
+    app._widget_cache["#output_file_label"] = label
+
+    VNAApp._update_output_path_label(app)
+    VNAApp._update_output_path_label(app)
+    assert label.update.call_count == 1
+
+    container.size.width = 100
+    VNAApp._update_output_path_label(app)
+    app.last_output_path = "/data/measurements/run_002.s2p"
+    VNAApp._update_output_path_label(app)
+    assert label.update.call_count == 3
+
+
+@pytest.mark.unit
+def test_measure_with_invalid_input_leaves_config_untouched() -> None:
+    """A bad input aborts the sweep before any config field is changed."""
+    app, _ = _make_app()
+    config = MagicMock(start_freq_hz=1e6, stop_freq_hz=2e6, sweep_points=201)
+    app.config = config
+    app.measuring = False
+    app.worker = MagicMock()
+    for name in ("disable_all_buttons", "enable_buttons_for_state", "reset_progress"):
+        setattr(cast(Any, app), name, MagicMock())
+    cast(Any, app).log_message = MagicMock()
+    cast(Any, app).notify = MagicMock()
+    values = {
+        "#select_freq_unit": "MHz",
+        "#input_start_freq": "10",
+        "#input_stop_freq": "500",
+        "#input_points": "401",
+        "#input_avg_count": "not a number",
+    }
+    for selector, value in values.items():
+        app._widget_cache[selector] = MagicMock(value=value)
+
+    VNAApp.handle_measure(app)
+
+    assert (config.start_freq_hz, config.stop_freq_hz, config.sweep_points) == (
+        1e6,
+        2e6,
+        201,
+    )
+    assert app.measuring is False
+    app.worker.send_command.assert_not_called()
+
+
+@pytest.mark.unit
+def test_checked_sparams_follow_checkbox_order_and_availability() -> None:
+    """Ticked traces come back in S11, S21, S12, S22 order, limited to the data."""
+    app, queried = _make_app()
+    ticked = {"s11": True, "s21": False, "s12": True, "s22": True}
+    for name, value in ticked.items():
+        app._widget_cache[f"#check_plot_{name}"] = MagicMock(value=value)
+
+    assert VNAApp._checked_sparams(app, "plot") == ["S11", "S12", "S22"]
+    assert VNAApp._checked_sparams(app, "plot", {"S11": None, "S22": None}) == [
+        "S11",
+        "S22",
+    ]
+    assert queried == []
@@ -9,7 +9,7 @@ import queue
 import time
 from inspect import getsource
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -25,8 +25,10 @@ from tina.worker import (
     ImportResult,
     LogMessage,
     MeasurementWorker,
+    Message,
     MessageType,
     ParamsResult,
+    ProgressUpdate,
     _render_tools_plot_snapshot,
     _write_touchstone_save_back,
 )
@@ -42,6 +44,18 @@ class TestWorkerBasics:
         assert worker is not None
         assert not worker._running
 
+    @pytest.mark.unit
+    def test_frequent_response_payloads_use_slots(self):
+        """Progress and log payloads carry no per-instance ``__dict__``."""
+        worker = MeasurementWorker()
+        worker._send_response(MessageType.PROGRESS, ProgressUpdate("Sweep", 50.0))
+
+        msg = worker.get_response_nowait()
+
+        assert not hasattr(msg, "__dict__")
+        assert not hasattr(msg.data, "__dict__")
+        assert not hasattr(LogMessage("hi", "info"), "__dict__")
+
     @pytest.mark.unit
     def test_worker_start_stop(self):
         """Test starting and stopping worker."""
@@ -110,6 +124,53 @@ class TestWorkerCommunication:
 
         worker.stop()
 
+    @pytest.mark.unit
+    def test_get_response_nowait_raises_when_empty(self):
+        """The non-waiting getter returns queued responses, then raises Empty."""
+        worker = MeasurementWorker()
+        worker._send_response(MessageType.LOG, LogMessage("queued", "info"))
+
+        assert worker.get_response_nowait().data.message == "queued"
+        with pytest.raises(queue.Empty):
+            worker.get_response_nowait()
+
+    @pytest.mark.unit
+    def test_idle_wait_backs_off_and_resets_on_command(self):
+        """Idle waits double up to the cap, then drop back after a command."""
+        worker = MeasurementWorker()
+        script = [None] * 6 + [MessageType.SET_DEBUG_SCPI, None, MessageType.SHUTDOWN]
+        waits: list[float] = []
+
+        def fake_get(timeout: float) -> Message:
+            waits.append(timeout)
+            msg_type = script.pop(0)
+            if msg_type is None:
+                raise queue.Empty
+            return Message(type=msg_type, data=False)
+
+        worker._command_queue = cast(Any, MagicMock(get=fake_get))
+        worker._running = True
+        worker._worker_loop()
+
+        assert waits == [0.1, 0.2, 0.4, 0.8, 1.0, 1.0, 1.0, 0.1, 0.2]
+
+    @pytest.mark.unit
+    def test_on_response_runs_after_each_queued_response(self):
+        """The start callback fires once per response, after it is queued."""
+        worker = MeasurementWorker()
+        queued_sizes: list[int] = []
+        worker.start(
+            on_response=lambda: queued_sizes.append(worker._response_queue.qsize())
+        )
+        try:
+            worker._send_response(MessageType.LOG, LogMessage("first", "info"))
+            worker._send_response(MessageType.LOG, LogMessage("second", "info"))
+
+            assert queued_sizes == [1, 2]
+            assert worker.get_response(timeout=0).data.message == "first"
+        finally:
+            worker.stop()
+
     @pytest.mark.integration
     def test_response_received(self):
         """Test that worker sends responses."""
@@ -274,6 +335,31 @@ class TestWorkerMeasurement:
         assert "Measurement failed: readout failed" == error_message.error
         assert worker._measuring is False
 
+    @pytest.mark.unit
+    def test_measure_reads_sparameters_in_one_batch(self, vna_config):
+        """The measurement job reads all traces with a single batched call."""
+        freqs = np.array([1.0e6, 2.0e6])
+        sparams = {
+            name: (np.zeros(2), np.zeros(2)) for name in ("S11", "S21", "S12", "S22")
+        }
+        worker = MeasurementWorker()
+        worker._vna = MagicMock()
+        worker._vna.is_connected.return_value = True
+        worker._vna.save_trigger_state.return_value = ("INT", True)
+        worker._vna.get_frequency_axis.return_value = freqs
+        worker._vna.get_all_sparameters.return_value = sparams
+
+        worker._handle_measure(vna_config)
+
+        worker._vna.get_all_sparameters.assert_called_once_with()
+        worker._vna.get_sparam_data.assert_not_called()
+        message = consume_worker_messages_until(
+            worker, MessageType.MEASUREMENT_COMPLETE, timeout=0.01
+        )
+        assert message is not None
+        assert message.data.frequencies is freqs
+        assert message.data.sparams is sparams
+
     @pytest.mark.unit
     def test_worker_sets_agg_backend_before_pyplot_import(self):
         """worker.py should select the Agg backend before importing pyplot."""
@@ -675,6 +761,51 @@ class TestWorkerToolsRendering:
         assert "coeffs" in result["tool_result"]["extra"]
         assert result["render_cache_key"] == ("tools", "state")
 
+    @pytest.mark.unit
+    def test_results_plot_job_renders_ndarray_payload_in_memory(self) -> None:
+        """The Results plot job takes arrays as-is and returns an RGBA image."""
+        worker = MeasurementWorker()
+        freqs = np.linspace(1e6, 1e9, 51)
+        worker.send_command(
+            MessageType.EXPORT,
+            {
+                "job_id": 3,
+                "operation": "Results plot render",
+                "kind": "Results plot",
+                "export_kind": "results_plot",
+                "freqs": freqs,
+                "sparams": {"S11": [np.full(51, -20.0), np.zeros(51)]},
+                "plot_params": ["S11"],
+                "plot_type": "magnitude",
+                "output_path": None,
+                "dpi": 100,
+                "pixel_width": 320,
+                "pixel_height": 180,
+                "colors": {
+                    "fg": "#ffffff",
+                    "grid": "#888888",
+                    "bg": "#000000",
+                    "traces": {"S11": "#ff0000"},
+                    "default_trace": "#ffffff",
+                },
+                "y_min": None,
+                "y_max": None,
+                "plot_data": None,
+            },
+        )
+        queued = worker._command_queue.get_nowait()
+
+        worker._handle_background_job(queued.type, queued.data)
+
+        final = None
+        while not worker._response_queue.empty():
+            final = worker._response_queue.get_nowait()
+        assert final is not None
+        result = final.data.result
+        assert result["path"] is None
+        assert isinstance(result["image"], Image.Image)
+        assert result["image"].size == (320, 180)
+
     @pytest.mark.unit
     def test_save_back_rewrites_existing_tina_blocks_without_duplication(
         self, tmp_path: Path
@@ -116,6 +116,44 @@ class TestBasicLogging:
         assert len(rx_entries) == 1
         assert "20 values" in rx_entries[0]
 
+    def test_query_binary_logs_summary_when_driver_supports_it(self):
+        """Drivers with a binary block primitive get it wrapped as well."""
+        log_calls: list[tuple[str, str]] = []
+        stub = _StubDriver()
+        stub._query_binary_values = lambda command: [float(i) for i in range(20)]
+        LoggingVNAWrapper(
+            stub,
+            lambda msg, level: log_calls.append((msg, level)),
+        )
+
+        stub._query_binary_values("CALC1:DATA:SDAT?")
+
+        assert ("CALC1:DATA:SDAT?", "tx") in log_calls
+        rx_entries = _rx(log_calls)
+        assert len(rx_entries) == 1
+        assert "20 values" in rx_entries[0]
+
+    def test_driver_without_binary_primitive_is_left_alone(self):
+        """Wrapping adds no binary primitive and still logs the other three."""
+        stub, wrapper, log_calls = _make_wrapper()
+
+        assert not hasattr(stub, "_query_binary_values")
+        assert not hasattr(wrapper, "_query_binary_values")
+
+        stub._send_command("INIT")
+        stub._query("*IDN?")
+        stub._query_ascii_values("CALC:DATA?")
+
+        assert stub.commands_sent == ["INIT"]
+        assert stub.queries_made == ["*IDN?"]
+        assert stub.ascii_queries_made == ["CALC:DATA?"]
+        assert [msg for msg, level in log_calls if level == "tx"] == [
+            "INIT",
+            "*IDN?",
+            "CALC:DATA?",
+        ]
+        assert len(_rx(log_calls)) == 2
+
     def test_long_response_truncated(self, monkeypatch):
         """Responses longer than SCPI_RESPONSE_TRUNCATE_LENGTH are summarised."""
         import src.tina.utils.logging_wrapper as lw_mod
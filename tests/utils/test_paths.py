@@ -45,6 +45,15 @@ class TestTruncatePathIntelligently:
         assert "file.txt" in result
         assert len(result) <= 23  # 25 - 2 for emoji
 
+    def test_drop_keeps_longest_fitting_suffix(self):
+        """Dropping stops at the first folder whose suffix fits exactly."""
+        path = "/aaaa/bbbb/cccc/dddd/file.txt"
+        # ".../cccc/dddd/file.txt" is 22 chars; one more folder would not fit
+        assert truncate_path_intelligently(path, max_width=24) == (
+            ".../cccc/dddd/file.txt"
+        )
+        assert truncate_path_intelligently(path, max_width=23) == (".../dddd/file.txt")
+
     def test_drop_multiple_directories(self):
         """Test dropping multiple directories progressively."""
         path = "/a/b/c/d/e/f/g/file.txt"
@@ -0,0 +1,261 @@
+"""Unit tests for tina.utils.plotting helpers."""
+
+from __future__ import annotations
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+from tina.utils import plotting
+from tina.utils.plotting import (
+    _reused_figure,
+    create_matplotlib_plot,
+    get_plot_temp_dir,
+)
+
+
+class TestGetPlotTempDir:
+    @pytest.mark.unit
+    def test_directory_is_created_once_under_temp_dir(self, tmp_path, monkeypatch):
+        """The plot dir lives in the platform temp dir and is made only once."""
+        monkeypatch.setattr(plotting.tempfile, "gettempdir", lambda: str(tmp_path))
+        get_plot_temp_dir.cache_clear()
+        try:
+            first = get_plot_temp_dir()
+            first.rmdir()
+            second = get_plot_temp_dir()
+        finally:
+            get_plot_temp_dir.cache_clear()
+
+        assert first == tmp_path / "tui-vna-plots"
+        assert second is first
+        assert not second.exists()
+
+
+class TestCreateMatplotlibPlot:
+    @pytest.mark.unit
+    def test_renders_without_registering_pyplot_figures(self, tmp_path):
+        """The plot is written to disk without going through pyplot."""
+        freqs = np.linspace(10e6, 1000e6, 51)
+        sparams = {"S11": (np.full(51, -20.0), np.linspace(-90.0, 90.0, 51))}
+        output = tmp_path / "mag.png"
+        open_before = plt.get_fignums()
+
+        create_matplotlib_plot(
+            freqs,
+            sparams,
+            ["S11"],
+            "magnitude",
+            output,
+            dpi=72,
+            font_family="monospace",
+            font_size=10.0,
+        )
+
+        assert output.stat().st_size > 0
+        assert plt.get_fignums() == open_before
+
+    @pytest.mark.unit
+    def test_output_has_requested_pixel_size(self, tmp_path):
+        """Without a tight bounding box the PNG keeps the requested size."""
+        freqs = np.linspace(10e6, 1000e6, 51)
+        sparams = {"S11": (np.full(51, -20.0), np.zeros(51))}
+        output = tmp_path / "sized.png"
+
+        create_matplotlib_plot(
+            freqs,
+            sparams,
+            ["S11"],
+            "magnitude",
+            output,
+            dpi=100,
+            pixel_width=640,
+            pixel_height=360,
+            font_family="monospace",
+            font_size=10.0,
+        )
+
+        with Image.open(output) as image:
+            assert image.size == (640, 360)
+
+    @pytest.mark.unit
+    def test_auto_range_sees_every_trace(self, monkeypatch):
+        """The auto-range receives all plotted traces back to back."""
+        freqs = np.linspace(10e6, 1000e6, 5)
+        sparams = {
+            "S11": (np.arange(5.0), np.zeros(5)),
+            "S21": (np.arange(5.0) + 10.0, np.zeros(5)),
+        }
+        seen = []
+
+        def fake_range(data, **kwargs):
+            seen.append(np.array(data))
+            return -1.0, 1.0
+
+        monkeypatch.setattr(
+            plotting, "calculate_plot_range_with_outlier_filtering", fake_range
+        )
+
+        create_matplotlib_plot(
+            freqs,
+            sparams,
+            ["S11", "S21"],
+            "magnitude",
+            None,
+            dpi=72,
+            font_family="monospace",
+            font_size=10.0,
+        )
+
+        assert len(seen) == 1
+        np.testing.assert_array_equal(
+            seen[0], np.concatenate([sparams["S11"][0], sparams["S21"][0]])
+        )
+
+    @pytest.mark.unit
+    def test_explicit_limits_skip_auto_range(self, monkeypatch):
+        """Both Y limits given means no outlier filtering pass at all."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("auto-range should not run")
+
+        monkeypatch.setattr(
+            plotting, "calculate_plot_range_with_outlier_filtering", fail
+        )
+        freqs = np.linspace(10e6, 1000e6, 5)
+
+        create_matplotlib_plot(
+            freqs,
+            {"S11": (np.arange(5.0), np.zeros(5))},
+            ["S11"],
+            "magnitude",
+            None,
+            dpi=72,
+            y_min=-5.0,
+            y_max=5.0,
+            font_family="monospace",
+            font_size=10.0,
+        )
+
+    @pytest.mark.unit
+    def test_in_memory_render_matches_png(self, tmp_path):
+        """Without an output path the RGBA image holds the PNG's pixels."""
+        freqs = np.linspace(10e6, 1000e6, 51)
+        sparams = {"S11": (np.linspace(-30.0, -1.0, 51), np.zeros(51))}
+        output = tmp_path / "ref.png"
+        kwargs = {
+            "dpi": 100,
+            "pixel_width": 640,
+            "pixel_height": 360,
+            "transparent": True,
+            "font_family": "monospace",
+            "font_size": 10.0,
+        }
+        plotting._figure_pool.clear()
+        create_matplotlib_plot(freqs, sparams, ["S11"], "magnitude", output, **kwargs)
+        plotting._figure_pool.clear()
+
+        image = create_matplotlib_plot(
+            freqs, sparams, ["S11"], "magnitude", None, **kwargs
+        )
+
+        assert image is not None
+        assert image.mode == "RGBA"
+        assert image.size == (640, 360)
+        with Image.open(output) as reference:
+            assert np.array_equal(np.asarray(image), np.asarray(reference))
+        assert list(tmp_path.iterdir()) == [output]
+
+
+class TestFigureReuse:
+    @pytest.fixture(autouse=True)
+    def empty_pool(self):
+        """Start and finish each test with no pooled figures."""
+        plotting._figure_pool.clear()
+        yield
+        plotting._figure_pool.clear()
+
+    @pytest.mark.unit
+    def test_repeat_render_reuses_figure_and_matches_output(self, tmp_path):
+        """A same-size render reuses the pooled figure without stale artists."""
+        freqs = np.linspace(10e6, 1000e6, 51)
+        sparams = {
+            "S11": (np.full(51, -20.0), np.linspace(-90.0, 90.0, 51)),
+            "S21": (np.linspace(-3.0, -10.0, 51), np.zeros(51)),
+        }
+        renders = [
+            (["S11"], "magnitude", False),
+            (["S11", "S21"], "phase", True),
+            (["S11"], "magnitude", False),
+        ]
+        figures = []
+        for index, (params, plot_type, transparent) in enumerate(renders):
+            create_matplotlib_plot(
+                freqs,
+                sparams,
+                params,
+                plot_type,
+                tmp_path / f"{index}.png",
+                dpi=72,
+                transparent=transparent,
+                font_family="monospace",
+                font_size=10.0,
+            )
+            figures.append(plotting._figure_pool[(10, 5, "plot")][0])
+
+        assert figures[0] is figures[1] is figures[2]
+        assert (tmp_path / "0.png").read_bytes() == (tmp_path / "2.png").read_bytes()
+
+    @pytest.mark.unit
+    def test_failed_render_does_not_return_figure(self):
+        """A figure is only pooled again when the render completed."""
+        with pytest.raises(RuntimeError):
+            with _reused_figure(4, 3) as (_fig, ax):
+                ax.plot([0, 1], [0, 1])
+                raise RuntimeError("render failed")
+
+        assert (4, 3, "plot") not in plotting._figure_pool
+
+    @pytest.mark.unit
+    def test_pool_evicts_least_recently_used_size(self):
+        """Only the most recently used figure sizes stay pooled."""
+        sizes = [(float(width), 3.0) for width in range(1, 7)]
+        for size in sizes:
+            with _reused_figure(*size):
+                pass
+
+        assert list(plotting._figure_pool) == [
+            (*size, "plot") for size in sizes[-plotting._FIGURE_POOL_SIZE :]
+        ]
+
+
+class TestRenderSerialization:
+    @pytest.mark.unit
+    def test_render_holds_lock_and_restores_rcparams(self, tmp_path, monkeypatch):
+        """Renders run one at a time and leave the global font family intact."""
+        family_before = list(plt.rcParams["font.family"])
+        seen = []
+
+        def checking_unwrap(phase):
+            seen.append(plotting._render_lock.locked())
+            return phase
+
+        monkeypatch.setattr(plotting, "unwrap_phase", checking_unwrap)
+        freqs = np.linspace(10e6, 1000e6, 21)
+        sparams = {"S11": (np.full(21, -20.0), np.zeros(21))}
+
+        create_matplotlib_plot(
+            freqs,
+            sparams,
+            ["S11"],
+            "phase",
+            tmp_path / "phase.png",
+            dpi=72,
+            font_family="serif",
+            font_size=10.0,
+        )
+
+        assert seen == [True]
+        assert not plotting._render_lock.locked()
+        assert list(plt.rcParams["font.family"]) == family_before
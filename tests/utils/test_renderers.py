@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import matplotlib.pyplot as plt
 import numpy as np
 import pytest
+import skrf as rf
+from PIL import Image
 
 from tina.gui.plotting.renderers import create_smith_chart
+from tina.utils import plotting
 
 
 @pytest.fixture
@@ -37,6 +41,71 @@ class TestCreateSmithChart:
         assert output.exists()
         assert output.stat().st_size > 0
 
+    @pytest.mark.unit
+    def test_render_does_not_register_pyplot_figures(self, simple_sparams, tmp_path):
+        """create_smith_chart draws on its own Agg canvas, not through pyplot."""
+        freqs, sparams = simple_sparams
+        open_before = plt.get_fignums()
+
+        create_smith_chart(freqs, sparams, ["S11"], tmp_path / "smith.png", dpi=72)
+
+        assert plt.get_fignums() == open_before
+
+    @pytest.mark.unit
+    def test_traces_are_drawn_without_building_networks(
+        self, simple_sparams, tmp_path, monkeypatch
+    ):
+        """Traces go straight onto the Smith grid without scikit-rf Networks."""
+        freqs, sparams = simple_sparams
+
+        def fail(*args, **kwargs):
+            raise AssertionError("rf.Network should not be constructed")
+
+        monkeypatch.setattr(rf, "Network", fail)
+
+        create_smith_chart(freqs, sparams, ["S11"], tmp_path / "smith.png", dpi=72)
+
+        assert (tmp_path / "smith.png").stat().st_size > 0
+
+    @pytest.mark.unit
+    def test_output_is_square_of_smaller_pixel_side(self, simple_sparams, tmp_path):
+        """The chart is saved at exactly the square size it was laid out for."""
+        freqs, sparams = simple_sparams
+        output = tmp_path / "smith_sized.png"
+
+        create_smith_chart(
+            freqs,
+            sparams,
+            ["S11"],
+            output,
+            dpi=100,
+            pixel_width=640,
+            pixel_height=480,
+        )
+
+        with Image.open(output) as image:
+            assert image.size == (480, 480)
+
+    @pytest.mark.unit
+    def test_in_memory_render_returns_square_rgba_image(self, simple_sparams):
+        """Without an output path the chart comes back as an RGBA image."""
+        freqs, sparams = simple_sparams
+
+        image = create_smith_chart(
+            freqs,
+            sparams,
+            ["S11"],
+            None,
+            dpi=100,
+            pixel_width=640,
+            pixel_height=480,
+            transparent=True,
+        )
+
+        assert image is not None
+        assert image.mode == "RGBA"
+        assert image.size == (480, 480)
+
     @pytest.mark.unit
     def test_empty_freqs_raises_value_error(self, tmp_path):
         """create_smith_chart raises ValueError when freqs array is empty."""
@@ -77,3 +146,68 @@ class TestCreateSmithChart:
 
         assert output.exists()
         assert output.stat().st_size > 0
+
+    @pytest.mark.unit
+    def test_pooled_figure_keeps_smith_grid(self, simple_sparams, monkeypatch):
+        """Repeat renders reuse the pooled grid and match a fresh render."""
+        freqs, sparams = simple_sparams
+        n = len(freqs)
+        sparams = {**sparams, "S22": (np.full(n, -6.0), np.linspace(0.0, 180.0, n))}
+        kwargs = {"dpi": 100, "pixel_width": 320, "pixel_height": 320}
+        grid_draws = []
+        smith = rf.plotting.smith
+
+        def counting_smith(*args, **kw):
+            grid_draws.append(kw)
+            return smith(*args, **kw)
+
+        monkeypatch.setattr(rf.plotting, "smith", counting_smith)
+        plotting._figure_pool.clear()
+        try:
+            fresh = create_smith_chart(freqs, sparams, ["S11"], None, **kwargs)
+            create_smith_chart(
+                freqs, sparams, ["S11", "S22"], None, font_family="serif", **kwargs
+            )
+            reused = create_smith_chart(freqs, sparams, ["S11"], None, **kwargs)
+        finally:
+            plotting._figure_pool.clear()
+
+        assert len(grid_draws) == 1
+        assert np.array_equal(np.asarray(reused), np.asarray(fresh))
+
+    @pytest.mark.unit
+    def test_pooled_grid_labels_follow_font_changes(self, simple_sparams):
+        """Grid labels on a pooled axes take the font of the current render."""
+        from tina.gui.plotting import renderers
+
+        freqs, sparams = simple_sparams
+        kwargs = {"dpi": 100, "pixel_width": 320, "pixel_height": 320}
+        plotting._figure_pool.clear()
+        try:
+            create_smith_chart(
+                freqs,
+                sparams,
+                ["S11"],
+                None,
+                font_family="serif",
+                font_size=20.0,
+                **kwargs,
+            )
+            create_smith_chart(
+                freqs,
+                sparams,
+                ["S11"],
+                None,
+                font_family="monospace",
+                font_size=10.0,
+                **kwargs,
+            )
+            _fig, ax = plotting._figure_pool[(3.2, 3.2, "smith")]
+            grid = renderers._smith_grids[ax]
+        finally:
+            plotting._figure_pool.clear()
+
+        assert grid.texts
+        for text in grid.texts:
+            assert text.get_fontfamily() == ["monospace"]
+            assert text.get_fontsize() == pytest.approx(7.0)
@@ -5,7 +5,11 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from tina.utils.signal import calculate_plot_range_with_outlier_filtering
+from tina.utils.signal import (
+    calculate_plot_range_with_outlier_filtering,
+    db_deg_to_complex,
+    unwrap_phase,
+)
 
 
 def test_calculate_plot_range_handles_non_finite_inputs() -> None:
@@ -68,3 +72,74 @@ def test_calculate_plot_range_empty_data_uses_fallback() -> None:
     result = calculate_plot_range_with_outlier_filtering(data)
 
     assert result == (0.0, 1.0)
+
+
+def test_unwrap_phase_removes_360_degree_jumps() -> None:
+    """Wrapped degrees unwrap to the same result as the radian round trip."""
+    phase = np.array([170.0, -170.0, -150.0, 170.0, -179.0])
+
+    result = unwrap_phase(phase)
+
+    np.testing.assert_allclose(result, [170.0, 190.0, 210.0, 170.0, 181.0])
+    np.testing.assert_allclose(result, np.rad2deg(np.unwrap(np.deg2rad(phase))))
+
+
+@pytest.mark.parametrize(
+    "phase",
+    [np.linspace(-170.0, 170.0, 201), np.array([42.0]), np.array([10.0, 350.0])],
+)
+def test_unwrap_phase_never_aliases_its_input(phase: np.ndarray) -> None:
+    """Editing the result in place must leave the caller's trace untouched."""
+    original = phase.copy()
+
+    result = unwrap_phase(phase)
+    result += 1.0
+
+    assert not np.shares_memory(result, phase)
+    np.testing.assert_array_equal(phase, original)
+    np.testing.assert_array_equal(result - 1.0, np.unwrap(original, period=360.0))
+
+
+@pytest.mark.parametrize("phase", [[], [42.0]])
+def test_unwrap_phase_handles_short_input(phase: list[float]) -> None:
+    """Empty and single-point traces have nothing to unwrap."""
+    result = unwrap_phase(np.array(phase))
+
+    np.testing.assert_array_equal(result, phase)
+
+
+def test_unwrap_phase_unwraps_when_nan_present() -> None:
+    """NaNs skip the shortcut and match np.unwrap's handling."""
+    phase = np.array([0.0, np.nan, 10.0])
+
+    np.testing.assert_array_equal(unwrap_phase(phase), np.unwrap(phase, period=360.0))
+
+
+def test_db_deg_to_complex_matches_polar_form() -> None:
+    """The in-place conversion equals 10 ** (dB / 20) * exp(j * phase)."""
+    mag_db = np.linspace(-60.0, 6.0, 101)
+    phase_deg = np.linspace(-180.0, 180.0, 101)
+
+    result = db_deg_to_complex(mag_db, phase_deg)
+
+    assert result.dtype == np.complex128
+    np.testing.assert_allclose(
+        result,
+        10 ** (mag_db / 20) * np.exp(1j * np.deg2rad(phase_deg)),
+        rtol=1e-12,
+        atol=1e-15,
+    )
+
+
+def test_calculate_plot_range_matches_percentiles_and_keeps_input() -> None:
+    """Bounds equal the 1st/99th percentiles and the caller's array is untouched."""
+    data = np.random.default_rng(0).normal(size=601)
+    original = data.copy()
+
+    min_val, max_val = calculate_plot_range_with_outlier_filtering(
+        data, outlier_percentile=1.0, safety_margin=0.0
+    )
+
+    assert min_val == np.percentile(original, 1.0)
+    assert max_val == np.percentile(original, 99.0)
+    np.testing.assert_array_equal(data, original)
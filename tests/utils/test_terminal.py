@@ -0,0 +1,134 @@
+"""Unit tests for tina.utils.terminal font detection."""
+
+from __future__ import annotations
+
+import plistlib
+
+import pytest
+
+from tina.utils import plotting, terminal
+from tina.utils.terminal import get_terminal_font
+
+
+@pytest.fixture
+def fresh_font_cache():
+    """Clear the terminal font cache around a test."""
+    get_terminal_font.cache_clear()
+    yield
+    get_terminal_font.cache_clear()
+
+
+class TestGetTerminalFont:
+    @pytest.mark.unit
+    def test_detection_runs_once_per_process(
+        self, fresh_font_cache, tmp_path, monkeypatch
+    ):
+        """Later calls reuse the first result instead of re-reading config."""
+        cfg = tmp_path / ".config" / "kitty" / "kitty.conf"
+        cfg.parent.mkdir(parents=True)
+        cfg.write_text("font_size 12.5\n", encoding="utf-8")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("TERM_PROGRAM", "kitty")
+
+        first = get_terminal_font()
+        cfg.write_text("font_size 20\n", encoding="utf-8")
+
+        assert first == ("monospace", 12.5)
+        assert get_terminal_font() is first
+
+        get_terminal_font.cache_clear()
+        assert get_terminal_font() == ("monospace", 20.0)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("term", "relpath", "config", "expected_size"),
+        [
+            (
+                "alacritty",
+                ".config/alacritty/alacritty.toml",
+                "[font]\nbuiltin_box_drawing = true\nsize = 11.5\n\n"
+                '[font.normal]\nfamily = "No Such Font"\n',
+                11.5,
+            ),
+            (
+                "alacritty",
+                ".config/alacritty/alacritty.yml",
+                'font:\n  normal:\n    family: "No Such Font"\n  size: 9.0\n',
+                9.0,
+            ),
+            (
+                "WezTerm",
+                ".wezterm.lua",
+                'config.font = wezterm.font("No Such Font")\n'
+                "config.font_size = 14.0\n",
+                14.0,
+            ),
+            (
+                "ghostty",
+                ".config/ghostty/config",
+                "# font-size = 99\nfont-family =\nfont-family-bold = Bold\n"
+                '  font-size = "15.5"  \nfont-size = 18\n',
+                15.5,
+            ),
+            (
+                "kitty",
+                ".config/kitty/kitty.conf",
+                "# font_size 99\nfont_family\r\n  font_size   10.5\r\nfont_size 20\r\n",
+                10.5,
+            ),
+        ],
+    )
+    def test_reads_font_size_from_config(
+        self,
+        fresh_font_cache,
+        tmp_path,
+        monkeypatch,
+        term,
+        relpath,
+        config,
+        expected_size,
+    ):
+        """Each supported terminal config yields its first font size setting."""
+        cfg = tmp_path / relpath
+        cfg.parent.mkdir(parents=True, exist_ok=True)
+        cfg.write_text(config, encoding="utf-8")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("TERM_PROGRAM", term)
+
+        _family, size = get_terminal_font()
+
+        assert size == expected_size
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "prefs",
+        [
+            {"Normal Font": "NoSuchFont-Regular 13"},
+            {
+                "Default Bookmark Guid": "b",
+                "New Bookmarks": [
+                    {"Guid": "a", "Normal Font": "Other 9"},
+                    {"Guid": "b", "Normal Font": "NoSuchFont-Regular 13"},
+                ],
+            },
+        ],
+    )
+    def test_reads_iterm2_font_from_plist(
+        self, fresh_font_cache, tmp_path, monkeypatch, prefs
+    ):
+        """iTerm2's font comes from its binary plist, top level or default profile."""
+        plist = tmp_path / "Library" / "Preferences" / "com.googlecode.iterm2.plist"
+        plist.parent.mkdir(parents=True)
+        plist.write_bytes(plistlib.dumps(prefs, fmt=plistlib.FMT_BINARY))
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("TERM_PROGRAM", "iTerm.app")
+        monkeypatch.setattr(terminal.platform, "system", lambda: "Darwin")
+
+        assert terminal._read_iterm2_normal_font(tmp_path) == "NoSuchFont-Regular 13"
+        assert get_terminal_font()[1] == 13.0
+
+
+@pytest.mark.unit
+def test_plotting_reuses_terminal_font_detection():
+    """tina.utils.plotting exposes the one cached detector from terminal."""
+    assert plotting.get_terminal_font is terminal.get_terminal_font